@@ -44,6 +44,11 @@ rarity_meta = {
     "gigantamax": {"color": 10685254, "emoji": VN_ALLSTARS_EMOJIS.vna_gmax},
     "shiny gigantamax": {"emoji": VN_ALLSTARS_EMOJIS.vna_shinygmax},
 }
+# Reverse index of rarity_meta colors; the first rarity listed for a color wins
+rarity_by_color = {}
+for _rarity_name, _rarity_data in rarity_meta.items():
+    if "color" in _rarity_data:
+        rarity_by_color.setdefault(_rarity_data["color"], _rarity_name)
 common_icon_url = (
     "https://cdn.discordapp.com/emojis/834533715295600690.webp?size=96&quality=lossless"
 )
@@ -1409,20 +1414,17 @@ def get_dex_number_by_name(name: str) -> int | None:
     Example: get_dex_number_by_name("flutter-mane") -> 987
     Returns None if not found.
     """
-    from utils.db.market_value_db import fetch_dex_number_cache
+    from utils.cache.pokemon_catalog import get_pokemon_catalog
     from utils.functions.pokemon_func import format_names_for_market_value_lookup
 
-    for num, poke_name in dex.items():
-        if poke_name == name:
-            return num
-
-    # Fallback: try formatted name
-    formatted_name = format_names_for_market_value_lookup(name)
-    dex_number = fetch_dex_number_cache(formatted_name)
+    catalog = get_pokemon_catalog()
+    dex_number = catalog.dex_for_name(name)
     if dex_number is not None:
         return dex_number
 
-    return None
+    # Fallback: try formatted name
+    formatted_name = format_names_for_market_value_lookup(name)
+    return catalog.market_dex_for_name(formatted_name)
 
 
 def get_rarity_by_color(color_value):
@@ -1441,10 +1443,7 @@ def get_rarity_by_color(color_value):
         >>> get_rarity_by_color(16550924)
         'rare'
     """
-    for rarity_name, rarity_data in rarity_meta.items():
-        if rarity_data["color"] == color_value:
-            return rarity_name
-    return "unknown"
+    return rarity_by_color.get(color_value, "unknown")
 
 
 def get_color_by_rarity(rarity_name):
@@ -0,0 +1,322 @@
+"""
+🛒 Offline market feed replay benchmark
+
+Replays recorded PokeMeow market webhook embeds through the real on_message
+listener (MessageCreateListener and its dispatcher) against a fake bot, guild
+and channel, an in-memory bot.pg_pool and a counting webhook sender. Both
+write-behind buffers are flushed inside the timed region. Nothing touches
+Discord or Postgres.
+
+Usage (from the repo root):
+    python -m benchmarks.market_feed_replay
+    python -m benchmarks.market_feed_replay --iterations 500 --alerts 5000
+    python -m benchmarks.market_feed_replay --save bench.json
+    python -m benchmarks.market_feed_replay --baseline bench.json --max-regression 0.10
+
+Corpus format: a JSON list of {"webhook_id": int, "embeds": [embed dict, ...]},
+with embed dicts as produced by discord.Embed.to_dict().
+"""
+
+import argparse
+import asyncio
+import contextlib
+import datetime
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+import discord
+
+DEFAULT_CORPUS = os.path.join(
+    os.path.dirname(__file__), "fixtures", "market_feed_corpus.json"
+)
+
+
+# 🟣────────────────────────────────────────────
+#   🧸 Fakes
+# 🟣────────────────────────────────────────────
+class FakeUser:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.avatar = None
+        self.bot = True
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+        self.name = f"channel-{channel_id}"
+
+
+class FakeIcon:
+    url = "https://cdn.discordapp.com/icons/fake.png"
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.name = "Fake VNA"
+        self.icon = FakeIcon()
+        self._channels: dict[int, FakeChannel] = {}
+
+    def get_channel(self, channel_id: int):
+        return self._channels.setdefault(channel_id, FakeChannel(channel_id))
+
+
+class FakeMessage:
+    def __init__(self, message_id, webhook_id, embeds, guild, channel):
+        self.id = message_id
+        self.webhook_id = webhook_id
+        self.embeds = embeds
+        self.guild = guild
+        self.channel = channel
+        self.author = FakeUser(webhook_id)
+        self.content = ""
+        self.created_at = datetime.datetime.now(datetime.timezone.utc)
+
+
+class FakeConnection:
+    def __init__(self, pool: "FakePool"):
+        self.pool = pool
+
+    async def _call(self, query, *args):
+        self.pool.calls += 1
+        if self.pool.latency:
+            await asyncio.sleep(self.pool.latency)
+
+    async def execute(self, query, *args, **kwargs):
+        await self._call(query, *args)
+        return "INSERT 0 1"
+
+    async def fetch(self, query, *args, **kwargs):
+        await self._call(query, *args)
+        return []
+
+    async def fetchrow(self, query, *args, **kwargs):
+        await self._call(query, *args)
+        return None
+
+    async def fetchval(self, query, *args, **kwargs):
+        await self._call(query, *args)
+        return None
+
+
+class FakeAcquire:
+    def __init__(self, pool: "FakePool"):
+        self.pool = pool
+
+    async def __aenter__(self):
+        return FakeConnection(self.pool)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakePool:
+    """In-memory stand-in for SafePool that only counts round trips."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def acquire(self):
+        return FakeAcquire(self)
+
+
+class FakeBot:
+    def __init__(self, db_latency: float):
+        self.user = FakeUser(1)
+        self.pg_pool = FakePool(db_latency)
+        self.loop = asyncio.get_running_loop()
+
+    def get_channel(self, channel_id: int):
+        return None
+
+
+# 🟣────────────────────────────────────────────
+#   🧪 Benchmark
+# 🟣────────────────────────────────────────────
+def load_corpus(path: str) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def seed_alerts(corpus: list[dict], count: int, rng: random.Random):
+    from utils.cache.market_alert_cache import insert_alert_into_cache
+
+    names = [
+        embed["author"]["name"].rsplit(" #", 1)[0]
+        for entry in corpus
+        for embed in entry["embeds"]
+    ]
+    for i in range(count):
+        insert_alert_into_cache(
+            user_id=10_000 + i,
+            user_name=f"user{i}",
+            pokemon=rng.choice(names),
+            dex="0",
+            max_price=rng.randint(1_000, 5_000_000),
+            channel_id=20_000 + rng.randint(0, 49),
+            role_id=30_000 + i if i % 2 else None,
+        )
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_benchmark(args) -> dict:
+    from Constants.vn_allstars_constants import (
+        VN_ALLSTARS_TEXT_CHANNELS,
+        VNA_SERVER_ID,
+    )
+    from cogs.events.on_message_create import MessageCreateListener
+    from utils.db.market_price_history_db import flush_price_history_buffer
+    from utils.db.market_value_db import flush_market_value_buffer
+    from utils.functions import webhook_func
+    from utils.logs.pretty_log import flush_logs
+
+    rng = random.Random(args.seed)
+    corpus = load_corpus(args.corpus)
+    bot = FakeBot(args.db_latency_ms / 1000)
+    guild = FakeGuild(VNA_SERVER_ID)
+    listener = MessageCreateListener(bot)
+    feed_channel = FakeChannel(VN_ALLSTARS_TEXT_CHANNELS.c_u_r_s_feed)
+
+    webhook_sends = 0
+
+    async def counting_send(bot, channel, content=None, embed=None):
+        nonlocal webhook_sends
+        webhook_sends += 1
+        if args.send_latency_ms:
+            await asyncio.sleep(args.send_latency_ms / 1000)
+
+    # Every snipe, alert and log send funnels through here
+    webhook_func._send_webhook = counting_send
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        seed_alerts(corpus, args.alerts, rng)
+
+    latencies = []
+    listings = 0
+    message_id = 1
+    out = sys.stdout if args.show_logs else io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        for iteration in range(args.iterations):
+            for entry in corpus:
+                embeds = []
+                for raw in entry["embeds"]:
+                    embed = discord.Embed.from_dict(raw)
+                    # Unique listing IDs per iteration so dedup doesn't short-circuit
+                    for index, field in enumerate(embed.fields):
+                        if field.name == "ID":
+                            embed.set_field_at(
+                                index,
+                                name="ID",
+                                value=f"{field.value}-{iteration}",
+                                inline=field.inline,
+                            )
+                    embeds.append(embed)
+                message = FakeMessage(
+                    message_id, entry["webhook_id"], embeds, guild, feed_channel
+                )
+                message_id += 1
+
+                t0 = time.perf_counter()
+                await listener.on_message(message)
+                # Handlers run as dispatcher tasks; wait for them to finish
+                await listener.dispatcher.drain()
+                latencies.append(time.perf_counter() - t0)
+                listings += len(embeds)
+        await flush_market_value_buffer(bot)
+        await flush_price_history_buffer(bot)
+        elapsed = time.perf_counter() - started
+        # Logs are written by a background thread; get them out before the report
+        flush_logs()
+
+    return {
+        "listings": listings,
+        "elapsed_s": elapsed,
+        "listings_per_s": listings / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "db_calls_per_listing": bot.pg_pool.calls / listings if listings else 0.0,
+        "webhook_sends_per_listing": webhook_sends / listings if listings else 0.0,
+        "alerts": args.alerts,
+        "iterations": args.iterations,
+    }
+
+
+def print_report(result: dict):
+    print("\n────────────────────────⋆⋅☆⋅⋆ ────────────────────────")
+    print(f"🛒 Listings replayed        {result['listings']:,}")
+    print(f"⚡ Listings / sec            {result['listings_per_s']:,.1f}")
+    print(f"⏱️  p50 / p99 per listing    {result['p50_ms']:.3f} ms / {result['p99_ms']:.3f} ms")
+    print(f"💰 DB calls / listing        {result['db_calls_per_listing']:.3f}")
+    print(f"🪝 Webhook sends / listing   {result['webhook_sends_per_listing']:.3f}")
+    print("────────────────────────⋆⋅☆⋅⋆ ────────────────────────\n")
+
+
+def check_regression(result: dict, baseline_path: str, max_regression: float) -> bool:
+    """Returns False when throughput or p99 regressed past max_regression."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    ok = True
+    if result["listings_per_s"] < baseline["listings_per_s"] * (1 - max_regression):
+        print(
+            f"❌ Throughput regressed: {result['listings_per_s']:,.1f}/s vs baseline {baseline['listings_per_s']:,.1f}/s"
+        )
+        ok = False
+    if result["p99_ms"] > baseline["p99_ms"] * (1 + max_regression):
+        print(
+            f"❌ p99 regressed: {result['p99_ms']:.3f} ms vs baseline {baseline['p99_ms']:.3f} ms"
+        )
+        ok = False
+    for key in ("db_calls_per_listing", "webhook_sends_per_listing"):
+        if result[key] > baseline[key] * (1 + max_regression):
+            print(f"❌ {key} regressed: {result[key]:.3f} vs baseline {baseline[key]:.3f}")
+            ok = False
+    if ok:
+        print("✅ Within regression budget of baseline")
+    return ok
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--alerts", type=int, default=1000)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    parser.add_argument("--send-latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--show-logs", action="store_true")
+    parser.add_argument("--save", help="Write the result JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a saved result JSON")
+    parser.add_argument("--max-regression", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run_benchmark(args))
+    print_report(result)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    if args.baseline and not check_regression(
+        result, args.baseline, args.max_regression
+    ):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
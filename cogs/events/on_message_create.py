@@ -7,6 +7,11 @@ from Constants.vn_allstars_constants import (
     VNA_SERVER_ID,
 )
 from utils.cache.cache_list import active_lottery_thread_ids
+from utils.essentials.message_dispatcher import (
+    MessageContext,
+    MessageDispatcher,
+    MessageRoute,
+)
 from utils.functions.donation_sticky_msg import check_and_send_sticky_msg
 from utils.listener_func.buy_lottery_ticket_listener import buy_lottery_ticket_listener
 from utils.listener_func.dex_listener import dex_listener
@@ -26,14 +31,17 @@ from utils.prefix_commands.snipe_ga import create_snipe_ga_prefix
 # ️────────────────────────────────────────────
 #     Market Feed Channel IDs Set
 # ️────────────────────────────────────────────
-MARKET_FEED_CHANNEL_IDS = {
-    VN_ALLSTARS_TEXT_CHANNELS.c_u_r_s_feed,
-    VN_ALLSTARS_TEXT_CHANNELS.golden_feed,
-    VN_ALLSTARS_TEXT_CHANNELS.shiny_feed,
-    VN_ALLSTARS_TEXT_CHANNELS.l_m_gmax_feed,
-}
+MARKET_FEED_CHANNEL_IDS = frozenset(
+    {
+        VN_ALLSTARS_TEXT_CHANNELS.c_u_r_s_feed,
+        VN_ALLSTARS_TEXT_CHANNELS.golden_feed,
+        VN_ALLSTARS_TEXT_CHANNELS.shiny_feed,
+        VN_ALLSTARS_TEXT_CHANNELS.l_m_gmax_feed,
+    }
+)
 
 CLAN_BANK_USER_NAMES = ["yki.on", "beaterxyz"]
+HANDLER_DRAIN_TIMEOUT_SECONDS = 10  # on cog unload
 
 
 def embed_has_field_name(embed, name_to_match: str) -> bool:
@@ -49,12 +57,106 @@ def embed_has_field_name(embed, name_to_match: str) -> bool:
     return False
 
 
+def is_clan_bank_give(ctx: MessageContext) -> bool:
+    content = ctx.content
+    return (
+        "gave" in content
+        and "PokeCoins" in content
+        and any(name in content for name in CLAN_BANK_USER_NAMES)
+    )
+
+
+def is_clan_treasury_donation(ctx: MessageContext) -> bool:
+    content = ctx.content
+    return "You successfully donated" in content and "VN Allstar" in content
+
+
+# 🐾────────────────────────────────────────────
+#        🗺️ Message Routes — register handlers here
+# 🐾────────────────────────────────────────────
+# Checked in this order; channel-scoped routes are only looked at for their
+# channels. See utils/essentials/message_dispatcher.py.
+MESSAGE_ROUTES = [
+    # 🩵 VNA Market Snipe
+    MessageRoute(
+        "market_feeds_listener",
+        market_feeds_listener,
+        channel_ids=MARKET_FEED_CHANNEL_IDS,
+        # The latency trace's receive stamp is taken in on_message, not in the task
+        pass_received_at=True,
+    ),
+    # 🩵 Snipe Giveaway Prefix Command
+    MessageRoute(
+        "create_snipe_ga_prefix",
+        create_snipe_ga_prefix,
+        predicate=lambda ctx: ctx.content.startswith("sg.c"),
+    ),
+    # 🩵 Giveaway Prefix Command
+    MessageRoute(
+        "create_ga_prefix",
+        create_ga_prefix,
+        predicate=lambda ctx: ctx.content.startswith("g.c"),
+    ),
+    # 🩵 DEX LISTENER
+    MessageRoute(
+        "dex_listener",
+        dex_listener,
+        predicate=lambda ctx: "Dex Number" in ctx.first_embed_field_names,
+        log_message="Detected dex command embed with 'Dex Number' field. Triggering dex listener.",
+    ),
+    # 🩵 Buy Ticket Listener
+    MessageRoute(
+        "buy_lottery_ticket_listener",
+        buy_lottery_ticket_listener,
+        predicate=lambda ctx: ctx.channel_id in active_lottery_thread_ids
+        and is_clan_bank_give(ctx),
+        log_message="Detected clan bank donation message in lottery thread: {content}",
+        log_label="DONATION_LISTENER",
+    ),
+    # 🩵 Clan Treasury Donation
+    MessageRoute(
+        "clan_donate_listener",
+        clan_donate_listener,
+        channel_ids=frozenset({VN_ALLSTARS_TEXT_CHANNELS.clan_donations}),
+        predicate=is_clan_treasury_donation,
+        log_message="Detected clan donation message: {content}",
+        log_label="DONATION_LISTENER",
+    ),
+    # 🩵 Clan Bank Donation
+    MessageRoute(
+        "give_command_listener",
+        give_command_listener,
+        channel_ids=frozenset(
+            {
+                VN_ALLSTARS_TEXT_CHANNELS.clan_donations,
+                VN_ALLSTARS_TEXT_CHANNELS.khys_chamber,
+            }
+        ),
+        predicate=is_clan_bank_give,
+        log_message="Detected clan bank donation message: {content}",
+        log_label="DONATION_LISTENER",
+    ),
+    # 🩵 Donation leaderboard sticky, after the donation above is recorded
+    MessageRoute(
+        "check_and_send_sticky_msg",
+        check_and_send_sticky_msg,
+        channel_ids=frozenset({VN_ALLSTARS_TEXT_CHANNELS.clan_donations}),
+        run_after_others=True,
+    ),
+]
+
+
 # 🐾────────────────────────────────────────────
 #        🌸 Message Create Listener Cog
 # 🐾────────────────────────────────────────────
 class MessageCreateListener(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.dispatcher = MessageDispatcher(bot, MESSAGE_ROUTES)
+
+    async def cog_unload(self):
+        # Let in-flight handlers finish (briefly) rather than dropping them
+        await self.dispatcher.drain(timeout=HANDLER_DRAIN_TIMEOUT_SECONDS)
 
     # 🦋────────────────────────────────────────────
     #           👂 Message Listener Event
@@ -71,114 +173,20 @@ class MessageCreateListener(commands.Cog):
         if guild.id != VNA_SERVER_ID:
             return  # Only process messages from VN Allstars server
 
-        try:
-            # ————————————————————————————————
-            # 🏰 Ignore non-PokéMeow bot messages
-            # ————————————————————————————————
-            # 🚫 Ignore all bots except PokéMeow to prevent loops
-            if (
-                message.author.bot
-                and message.author.id != POKEMEOW_APPLICATION_ID
-                and not message.webhook_id
-            ):
-                return
-
-            content = message.content
-            first_embed = message.embeds[0] if message.embeds else None
-            first_embed_author = (
-                first_embed.author.name if first_embed and first_embed.author else ""
-            )
-            first_embed_description = (
-                first_embed.description
-                if first_embed and first_embed.description
-                else ""
-            )
-            first_embed_footer = (
-                first_embed.footer.text if first_embed and first_embed.footer else ""
-            )
-            first_embed_title = (
-                first_embed.title if first_embed and first_embed.title else ""
-            )
+        # ————————————————————————————————
+        # 🏰 Ignore non-PokéMeow bot messages
+        # ————————————————————————————————
+        # 🚫 Ignore all bots except PokéMeow to prevent loops
+        if (
+            message.author.bot
+            and message.author.id != POKEMEOW_APPLICATION_ID
+            and not message.webhook_id
+        ):
+            return
 
-            # ————————————————————————————————
-            # 🩵 VNA Market Snipe
-            # ————————————————————————————————
-            if message.channel.id in MARKET_FEED_CHANNEL_IDS:
-                await market_feeds_listener(self.bot, message)
-            # ————————————————————————————————
-            # 🩵 Snipe Giveaway Prefix Command
-            # ————————————————————————————————
-            if content.startswith("sg.c"):
-                await create_snipe_ga_prefix(self.bot, message)
-
-            # ————————————————————————————————
-            # 🩵 Giveaway Prefix Command
-            # ————————————————————————————————
-            if content.startswith("g.c"):
-                await create_ga_prefix(self.bot, message)
-
-            # ————————————————————————————————
-            # 🩵 DEX LISTENER
-            # ————————————————————————————————
-            if first_embed:
-                if embed_has_field_name(first_embed, "Dex Number"):
-                    pretty_log(
-                        "info",
-                        f"Detected dex command embed with 'Dex Number' field. Triggering dex listener.",
-                    )
-                    await dex_listener(self.bot, message)
-            # ————————————————————————————————
-            # 🩵 Buy Ticket Listener
-            # ————————————————————————————————
-            if message.channel.id in active_lottery_thread_ids:
-
-                if (
-                    content
-                    and "gave" in content
-                    and "PokeCoins" in content
-                    and any(name in content for name in CLAN_BANK_USER_NAMES)
-                ):
-                    pretty_log(
-                        "info",
-                        f"Detected clan bank donation message in lottery thread: {content}",
-                        label="DONATION_LISTENER",
-                    )
-                    await buy_lottery_ticket_listener(self.bot, message)
-            # ————————————————————————————————
-            # 🩵 Clan Donations
-            # ————————————————————————————————
-            if message.channel.id == VN_ALLSTARS_TEXT_CHANNELS.clan_donations:
-                # Clan Treasury donation
-                if (
-                    content
-                    and "You successfully donated" in content
-                    and "VN Allstar" in content
-                ):
-                    pretty_log(
-                        "info",
-                        f"Detected clan donation message: {content}",
-                        label="DONATION_LISTENER",
-                    )
-                    await clan_donate_listener(self.bot, message)
-            if (
-                message.channel.id == VN_ALLSTARS_TEXT_CHANNELS.clan_donations
-                or message.channel.id == VN_ALLSTARS_TEXT_CHANNELS.khys_chamber
-            ):
-                # Clan Bank Donation
-                if (
-                    content
-                    and "gave" in content
-                    and "PokeCoins" in content
-                    and any(name in content for name in CLAN_BANK_USER_NAMES)
-                ):
-                    pretty_log(
-                        "info",
-                        f"Detected clan bank donation message: {content}",
-                        label="DONATION_LISTENER",
-                    )
-                    await give_command_listener(self.bot, message)
-            if message.channel.id == VN_ALLSTARS_TEXT_CHANNELS.clan_donations:
-                await check_and_send_sticky_msg(self.bot, message)
+        try:
+            # Handlers run as their own tasks; their errors are logged per handler
+            self.dispatcher.dispatch(message)
         except Exception as e:
             # 🛑────────────────────────────────────────────
             #        Unhandled on_message Error Handler
@@ -54,5 +54,130 @@ class Staff_Group_Command(commands.Cog):
         )
     staff_edit_embed.extras = {"category": "Staff"}
 
+    # 🍭──────────────────────────────
+    #   🎀 /staff market-latency
+    # 🍭──────────────────────────────
+    @staff_group.command(
+        name="market-latency",
+        description="Show market feed pipeline latency per stage.",
+    )
+    @app_commands.describe(
+        dump="Attach the full histograms as a JSON file.",
+        reset="Clear the histograms after showing them.",
+    )
+    @vna_staff()
+    async def staff_market_latency(
+        self,
+        interaction: discord.Interaction,
+        dump: bool = False,
+        reset: bool = False,
+    ):
+        slash_cmd_name = "staff market-latency"
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            command_func=market_latency_func,
+            slash_cmd_name=slash_cmd_name,
+            dump=dump,
+            reset=reset,
+        )
+    staff_market_latency.extras = {"category": "Staff"}
+
+    # 🍭──────────────────────────────
+    #   🎀 /staff query-stats
+    # 🍭──────────────────────────────
+    @staff_group.command(
+        name="query-stats",
+        description="Show the most expensive database statements.",
+    )
+    @app_commands.describe(
+        top="How many statements to show (1-10).",
+        sort_by="What to rank statements by.",
+        dump="Attach every statement's stats as a JSON file.",
+        reset="Clear the stats after showing them.",
+        auto_explain="Log EXPLAIN plans for very slow statements.",
+    )
+    @vna_staff()
+    async def staff_query_stats(
+        self,
+        interaction: discord.Interaction,
+        top: int = 10,
+        sort_by: Literal["total", "mean", "max", "calls", "rows"] = "total",
+        dump: bool = False,
+        reset: bool = False,
+        auto_explain: Optional[bool] = None,
+    ):
+        slash_cmd_name = "staff query-stats"
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            command_func=query_stats_func,
+            slash_cmd_name=slash_cmd_name,
+            top=top,
+            sort_by=sort_by,
+            dump=dump,
+            reset=reset,
+            auto_explain=auto_explain,
+        )
+    staff_query_stats.extras = {"category": "Staff"}
+
+    # 🍭──────────────────────────────
+    #   🎀 /staff debug
+    # 🍭──────────────────────────────
+    @staff_group.command(
+        name="debug",
+        description="Turn debug logging on or off for a module or function.",
+    )
+    @app_commands.describe(
+        action="What to do with the debug toggles.",
+        key="Module or module.function, e.g. utils.listener_func.market_feed_listener",
+    )
+    @vna_staff()
+    async def staff_debug(
+        self,
+        interaction: discord.Interaction,
+        action: Literal["enable", "disable", "list", "clear"] = "list",
+        key: Optional[str] = None,
+    ):
+        slash_cmd_name = "staff debug"
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            command_func=debug_toggle_func,
+            slash_cmd_name=slash_cmd_name,
+            action=action,
+            key=key,
+        )
+    staff_debug.extras = {"category": "Staff"}
+
+    # 🍭──────────────────────────────
+    #   🎀 /staff stall-watch
+    # 🍭──────────────────────────────
+    @staff_group.command(
+        name="stall-watch",
+        description="Control the event loop stall watchdog and see where stalls happen.",
+    )
+    @app_commands.describe(
+        action="Start, stop, show or clear the stall watchdog.",
+        threshold_ms="Stall threshold in milliseconds when enabling (50-10000).",
+    )
+    @vna_staff()
+    async def staff_stall_watch(
+        self,
+        interaction: discord.Interaction,
+        action: Literal["status", "enable", "disable", "reset"] = "status",
+        threshold_ms: Optional[app_commands.Range[int, 50, 10000]] = None,
+    ):
+        slash_cmd_name = "staff stall-watch"
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            command_func=stall_watch_func,
+            slash_cmd_name=slash_cmd_name,
+            action=action,
+            threshold_ms=threshold_ms,
+        )
+    staff_stall_watch.extras = {"category": "Staff"}
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(Staff_Group_Command(bot))
\ No newline at end of file
@@ -1,6 +1,7 @@
 # main.py
 import asyncio
 import os
+import time
 
 import discord
 from discord import app_commands
@@ -8,13 +9,42 @@ from discord.ext import commands, tasks
 
 from Constants.variables import DATA_DIR, DEFAULT_GUILD_ID
 from Constants.vn_allstars_constants import VNA_SERVER_ID
-from utils.cache.cache_list import clear_processed_messages_cache
-from utils.cache.central_cache_loader import load_all_cache
+from utils.cache.cache_list import (
+    clear_processed_messages_cache,
+    load_processed_market_feed_ids,
+    save_processed_market_feed_ids,
+)
+from utils.cache.cache_invalidation import start_cache_invalidation_listener
+from utils.cache.central_cache_loader import refresh_stale_caches
 from utils.db.get_pg_pool import get_pg_pool
+from utils.db.market_price_history_db import (
+    flush_price_history_buffer,
+    wait_for_price_history_flushes,
+)
+from utils.db.market_value_db import (
+    flush_market_value_buffer,
+    wait_for_market_value_flushes,
+)
+from utils.essentials.startup_orchestrator import (
+    discover_cog_modules,
+    load_cogs_timed,
+    print_startup_timing_report,
+    record_startup_timing,
+    run_timed_step,
+)
 from utils.functions.restore_views import restore_giveaway_views
-from utils.logs.pretty_log import pretty_log, set_ghouldengo_bot
+from utils.logs.metrics import start_metrics_server, stop_metrics_server
+from utils.logs.pretty_log import flush_logs, pretty_log, set_ghouldengo_bot
+from utils.logs.stall_watchdog import (
+    STALL_WATCHDOG_ENABLED,
+    start_stall_watchdog,
+    stop_stall_watchdog,
+)
 from utils.schedule.scheduler import setup_scheduler
 
+BOOT_STARTED = time.perf_counter()
+_startup_report_printed = False
+
 # ---- Intents / Bot ----
 intents = discord.Intents.default()
 intents.members = True
@@ -58,11 +88,13 @@ async def on_app_command_error(interaction, error):
 @tasks.loop(hours=1)
 async def refresh_all_caches():
 
-    # Removed first-run skip logic so cache loads immediately
-    await load_all_cache(bot)
+    # The LISTEN/NOTIFY listener keeps caches current; this only reloads
+    # tables whose cache_versions show a missed change
+    await refresh_stale_caches(bot)
 
-    # Clear processed message ID sets to prevent memory bloat
+    # Trim expired processed message IDs and checkpoint the rest to disk
     clear_processed_messages_cache()
+    save_processed_market_feed_ids()
 
 
 # ❀───────────────────────────────❀
@@ -122,29 +154,11 @@ async def ping_test(interaction: discord.Interaction):
 async def load_extensions():
     """
     Dynamically load all Python files in the 'cogs' folder (ignores __pycache__).
-    Logs loaded cogs with pretty_log and errors if loading fails.
+    Each cog's import + setup is timed for the startup report; failures are logged.
     """
-    loaded_cogs = []
-    for root, dirs, files in os.walk("cogs"):
-        # Skip __pycache__ folders
-        dirs[:] = [d for d in dirs if d != "__pycache__"]
-
-        for file in files:
-            if file.endswith(".py") and not file.startswith("__"):
-                # Skip pokemons.py specifically in the cogs folder
-                if root == "cogs" and file == "pokemons.py":
-                    continue
-                module_path = (
-                    os.path.join(root, file).replace(os.sep, ".").replace(".py", "")
-                )
-                try:
-                    await bot.load_extension(module_path)
-                    loaded_cogs.append(module_path)
-                except Exception as e:
-                    pretty_log(
-                        message=f"❌ Failed to load cog: {module_path}\n{e}",
-                        tag="error",
-                    )
+    # Skip pokemons.py specifically in the cogs folder
+    modules = discover_cog_modules("cogs", skip={"cogs.pokemons"})
+    loaded_cogs = await load_cogs_timed(bot, modules)
     _loaded_count = len(loaded_cogs)
     pretty_log("ready", f"✅ Loaded { _loaded_count} cogs")  #
 
@@ -173,22 +187,36 @@ async def on_ready():
     except Exception as e:
         pretty_log("error", f"Slash sync to VNA server failed: {e}")
 
-    # Start the hourly cache refresh task
-    if not refresh_all_caches.is_running():
-        refresh_all_caches.start()
-        pretty_log(message="✅ Started hourly cache refresh task", tag="ready")
+    # Listen for row changes first so nothing committed during the load is missed
+    start_cache_invalidation_listener(bot)
 
     # Load caches immediately before checklist
     from utils.cache.central_cache_loader import load_all_cache
 
-    await load_all_cache(bot)
+    await run_timed_step("boot", "Load caches", lambda: load_all_cache(bot))
+
+    # Start the hourly cache refresh task
+    if not refresh_all_caches.is_running():
+        refresh_all_caches.start()
+        pretty_log(message="✅ Started hourly cache refresh task", tag="ready")
 
     # Restore giveaway views
-    await restore_giveaway_views(bot)
+    await run_timed_step(
+        "boot", "Restore giveaway views", lambda: restore_giveaway_views(bot)
+    )
 
     # ❀ Run startup checklist ❀
     await startup_checklist(bot)
 
+    # on_ready fires again on reconnects; only report the first boot
+    global _startup_report_printed
+    if not _startup_report_printed:
+        _startup_report_printed = True
+        record_startup_timing(
+            "boot", "Time to ready", (time.perf_counter() - BOOT_STARTED) * 1000, True
+        )
+        print_startup_timing_report()
+
     try:
         await bot.change_presence(
             activity=discord.Game(name="/ghouldengo list • /ghouldengo bid")
@@ -199,12 +227,26 @@ async def on_ready():
 
 # ---- Boot ----
 async def main():
+    # Connect the database pool while the cogs import
+    pool_started = time.perf_counter()
+    pool_task = asyncio.create_task(get_pg_pool())
+
     # Load extensions
+    extensions_started = time.perf_counter()
     await load_extensions()
+    record_startup_timing(
+        "boot",
+        "Load extensions",
+        (time.perf_counter() - extensions_started) * 1000,
+        True,
+    )
 
     # Intialize the database pool
     try:
-        bot.pg_pool = await get_pg_pool()
+        bot.pg_pool = await pool_task
+        record_startup_timing(
+            "boot", "PostgreSQL pool", (time.perf_counter() - pool_started) * 1000, True
+        )
         pretty_log(message="✅ PostgreSQL connection pool established", tag="ready")
     except Exception as e:
         pretty_log(
@@ -214,7 +256,7 @@ async def main():
         )
         return  # Exit if DB connection fails
     # Start the scheduler
-    await setup_scheduler(bot)
+    await run_timed_step("boot", "Scheduler", lambda: setup_scheduler(bot))
 
     # Register persistent views
     # await register_persistent_views(bot)
@@ -224,11 +266,31 @@ async def main():
     except Exception:
         pass
 
+    # Restore recently processed market feed IDs so a restart doesn't re-ping
+    load_processed_market_feed_ids()
+
     token = os.getenv("DISCORD_TOKEN")
     if not token:
         raise RuntimeError("❌ DISCORD_TOKEN environment variable is not set.")
 
-    await bot.start(token)
+    # Prometheus /metrics and /health on this loop
+    await start_metrics_server(bot)
+    if STALL_WATCHDOG_ENABLED:
+        start_stall_watchdog()
+
+    try:
+        await bot.start(token)
+    finally:
+        stop_stall_watchdog()
+        await stop_metrics_server()
+        # Write out anything still sitting in the write-behind buffers
+        await wait_for_market_value_flushes()
+        await flush_market_value_buffer(bot)
+        await wait_for_price_history_flushes()
+        await flush_price_history_buffer(bot)
+        await bot.pg_pool.close()
+        save_processed_market_feed_ids()
+        flush_logs()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,427 @@
+import asyncio
+import json
+from functools import partial
+
+import asyncpg
+import discord
+
+from utils.db.get_pg_pool import DB_APPLICATION_NAME
+from utils.db.market_value_db import (
+    market_value_cache_entry,
+    rebuild_pokemon_autocomplete_index,
+)
+from utils.logs.pretty_log import pretty_log
+
+from .cache_list import (
+    active_lottery_thread_ids,
+    market_value_cache,
+    pokemon_list_cache,
+)
+from .market_alert_cache import (
+    remove_alert_by_key_from_cache,
+    upsert_alert_row_into_cache,
+)
+from .vna_members_cache import remove_vna_member_from_cache, upsert_vna_member_cache
+from .webhook_url_cache import (
+    remove_webhook_url_from_cache,
+    upsert_webhook_url_into_cache,
+)
+
+# SQL script: per-table change versions plus a row-level NOTIFY trigger.
+# cache_versions is bumped once per statement (by its first changed row), not
+# once per row, so bulk writes don't serialize on the version row.
+"""CREATE TABLE cache_versions (
+    table_name  TEXT PRIMARY KEY,
+    version     BIGINT NOT NULL DEFAULT 0,
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Clears the statement's version marker; the first changed row sets it
+CREATE OR REPLACE FUNCTION reset_cache_invalidation_statement() RETURNS trigger AS $$
+BEGIN
+    PERFORM set_config('vna_cache.version_' || TG_TABLE_NAME, '', true);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION notify_cache_invalidation() RETURNS trigger AS $$
+DECLARE
+    version_key TEXT := 'vna_cache.version_' || TG_TABLE_NAME;
+    statement_version TEXT := current_setting(version_key, true);
+    origin TEXT := current_setting('application_name', true);
+    new_version BIGINT;
+    first_row BOOLEAN := FALSE;
+    payload TEXT;
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD IS NOT DISTINCT FROM NEW THEN
+        RETURN NULL;
+    END IF;
+
+    IF statement_version IS NULL OR statement_version = '' THEN
+        INSERT INTO cache_versions (table_name, version)
+        VALUES (TG_TABLE_NAME, 1)
+        ON CONFLICT (table_name) DO UPDATE
+            SET version = cache_versions.version + 1, updated_at = NOW()
+        RETURNING version INTO new_version;
+        PERFORM set_config(version_key, new_version::text, true);
+        first_row := TRUE;
+    ELSE
+        new_version := statement_version::BIGINT;
+    END IF;
+
+    -- 'skip_bot_rows' (market_value): a bot's own writes, e.g. the write-behind
+    -- flush, send one row-less RELOAD per statement instead of a NOTIFY per
+    -- row. The writing bot skips it; any other bot reloads the table.
+    IF TG_NARGS > 0 AND TG_ARGV[0] = 'skip_bot_rows' AND origin LIKE 'vna-bot-%' THEN
+        IF first_row THEN
+            PERFORM pg_notify('cache_invalidation', json_build_object(
+                'table', TG_TABLE_NAME,
+                'op', 'RELOAD',
+                'version', new_version,
+                'origin', origin
+            )::text);
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    payload := json_build_object(
+        'table', TG_TABLE_NAME,
+        'op', TG_OP,
+        'version', new_version,
+        'origin', origin,
+        'row', CASE WHEN TG_OP = 'DELETE' THEN row_to_json(OLD) ELSE row_to_json(NEW) END,
+        'old', CASE WHEN TG_OP = 'UPDATE' THEN row_to_json(OLD) END
+    )::text;
+
+    -- NOTIFY payloads are capped at 8000 bytes; fall back to a table reload
+    IF octet_length(payload) > 7900 THEN
+        payload := json_build_object(
+            'table', TG_TABLE_NAME,
+            'op', 'RELOAD',
+            'version', new_version,
+            'origin', origin
+        )::text;
+    END IF;
+
+    PERFORM pg_notify('cache_invalidation', payload);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vna_members_cache_invalidation_statement
+BEFORE INSERT OR UPDATE OR DELETE ON vna_members
+FOR EACH STATEMENT EXECUTE FUNCTION reset_cache_invalidation_statement();
+CREATE TRIGGER vna_members_cache_invalidation
+AFTER INSERT OR UPDATE OR DELETE ON vna_members
+FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidation();
+
+CREATE TRIGGER market_alerts_cache_invalidation_statement
+BEFORE INSERT OR UPDATE OR DELETE ON market_alerts
+FOR EACH STATEMENT EXECUTE FUNCTION reset_cache_invalidation_statement();
+CREATE TRIGGER market_alerts_cache_invalidation
+AFTER INSERT OR UPDATE OR DELETE ON market_alerts
+FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidation();
+
+CREATE TRIGGER webhook_url_cache_invalidation_statement
+BEFORE INSERT OR UPDATE OR DELETE ON webhook_url
+FOR EACH STATEMENT EXECUTE FUNCTION reset_cache_invalidation_statement();
+CREATE TRIGGER webhook_url_cache_invalidation
+AFTER INSERT OR UPDATE OR DELETE ON webhook_url
+FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidation();
+
+CREATE TRIGGER market_value_cache_invalidation_statement
+BEFORE INSERT OR UPDATE OR DELETE ON market_value
+FOR EACH STATEMENT EXECUTE FUNCTION reset_cache_invalidation_statement();
+CREATE TRIGGER market_value_cache_invalidation
+AFTER INSERT OR UPDATE OR DELETE ON market_value
+FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidation('skip_bot_rows');
+
+CREATE TRIGGER lottery_cache_invalidation_statement
+BEFORE INSERT OR UPDATE OR DELETE ON lottery
+FOR EACH STATEMENT EXECUTE FUNCTION reset_cache_invalidation_statement();
+CREATE TRIGGER lottery_cache_invalidation
+AFTER INSERT OR UPDATE OR DELETE ON lottery
+FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidation();"""
+
+# 🍩────────────────────────────────────────────
+#        💤 LISTEN/NOTIFY Cache Invalidation
+# 🍩────────────────────────────────────────────
+# Every write statement on a cached table bumps its row in cache_versions once
+# and sends each changed row on CACHE_INVALIDATION_CHANNEL. A dedicated connection applies
+# those rows to the caches as they arrive. The hourly refresh only compares
+# cache_versions against the versions applied here, and reloads a table in
+# full only when a notification was missed (e.g. while the listener was down).
+CACHE_INVALIDATION_CHANNEL = "cache_invalidation"
+LISTENER_PING_SECONDS = 60  # how often an idle listener checks its connection
+LISTENER_MAX_BACKOFF_SECONDS = 60
+
+# table -> highest cache_versions.version reflected in the cache
+applied_cache_versions: dict[str, int] = {}
+
+# Tables being reloaded in full -> notifications held back until it finishes
+_reload_buffers: dict[str, list[dict]] = {}
+
+# Tables that got a change we couldn't apply; reloaded on the next check
+_forced_stale_tables: set[str] = set()
+
+_listener_task: asyncio.Task | None = None
+
+
+# ── Row appliers, one per cached table ──
+def _apply_vna_members_change(bot, op: str, row: dict, old: dict | None):
+    if op == "DELETE":
+        remove_vna_member_from_cache(row["user_id"])
+        return
+    upsert_vna_member_cache(
+        user_id=row["user_id"],
+        user_name=row["user_name"],
+        pokemeow_name=row["pokemeow_name"],
+        channel_id=row["channel_id"],
+        perks=row["perks"],
+        faction=row["faction"],
+        clan_joined_date=row.get("clan_joined_date"),
+    )
+
+
+def _apply_market_alerts_change(bot, op: str, row: dict, old: dict | None):
+    # An update can move an alert to another pokemon/channel, so drop the old key
+    stale = row if op == "DELETE" else old
+    if stale:
+        remove_alert_by_key_from_cache(
+            stale["pokemon"], stale["channel_id"], stale["user_id"]
+        )
+    if op != "DELETE":
+        upsert_alert_row_into_cache(row)
+
+
+def _apply_webhook_url_change(bot, op: str, row: dict, old: dict | None):
+    # Each bot only caches its own webhooks
+    if bot.user is None or row["bot_id"] != bot.user.id:
+        return
+    if op == "DELETE":
+        remove_webhook_url_from_cache(row["bot_id"], row["channel_id"])
+    else:
+        upsert_webhook_url_into_cache(row["bot_id"], row["channel_id"], row["url"])
+
+
+def _apply_market_value_change(bot, op: str, row: dict, old: dict | None):
+    name = row["pokemon_name"]
+    if op == "DELETE":
+        market_value_cache.pop(name, None)
+        if pokemon_list_cache.pop(name, None) is not None:
+            rebuild_pokemon_autocomplete_index()
+        return
+
+    market_value_cache[name] = market_value_cache_entry(row)
+    is_new = name not in pokemon_list_cache
+    if is_new or pokemon_list_cache[name] != row["dex_number"]:
+        pokemon_list_cache[name] = row["dex_number"]
+        rebuild_pokemon_autocomplete_index()
+
+
+def _apply_lottery_change(bot, op: str, row: dict, old: dict | None):
+    if old and old.get("thread_id") != row.get("thread_id"):
+        active_lottery_thread_ids.discard(old.get("thread_id"))
+    thread_id = row.get("thread_id")
+    if thread_id is None:
+        return
+    if op == "DELETE" or row.get("ended"):
+        active_lottery_thread_ids.discard(thread_id)
+    else:
+        active_lottery_thread_ids.add(thread_id)
+
+
+CACHE_ROW_APPLIERS = {
+    "vna_members": _apply_vna_members_change,
+    "market_alerts": _apply_market_alerts_change,
+    "webhook_url": _apply_webhook_url_change,
+    "market_value": _apply_market_value_change,
+    "lottery": _apply_lottery_change,
+}
+
+# The market value cache is written ahead of the DB (write-behind buffer), so
+# our own flushes must not be applied back on top of newer in-memory values.
+# The trigger already collapses a bot's market_value writes into one RELOAD per
+# statement; this skips the ones we made. Every other table's write path
+# already updates its cache; replaying ours there is harmless and covers any
+# path that forgot to.
+SKIP_OWN_CHANGES_TABLES = frozenset({"market_value"})
+
+
+def _mark_applied(table: str, version: int):
+    if version > applied_cache_versions.get(table, 0):
+        applied_cache_versions[table] = version
+
+
+def apply_cache_change(bot: discord.Client, change: dict):
+    """Applies one decoded notification to its cache and records its version."""
+    table = change["table"]
+    version = change.get("version") or 0
+    op = change["op"]
+
+    if change.get("origin") == DB_APPLICATION_NAME and table in SKIP_OWN_CHANGES_TABLES:
+        _mark_applied(table, version)
+        return
+
+    if op == "RELOAD":
+        _forced_stale_tables.add(table)
+        pretty_log(
+            "cache",
+            f"⚠️ {table} changed without row details (v{version}); "
+            "it will be reloaded on the next cache check.",
+        )
+        return
+
+    try:
+        CACHE_ROW_APPLIERS[table](bot, op, change["row"], change.get("old"))
+    except Exception as e:
+        _forced_stale_tables.add(table)
+        pretty_log("error", f"Failed to apply {op} on {table} to cache: {e}")
+        return
+    _mark_applied(table, version)
+
+
+def _on_cache_notification(
+    bot: discord.Client,
+    connection: asyncpg.Connection,
+    pid: int,
+    channel: str,
+    payload: str,
+):
+    try:
+        change = json.loads(payload)
+    except ValueError:
+        pretty_log("error", f"Malformed cache invalidation payload: {payload[:200]}")
+        return
+    table = change.get("table")
+    if table not in CACHE_ROW_APPLIERS:
+        return
+
+    buffer = _reload_buffers.get(table)
+    if buffer is not None:
+        buffer.append(change)
+        return
+    apply_cache_change(bot, change)
+
+
+# ── Full reload bookkeeping ──
+def begin_cache_reload(tables):
+    """Holds back notifications for tables about to be reloaded in full."""
+    for table in tables:
+        _reload_buffers.setdefault(table, [])
+
+
+def finish_cache_reload(
+    bot: discord.Client, table: str, snapshot_version: int | None, ok: bool = True
+):
+    """
+    Replays the notifications held back during a reload on top of it.
+
+    snapshot_version is cache_versions.version read before the reload's
+    SELECT. Every change at or below it is committed and therefore already in
+    the reloaded rows; anything newer is replayed in version order. A failed
+    reload leaves the table stale so the next check retries it.
+    """
+    buffered = _reload_buffers.pop(table, [])
+    if ok and snapshot_version is not None:
+        applied_cache_versions[table] = snapshot_version
+        _forced_stale_tables.discard(table)
+    elif not ok:
+        applied_cache_versions.pop(table, None)
+        _forced_stale_tables.add(table)
+
+    for change in sorted(buffered, key=lambda c: c.get("version") or 0):
+        if snapshot_version is None or (change.get("version") or 0) > snapshot_version:
+            apply_cache_change(bot, change)
+
+
+async def fetch_cache_versions(bot: discord.Client) -> dict[str, int] | None:
+    """
+    Current cache_versions, or None when they can't be read (e.g. the
+    triggers aren't installed), in which case callers reload in full.
+    """
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            rows = await conn.fetch("SELECT table_name, version FROM cache_versions")
+    except asyncpg.exceptions.UndefinedTableError:
+        return None
+    except Exception as e:
+        pretty_log("error", f"Failed to fetch cache versions: {e}")
+        return None
+    return {row["table_name"]: row["version"] for row in rows}
+
+
+def stale_cache_tables(versions: dict[str, int]) -> list[str]:
+    """Cached tables whose DB version is ahead of what the cache has applied."""
+    return [
+        table
+        for table in CACHE_ROW_APPLIERS
+        if table in _forced_stale_tables
+        or versions.get(table, 0) > applied_cache_versions.get(table, 0)
+    ]
+
+
+# ── Listener connection ──
+async def _listen_once(bot: discord.Client, on_connected) -> None:
+    pool = bot.pg_pool
+    conn = await asyncpg.connect(
+        dsn=pool.dsn,
+        ssl=pool.ssl_context,
+        server_settings={"application_name": f"{DB_APPLICATION_NAME}-listener"},
+    )
+    closed = asyncio.Event()
+    conn.add_termination_listener(lambda _conn: closed.set())
+    try:
+        await conn.add_listener(
+            CACHE_INVALIDATION_CHANNEL, partial(_on_cache_notification, bot)
+        )
+        pretty_log("cache", f"✅ Listening on '{CACHE_INVALIDATION_CHANNEL}'")
+        await on_connected()
+
+        while not conn.is_closed():
+            try:
+                await asyncio.wait_for(closed.wait(), LISTENER_PING_SECONDS)
+            except asyncio.TimeoutError:
+                # An idle socket can die silently; a ping surfaces it
+                await conn.execute("SELECT 1", timeout=10)
+    finally:
+        if not conn.is_closed():
+            await conn.close()
+
+
+async def _listen_forever(bot: discord.Client):
+    from .central_cache_loader import refresh_stale_caches
+
+    backoff = 1
+    first_connect = True
+
+    async def on_connected():
+        nonlocal backoff, first_connect
+        backoff = 1
+        if not first_connect:
+            # Catch up on whatever changed while we weren't listening
+            await refresh_stale_caches(bot)
+        first_connect = False
+
+    while True:
+        try:
+            await _listen_once(bot, on_connected)
+            pretty_log("cache", "⚠️ Cache invalidation listener disconnected.")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            pretty_log(
+                "error",
+                f"Cache invalidation listener failed: {e}. Retrying in {backoff}s",
+            )
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, LISTENER_MAX_BACKOFF_SECONDS)
+
+
+def start_cache_invalidation_listener(bot: discord.Client):
+    """Starts the listener task once; it reconnects on its own after that."""
+    global _listener_task
+    if _listener_task is not None and not _listener_task.done():
+        return _listener_task
+    _listener_task = asyncio.create_task(_listen_forever(bot))
+    return _listener_task
@@ -1,7 +1,31 @@
+import os
+
+from Constants.variables import DATA_DIR
 from utils.logs.pretty_log import pretty_log
 
-processed_market_feed_message_ids = set()
-processed_market_feed_ids = set()
+from .ttl_dedup import TTLDedupStore
+
+# 🍩────────────────────────────────────────────
+#        💤 Processed Market Feed Dedup
+# 🍩────────────────────────────────────────────
+MARKET_FEED_DEDUP_TTL_SECONDS = 60 * 60  # 1 hour
+MARKET_FEED_DEDUP_MAX_SIZE = 20_000
+MARKET_FEED_DEDUP_PERSIST_LAST_N = 5_000
+MARKET_FEED_DEDUP_FILE = os.path.join(DATA_DIR, "processed_market_feed_ids.json")
+MARKET_FEED_MESSAGE_DEDUP_FILE = os.path.join(
+    DATA_DIR, "processed_market_feed_message_ids.json"
+)
+
+processed_market_feed_message_ids = TTLDedupStore(
+    "market_feed_message_ids",
+    ttl_seconds=MARKET_FEED_DEDUP_TTL_SECONDS,
+    max_size=MARKET_FEED_DEDUP_MAX_SIZE,
+)
+processed_market_feed_ids = TTLDedupStore(
+    "market_feed_ids",
+    ttl_seconds=MARKET_FEED_DEDUP_TTL_SECONDS,
+    max_size=MARKET_FEED_DEDUP_MAX_SIZE,
+)
 processing_end_giveaway_message_ids = set()
 
 
@@ -9,12 +33,52 @@ active_lottery_thread_ids: set[int] = set()
 processing_end_lottery_ids: set[int] = set()
 processing_lottery_purchase_ids: set[int] = set()
 snipe_ga_active = False
+
+
 def clear_processed_messages_cache():
-    """Clears all processed message ID caches."""
-    processed_market_feed_message_ids.clear()
-    processed_market_feed_ids.clear()
+    """
+    Expires old entries from the processed message ID caches.
+    The stores are TTL-bounded, so this only trims; it never wipes recent IDs.
+    """
+    processed_market_feed_message_ids.expire()
+    processed_market_feed_ids.expire()
 
-    pretty_log(message="✅ Cleared all processed message ID caches", tag="cache")
+    for store in (processed_market_feed_message_ids, processed_market_feed_ids):
+        stats = store.stats()
+        pretty_log(
+            message=f"✅ Expired {stats['name']}: size={stats['size']}, hits={stats['hits']}, "
+            f"misses={stats['misses']}, evictions={stats['evictions']}",
+            tag="cache",
+        )
+
+
+def save_processed_market_feed_ids():
+    """Persists the newest processed market feed IDs so restarts don't re-ping."""
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        processed_market_feed_ids.save(
+            MARKET_FEED_DEDUP_FILE, last_n=MARKET_FEED_DEDUP_PERSIST_LAST_N
+        )
+        processed_market_feed_message_ids.save(
+            MARKET_FEED_MESSAGE_DEDUP_FILE, last_n=MARKET_FEED_DEDUP_PERSIST_LAST_N
+        )
+    except Exception as e:
+        pretty_log(
+            message=f"❌ Failed to save processed market feed IDs: {e}",
+            tag="cache",
+        )
+
+
+def load_processed_market_feed_ids():
+    """Restores processed market feed IDs saved by a previous run."""
+    loaded_ids = processed_market_feed_ids.load(MARKET_FEED_DEDUP_FILE)
+    loaded_message_ids = processed_market_feed_message_ids.load(
+        MARKET_FEED_MESSAGE_DEDUP_FILE
+    )
+    pretty_log(
+        message=f"✅ Restored {loaded_ids} market feed IDs and {loaded_message_ids} message IDs",
+        tag="cache",
+    )
 
 
 market_alert_cache: list[dict] = []
@@ -41,6 +105,16 @@ _market_alert_index: dict[tuple[str, int], dict] = (
 #         "role_id": 192837465
 #     },
 
+market_alert_price_index: dict[str, list[dict]] = {}
+# key = normalized pokemon name (pokemon.lower()), value sorted by max_price
+# Structure
+# market_alert_price_index = {
+#     "pikachu": [
+#         {...alert with max_price 3000...},
+#         {...alert with max_price 5000...},
+#     ],
+# }
+
 webhook_url_cache: dict[tuple[int, int], dict[str, str]] = {}
 #     ...
 #
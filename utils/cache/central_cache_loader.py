@@ -1,40 +1,80 @@
+import asyncio
+
 import discord
 
 from utils.logs.pretty_log import pretty_log
 
-from .cache_list import market_alert_cache
+from .cache_invalidation import (
+    begin_cache_reload,
+    fetch_cache_versions,
+    finish_cache_reload,
+    stale_cache_tables,
+)
 from .market_alert_cache import load_market_alert_cache
+from .market_price_history_cache import load_market_price_history_cache
+from .pokemon_catalog import load_pokemon_catalog
+from .snipe_threshold_cache import recompute_snipe_thresholds
 from .vna_members_cache import load_vna_members_cache
 from .webhook_url_cache import load_webhook_url_cache
 from utils.db.market_value_db import load_market_cache_from_db
 from utils.db.lottery import load_active_lotteries_into_cache
+from utils.essentials.startup_orchestrator import (
+    run_concurrent_steps,
+    run_timed_step,
+)
+
+
+# table -> (cache step name, loader); these are the LISTEN/NOTIFY-driven caches
+CACHE_TABLE_LOADERS = {
+    "vna_members": ("VNA members", load_vna_members_cache),
+    "market_alerts": ("Market alerts", load_market_alert_cache),
+    "webhook_url": ("Webhook URLs", load_webhook_url_cache),
+    "market_value": ("Market values", load_market_cache_from_db),
+    "lottery": ("Active lotteries", load_active_lotteries_into_cache),
+}
+
 
 async def load_all_cache(bot: discord.Client):
     """
     Loads all caches used by the bot.
-    Currently loads:
-    - Market Alert Cache
+    The database-backed loaders are independent, so they run concurrently on
+    the pool; each is timed under "caches" and a failing loader doesn't stop
+    the others. Derived caches are built once those finish.
     """
-    try:
-
-        # Load VNA Members Cache
-        await load_vna_members_cache(bot)
+    # Versions read before the SELECTs, so changes racing the load get replayed
+    versions = await fetch_cache_versions(bot)
+    begin_cache_reload(CACHE_TABLE_LOADERS)
 
-        # Load Market Alert Cache
-        await load_market_alert_cache(bot)
+    steps = {
+        name: (lambda loader=loader: loader(bot))
+        for name, loader in CACHE_TABLE_LOADERS.values()
+    }
+    # Warm rolling market price windows (only when empty)
+    steps["Market price windows"] = lambda: load_market_price_history_cache(bot)
+    results = await run_concurrent_steps("caches", steps)
 
-        # Load Webhook URL Cache
-        await load_webhook_url_cache(bot)
+    for table, (name, _) in CACHE_TABLE_LOADERS.items():
+        finish_cache_reload(
+            bot,
+            table,
+            versions.get(table, 0) if versions is not None else None,
+            ok=results[name],
+        )
 
-        # Load Market Value Cache from database
-        await load_market_cache_from_db(bot)
+    # Build the static Pokémon name/dex indexes (no-op after the first load)
+    results["Pokémon catalog"] = await run_timed_step(
+        "caches", "Pokémon catalog", load_pokemon_catalog
+    )
 
-        # Load active lottery thread IDs into cache
-        await load_active_lotteries_into_cache(bot)
+    # Snipe thresholds depend on the price windows and market value rarities
+    results["Snipe thresholds"] = await run_timed_step(
+        "caches", "Snipe thresholds", recompute_snipe_thresholds
+    )
 
-    except Exception as e:
+    failed = [name for name, ok in results.items() if not ok]
+    if failed:
         pretty_log(
-            message=f"❌ Error loading caches: {e}",
+            message=f"❌ Error loading caches: {', '.join(failed)}",
             tag="cache",
         )
         return
@@ -42,3 +82,35 @@ async def load_all_cache(bot: discord.Client):
         message="✅ All caches loaded successfully.",
         tag="cache",
     )
+
+
+async def refresh_stale_caches(bot: discord.Client):
+    """
+    Fallback for the LISTEN/NOTIFY listener: reloads only the tables whose
+    cache_versions moved past what the listener applied. Without the
+    cache_versions table (triggers not installed) every cache is reloaded.
+    """
+    versions = await fetch_cache_versions(bot)
+    if versions is None:
+        await load_all_cache(bot)
+        return
+
+    stale = stale_cache_tables(versions)
+    if not stale:
+        pretty_log(message="✅ Caches are up to date.", tag="cache")
+        return
+
+    begin_cache_reload(stale)
+    results = await asyncio.gather(
+        *(CACHE_TABLE_LOADERS[table][1](bot) for table in stale),
+        return_exceptions=True,
+    )
+    for table, result in zip(stale, results):
+        ok = not isinstance(result, BaseException)
+        if not ok:
+            pretty_log(message=f"❌ Error reloading {table} cache: {result}", tag="cache")
+        finish_cache_reload(bot, table, versions.get(table, 0), ok=ok)
+    pretty_log(
+        message=f"✅ Reloaded stale caches: {', '.join(stale)}",
+        tag="cache",
+    )
@@ -1,14 +1,60 @@
+import bisect
+
 import discord
 
 from utils.db.market_alert_db import fetch_all_market_alerts
 from utils.logs.pretty_log import pretty_log
 
-from .cache_list import _market_alert_index, market_alert_cache
+from .cache_list import (
+    _market_alert_index,
+    market_alert_cache,
+    market_alert_price_index,
+)
+
+
+def normalize_alert_pokemon_name(pokemon: str) -> str:
+    return pokemon.strip().lower()
+
+
+def _alert_max_price(alert: dict) -> int:
+    return alert["max_price"] or 0
+
+
+def _add_alert_to_price_index(alert_entry: dict):
+    bucket = market_alert_price_index.setdefault(
+        normalize_alert_pokemon_name(alert_entry["pokemon"]), []
+    )
+    bisect.insort(bucket, alert_entry, key=_alert_max_price)
+
+
+def _remove_alert_from_price_index(alert_entry: dict):
+    name = normalize_alert_pokemon_name(alert_entry["pokemon"])
+    bucket = market_alert_price_index.get(name)
+    if not bucket:
+        return
+    for i, alert in enumerate(bucket):
+        if alert is alert_entry:
+            del bucket[i]
+            break
+    if not bucket:
+        del market_alert_price_index[name]
+
+
+def fetch_triggered_alerts(poke_name: str, listed_price: int) -> list[dict]:
+    """
+    Returns every alert for poke_name whose max_price is at or above listed_price.
+    """
+    bucket = market_alert_price_index.get(normalize_alert_pokemon_name(poke_name))
+    if not bucket:
+        return []
+    start = bisect.bisect_left(bucket, listed_price, key=_alert_max_price)
+    return bucket[start:]
 
 
 async def load_market_alert_cache(bot: discord.Client):
     market_alert_cache.clear()
     _market_alert_index.clear()
+    market_alert_price_index.clear()
     try:
         alerts = await fetch_all_market_alerts(bot)
         if not alerts:
@@ -35,6 +81,7 @@ async def load_market_alert_cache(bot: discord.Client):
                 alert_entry["user_id"],
             )
             _market_alert_index[key] = alert_entry
+            _add_alert_to_price_index(alert_entry)
         pretty_log(
             message=f"✅ Loaded {len(market_alert_cache)} market alerts into cache.",
             tag="cache",
@@ -83,6 +130,7 @@ def insert_alert_into_cache(
     market_alert_cache.append(alert_entry)
     key = (pokemon, channel_id, user_id)
     _market_alert_index[key] = alert_entry
+    _add_alert_to_price_index(alert_entry)
     pretty_log(
         message=f"✅ Inserted market alert for {user_name} {pokemon} (User ID: {user_id}) into cache.",
         tag="cache",
@@ -111,6 +159,7 @@ def remove_alert_from_user_in_cache(
     if alert_entry:
         market_alert_cache.remove(alert_entry)
         del _market_alert_index[key]
+        _remove_alert_from_price_index(alert_entry)
         pretty_log(
             message=f"✅ Removed market alert for {alert_entry['user_name']} {pokemon} (User ID: {user_id}) from cache.",
             tag="cache",
@@ -128,6 +177,7 @@ def remove_all_alerts_for_user_in_cache(user_id: int):
         market_alert_cache.remove(alert)
         key = (alert["pokemon"], alert["channel_id"], user_id)
         del _market_alert_index[key]
+        _remove_alert_from_price_index(alert)
     pretty_log(
         message=f"✅ Removed all market alerts for User ID: {user_id} from cache.",
         tag="cache",
@@ -151,7 +201,10 @@ def update_user_alert_in_cache(
     if old_key:
         alert_entry = _market_alert_index[old_key]
         if new_max_price is not None:
+            # Re-slot in the price index so the bucket stays sorted
+            _remove_alert_from_price_index(alert_entry)
             alert_entry["max_price"] = new_max_price
+            _add_alert_to_price_index(alert_entry)
         if new_channel_id is not None:
             alert_entry["channel_id"] = new_channel_id
         if new_role_id is not None:
@@ -177,3 +230,33 @@ def update_user_alert_in_cache(
 def fetch_user_alerts_from_cache(user_id: int) -> list[dict]:
     user_alerts = [a for a in market_alert_cache if a["user_id"] == user_id]
     return user_alerts
+
+
+def remove_alert_by_key_from_cache(pokemon: str, channel_id: int, user_id: int):
+    """Removes the alert stored under (pokemon, channel_id, user_id), if any."""
+    alert_entry = _market_alert_index.pop((pokemon, channel_id, user_id), None)
+    if alert_entry is None:
+        return
+    market_alert_cache.remove(alert_entry)
+    _remove_alert_from_price_index(alert_entry)
+
+
+def upsert_alert_row_into_cache(row: dict):
+    """
+    Inserts or replaces the alert for a market_alerts row, keyed like the
+    loader. Re-applying the same row is a no-op, so it's safe for replays.
+    """
+    key = (row["pokemon"], row["channel_id"], row["user_id"])
+    remove_alert_by_key_from_cache(*key)
+    alert_entry = {
+        "user_name": row["user_name"],
+        "pokemon": row["pokemon"],
+        "dex": row["dex"],
+        "max_price": row["max_price"],
+        "channel_id": row["channel_id"],
+        "role_id": row["role_id"],
+        "user_id": row["user_id"],
+    }
+    market_alert_cache.append(alert_entry)
+    _market_alert_index[key] = alert_entry
+    _add_alert_to_price_index(alert_entry)
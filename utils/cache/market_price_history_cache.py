@@ -0,0 +1,119 @@
+from array import array
+
+import discord
+
+from utils.logs.pretty_log import pretty_log
+
+# 🍩────────────────────────────────────────────
+#        💤 Rolling Market Price Windows
+# 🍩────────────────────────────────────────────
+PRICE_WINDOW_SIZE = 256  # most recent listed prices kept per Pokémon
+
+
+class PriceWindow:
+    """
+    Fixed-size ring buffer of recent listed prices backed by array('q').
+    Appends are O(1) and memory per Pokémon is fixed at PRICE_WINDOW_SIZE ints.
+    """
+
+    __slots__ = ("_prices", "_count", "_next")
+
+    def __init__(self, size: int = PRICE_WINDOW_SIZE):
+        self._prices = array("q", bytes(8 * size))
+        self._count = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, price: int):
+        prices = self._prices
+        prices[self._next] = price
+        self._next = (self._next + 1) % len(prices)
+        if self._count < len(prices):
+            self._count += 1
+
+    def values(self) -> array:
+        """Prices in the window, oldest first."""
+        prices = self._prices
+        if self._count < len(prices):
+            return prices[: self._count]
+        return prices[self._next :] + prices[: self._next]
+
+    def min(self) -> int | None:
+        if not self._count:
+            return None
+        return min(self._prices[: self._count])
+
+    def percentile(self, pct: float) -> int | None:
+        if not self._count:
+            return None
+        ordered = sorted(self._prices[: self._count])
+        index = round(pct / 100 * (len(ordered) - 1))
+        return ordered[index]
+
+    def median(self) -> int | None:
+        return self.percentile(50)
+
+
+market_price_windows: dict[str, PriceWindow] = {}
+# Structure:
+# market_price_windows = {
+#     "pikachu": PriceWindow([...recent listed prices...]),
+# }
+
+
+def record_market_price(pokemon_name: str, price: int):
+    if price <= 0:
+        return
+    key = pokemon_name.lower()
+    window = market_price_windows.get(key)
+    if window is None:
+        window = market_price_windows[key] = PriceWindow()
+    window.add(price)
+
+
+def fetch_price_window(pokemon_name: str) -> PriceWindow | None:
+    return market_price_windows.get(pokemon_name.lower())
+
+
+def fetch_median_price(pokemon_name: str) -> int | None:
+    window = market_price_windows.get(pokemon_name.lower())
+    return window.median() if window else None
+
+
+def fetch_min_price(pokemon_name: str) -> int | None:
+    window = market_price_windows.get(pokemon_name.lower())
+    return window.min() if window else None
+
+
+def fetch_price_percentile(pokemon_name: str, pct: float) -> int | None:
+    window = market_price_windows.get(pokemon_name.lower())
+    return window.percentile(pct) if window else None
+
+
+async def load_market_price_history_cache(bot: discord.Client):
+    """
+    Warms the rolling windows from recent history after a restart.
+    Skipped when the windows are already populated, so the hourly cache
+    refresh doesn't rescan the history table.
+    """
+    from utils.db.market_price_history_db import fetch_recent_price_history
+
+    if market_price_windows:
+        return market_price_windows
+    try:
+        rows = await fetch_recent_price_history(bot, per_pokemon=PRICE_WINDOW_SIZE)
+        for row in rows:
+            record_market_price(row["pokemon_name"], row["listed_price"])
+        pretty_log(
+            message=f"✅ Loaded price windows for {len(market_price_windows)} Pokémon into cache.",
+            tag="cache",
+        )
+        return market_price_windows
+    except Exception as e:
+        pretty_log(
+            message=f"❌ Error loading market price history cache: {e}",
+            tag="cache",
+        )
+        raise e
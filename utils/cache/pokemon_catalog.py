@@ -0,0 +1,147 @@
+from utils.logs.pretty_log import pretty_log
+
+from .cache_list import market_value_cache
+
+# 🍩────────────────────────────────────────────
+#        💤 Unified Pokémon Catalog
+# 🍩────────────────────────────────────────────
+# Dex offsets PokeMeow uses on top of the base National Dex number
+SHINY_DEX_OFFSET = 1000
+GOLDEN_DEX_OFFSET = 9000
+FORM_DEX_START = 7000  # 7xxx dexes are forms and never get shiny/golden offsets
+
+# Rarity lists from Constants/pokemon_dex.py, highest precedence first for base rarity
+BASE_RARITY_LISTS = ("legendary", "superrare", "rare", "uncommon", "common")
+
+
+class PokemonCatalog:
+    """
+    Every static name/dex index built once from weakness_chart,
+    Constants/pokemon_dex.py and the Paldea/Galar dex. Market value data is
+    read live from market_value_cache, which is already keyed by name.
+    """
+
+    __slots__ = (
+        "chart",
+        "chart_key_by_dex",
+        "dex_by_name",
+        "rarity_lists",
+        "base_rarity_by_name",
+        "in_game_names",
+        "exclusive_names",
+    )
+
+    def __init__(self):
+        from Constants import pokemon_dex
+        from Constants.paldea_galar_dict import dex
+        from Constants.weakness_chart import weakness_chart
+
+        self.chart = weakness_chart  # lazily loaded WeaknessChart mapping
+
+        # First chart entry per dex wins, matching the old linear scans
+        self.chart_key_by_dex: dict[int, str] = {}
+        for name, dex_number in weakness_chart.dex_items():
+            try:
+                self.chart_key_by_dex.setdefault(int(dex_number), name)
+            except (TypeError, ValueError):
+                continue
+
+        self.dex_by_name: dict[str, int] = {}
+        for num, name in dex.items():
+            self.dex_by_name.setdefault(name, num)
+
+        self.rarity_lists: dict[str, frozenset[str]] = {
+            "common": frozenset(pokemon_dex.common_mons),
+            "uncommon": frozenset(pokemon_dex.uncommon_mons),
+            "rare": frozenset(pokemon_dex.rare_mons),
+            "superrare": frozenset(pokemon_dex.superrare_mons),
+            "legendary": frozenset(pokemon_dex.legendary_mons),
+            "mega": frozenset(pokemon_dex.mega_mons),
+            "gigantamax": frozenset(pokemon_dex.gigantamax_mons),
+            "shiny": frozenset(pokemon_dex.shiny_mons),
+            "shiny mega": frozenset(pokemon_dex.shiny_mega_mons),
+            "shiny gigantamax": frozenset(pokemon_dex.shiny_gigantamax_mons),
+            "golden": frozenset(pokemon_dex.golden_mons),
+            "exclusive": frozenset(pokemon_dex.exclusive_mons),
+        }
+
+        self.base_rarity_by_name: dict[str, str] = {}
+        for rarity in BASE_RARITY_LISTS:
+            for name in self.rarity_lists[rarity]:
+                self.base_rarity_by_name.setdefault(name, rarity)
+
+        self.in_game_names: frozenset[str] = frozenset().union(
+            *self.rarity_lists.values()
+        )
+        self.exclusive_names = self.rarity_lists["exclusive"]
+
+    # ── Chart lookups ──
+    def chart_entry(self, name: str) -> dict | None:
+        return self.chart.get(name)
+
+    def chart_key_for_dex(self, dex_number: int) -> str | None:
+        return self.chart_key_by_dex.get(dex_number)
+
+    def split_dex(self, dex_text: str) -> tuple[str, int]:
+        """
+        Splits a dex string into (prefix, base dex) using PokeMeow's offsets:
+        4-digit 1xxx is Shiny, 9xxx is Golden, anything else is used as-is.
+        """
+        if len(dex_text) > 3 and dex_text[0] == "9":
+            return "Golden ", int(dex_text[1:])
+        if len(dex_text) > 3 and dex_text[0] == "1":
+            return "Shiny ", int(dex_text[1:])
+        return "", int(dex_text)
+
+    @staticmethod
+    def apply_dex_offset(prefix: str, chart_dex: int) -> int:
+        if chart_dex >= FORM_DEX_START:
+            return chart_dex  # already a form, skip Shiny/Golden offsets
+        if prefix == "Shiny ":
+            return chart_dex + SHINY_DEX_OFFSET
+        if prefix == "Golden ":
+            return chart_dex + GOLDEN_DEX_OFFSET
+        return chart_dex
+
+    # ── Name lookups ──
+    def dex_for_name(self, name: str) -> int | None:
+        return self.dex_by_name.get(name)
+
+    def market_dex_for_name(self, name: str) -> int:
+        data = market_value_cache.get(name.lower())
+        return data.get("dex_number", 0) if data else 0
+
+    # ── Rarity list membership ──
+    def in_rarity(self, name: str, rarity: str) -> bool:
+        return name in self.rarity_lists.get(rarity, ())
+
+    def base_rarity(self, name: str) -> str | None:
+        return self.base_rarity_by_name.get(name)
+
+    def is_in_game(self, name: str) -> bool:
+        return name in self.in_game_names
+
+    def is_exclusive(self, name: str) -> bool:
+        return name in self.exclusive_names
+
+
+_pokemon_catalog: PokemonCatalog | None = None
+
+
+def get_pokemon_catalog() -> PokemonCatalog:
+    """Returns the catalog, building it on first use."""
+    global _pokemon_catalog
+    if _pokemon_catalog is None:
+        _pokemon_catalog = PokemonCatalog()
+    return _pokemon_catalog
+
+
+def load_pokemon_catalog() -> PokemonCatalog:
+    """Builds the catalog at startup so the first command doesn't pay for it."""
+    catalog = get_pokemon_catalog()
+    pretty_log(
+        message=f"✅ Pokémon catalog ready: {len(catalog.chart)} chart entries, "
+        f"{len(catalog.chart_key_by_dex)} dex numbers, {len(catalog.in_game_names)} in-game names.",
+        tag="cache",
+    )
+    return catalog
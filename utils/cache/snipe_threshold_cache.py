@@ -0,0 +1,107 @@
+import statistics
+
+from utils.logs.pretty_log import pretty_log
+
+from .cache_list import market_value_cache
+from .market_price_history_cache import market_price_windows
+
+# 🍩────────────────────────────────────────────
+#        💤 Adaptive Snipe Thresholds
+# 🍩────────────────────────────────────────────
+# The adaptive threshold only ever tightens the old fixed rule: a listing must
+# be a snipe under both, so Pokémon with noisy prices stop pinging on ordinary
+# dips, and stable ones behave exactly as before.
+DEFAULT_SNIPE_DISCOUNT = 0.7  # the old fixed "30% below lowest market" rule
+MIN_SNIPE_DISCOUNT = 0.5
+MAX_SNIPE_DISCOUNT = DEFAULT_SNIPE_DISCOUNT  # never looser than the fixed rule
+MIN_PRICE_SAMPLES = 20  # p5 of fewer samples is just the minimum listing
+DISCOUNT_PERCENTILE = 5  # a snipe has to undercut 95% of recent listings
+
+snipe_threshold_cache: dict[str, int] = {}
+# Structure:
+# snipe_threshold_cache = {
+#     "pikachu": 3500,  # listed_price <= this is a snipe
+# }
+
+rarity_discount_cache: dict[str, float] = {}
+# Structure:
+# rarity_discount_cache = {
+#     "shiny": 0.72,
+# }
+
+
+def _percentile(ordered: list[int], pct: float) -> int:
+    return ordered[round(pct / 100 * (len(ordered) - 1))]
+
+
+def _compute_snipe_thresholds() -> tuple[dict[str, int], dict[str, float]]:
+    medians: dict[str, int] = {}
+    ratios_by_rarity: dict[str, list[float]] = {}
+
+    for name, window in list(market_price_windows.items()):
+        if len(window) < MIN_PRICE_SAMPLES:
+            continue
+        ordered = sorted(list(window.values()))
+        median = _percentile(ordered, 50)
+        if median <= 0:
+            continue
+        medians[name] = median
+        rarity = market_value_cache.get(name, {}).get("rarity") or "unknown"
+        ratios_by_rarity.setdefault(rarity, []).append(
+            _percentile(ordered, DISCOUNT_PERCENTILE) / median
+        )
+
+    discounts = {
+        rarity: min(
+            MAX_SNIPE_DISCOUNT, max(MIN_SNIPE_DISCOUNT, statistics.median(ratios))
+        )
+        for rarity, ratios in ratios_by_rarity.items()
+    }
+
+    thresholds = {}
+    for name, median in medians.items():
+        rarity = market_value_cache.get(name, {}).get("rarity") or "unknown"
+        thresholds[name] = int(median * discounts.get(rarity, DEFAULT_SNIPE_DISCOUNT))
+    return thresholds, discounts
+
+
+async def recompute_snipe_thresholds():
+    """
+    Rebuilds every per-Pokémon snipe threshold from the rolling price windows.
+
+    For each rarity, the discount is the median of (p5 / median) across its
+    Pokémon, clamped to [MIN_SNIPE_DISCOUNT, MAX_SNIPE_DISCOUNT]. A Pokémon's
+    threshold is its median recent price times its rarity's discount. Async so
+    the scheduler runs it on the event loop, where the price windows are
+    written; there is no await inside, so the table swap is atomic.
+    """
+    thresholds, discounts = _compute_snipe_thresholds()
+
+    snipe_threshold_cache.clear()
+    snipe_threshold_cache.update(thresholds)
+    rarity_discount_cache.clear()
+    rarity_discount_cache.update(discounts)
+
+    pretty_log(
+        message=f"✅ Recomputed snipe thresholds for {len(thresholds)} Pokémon across {len(discounts)} rarities.",
+        tag="cache",
+    )
+
+
+def fetch_snipe_threshold(pokemon_name: str) -> int | None:
+    """Returns the max price that counts as a snipe, or None without enough history."""
+    return snipe_threshold_cache.get(pokemon_name.lower())
+
+
+def is_snipe_price(pokemon_name: str, listed_price: int, lowest_market: int) -> bool:
+    """
+    The fixed 30%-below-lowest-market rule, tightened by the adaptive threshold
+    when the Pokémon has enough price history. Without a lowest market only the
+    adaptive threshold applies; with neither, it is not a snipe.
+    """
+    threshold = snipe_threshold_cache.get(pokemon_name.lower())
+    if threshold is not None and listed_price > threshold:
+        return False
+    if lowest_market > 0:
+        return listed_price <= lowest_market * DEFAULT_SNIPE_DISCOUNT
+    return threshold is not None
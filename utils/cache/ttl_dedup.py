@@ -0,0 +1,121 @@
+import json
+import os
+import time
+from collections import OrderedDict
+
+from utils.logs.pretty_log import pretty_log
+
+
+# 🍩────────────────────────────────────────────
+#        💤 Time-windowed Dedup Store
+# 🍩────────────────────────────────────────────
+class TTLDedupStore:
+    """
+    Set-like store of recently seen IDs with a TTL and a hard size cap.
+
+    Entries are kept in insertion order, so the oldest ones are evicted first,
+    either when they outlive ttl_seconds or when max_size is exceeded. Memory
+    stays bounded and there is never a bulk wipe that would let a replayed
+    listing through.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, max_size: int):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()  # id -> first seen (unix time)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item) -> bool:
+        self._expire(time.time())
+        if item in self._entries:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def add(self, item):
+        now = time.time()
+        self._expire(now)
+        if item in self._entries:
+            return
+        self._entries[item] = now
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, item):
+        self._entries.pop(item, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def _expire(self, now: float):
+        cutoff = now - self.ttl_seconds
+        entries = self._entries
+        while entries:
+            oldest, seen_at = next(iter(entries.items()))
+            if seen_at >= cutoff:
+                break
+            del entries[oldest]
+            self.evictions += 1
+
+    def expire(self):
+        """Drop every entry older than the TTL."""
+        self._expire(time.time())
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    # -------------------- 💾 Persistence --------------------
+    def save(self, path: str, last_n: int | None = None):
+        """Writes the newest last_n entries (all by default) to a JSON file."""
+        self.expire()
+        items = list(self._entries.items())
+        if last_n is not None:
+            items = items[-last_n:]
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(items, f)
+        os.replace(tmp, path)
+
+    def load(self, path: str) -> int:
+        """Restores entries written by save, skipping ones already past the TTL."""
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                items = json.load(f)
+        except Exception as e:
+            pretty_log(
+                message=f"⚠️ Could not read dedup store '{self.name}' from {path}: {e}",
+                tag="cache",
+            )
+            return 0
+
+        cutoff = time.time() - self.ttl_seconds
+        loaded = 0
+        for item, seen_at in items:
+            if seen_at >= cutoff and item not in self._entries:
+                self._entries[item] = seen_at
+                loaded += 1
+        # Keep oldest-first ordering after merging with anything seen before load
+        self._entries = OrderedDict(
+            sorted(self._entries.items(), key=lambda entry: entry[1])
+        )
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return loaded
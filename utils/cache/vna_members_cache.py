@@ -32,6 +32,7 @@ async def load_vna_members_cache(bot):
 
     except Exception as e:
         pretty_log("error", f"Error loading vna_members cache: {e}")
+        raise e
 
     return vna_members_cache
 
@@ -183,6 +183,44 @@ async def add_to_monthly_and_total_donations(
         )
 
 
+async def add_donation(
+    bot: discord.Client, user_id: int, user_name: str, amount: int
+) -> dict | None:
+    """
+    Atomically adds a donation to a user's total and monthly donations,
+    creating their record if needed, and returns the updated record (new
+    totals plus monthly donator/streak/permanent state). Returns None on error.
+    """
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            record = await conn.fetchrow(
+                """
+                INSERT INTO donations (user_id, user_name, total_donations, monthly_donations)
+                VALUES ($1, $2, $3, $3)
+                ON CONFLICT (user_id) DO UPDATE
+                SET user_name = EXCLUDED.user_name,
+                    total_donations = COALESCE(donations.total_donations, 0) + EXCLUDED.total_donations,
+                    monthly_donations = COALESCE(donations.monthly_donations, 0) + EXCLUDED.monthly_donations
+                RETURNING *
+                """,
+                user_id,
+                user_name,
+                amount,
+            )
+            pretty_log(
+                message=f"✅ Added donation of {amount} for user: {user_name} (ID: {user_id})",
+                tag="db",
+            )
+            return dict(record)
+    except Exception as e:
+        pretty_log(
+            message=f"❌ Failed to add donation for user: {user_name} (ID: {user_id}): {e}",
+            tag="error",
+            include_trace=True,
+        )
+        return None
+
+
 async def increment_monthly_donator_streak(bot: discord.Client, user_id: int):
     """Increment the monthly donator streak for a user."""
     try:
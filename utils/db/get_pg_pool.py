@@ -1,13 +1,107 @@
 import os
+import random
+import secrets
 import ssl
+import time
 import asyncio
 import asyncpg
 from asyncpg.pool import Pool
+from utils.db.query_profiler import ProfiledConnection, record_pool_wait
 from utils.logs.pretty_log import pretty_log
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Tags this process's connections so the cache invalidation triggers can tell
+# our own writes apart from other bots' (see utils/cache/cache_invalidation.py)
+DB_APPLICATION_NAME = f"vna-bot-{secrets.token_hex(4)}"
+
+
+# -------------------- [💙 POOL SETTINGS] --------------------
+DEFAULT_COMMAND_TIMEOUT = 30.0  # seconds per statement unless a call passes timeout=
+DEFAULT_ACQUIRE_TIMEOUT = 10.0  # seconds to wait for a free pool connection
+CONNECT_TIMEOUT = 10.0  # seconds to open one new connection
+POOL_CLOSE_TIMEOUT = 5.0  # grace period before a replaced pool is terminated
+
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive connection failures before opening
+CIRCUIT_OPEN_SECONDS = 15.0  # how long to fail fast before letting a probe through
+
+# Errors that mean the connection (or the server) is gone, not that the query was bad.
+# asyncio.TimeoutError is TimeoutError, an OSError subclass on 3.11+, so timeouts
+# must be handled before these: a slow statement or a busy pool is not an outage.
+CONNECTION_ERRORS = (
+    asyncpg.exceptions.ConnectionDoesNotExistError,
+    asyncpg.exceptions.ConnectionFailureError,
+    asyncpg.exceptions.CannotConnectNowError,
+    ConnectionResetError,
+    OSError,
+)
+
+
+class DatabaseUnavailableError(ConnectionError):
+    """Raised without touching the DB while the circuit breaker is open."""
+
+
+# -------------------- [💛 CIRCUIT BREAKER] --------------------
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive connection failures and fails
+    fast for `open_seconds`. After that a single probe is let through; its
+    success closes the breaker, its failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._probe_started: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow_request(self) -> bool:
+        if self.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < self.open_seconds:
+            return False
+        # Half-open: one probe at a time; a probe that never reports back
+        # (e.g. cancelled) expires after another open period
+        if self._probe_started is not None and now - self._probe_started < self.open_seconds:
+            return False
+        self._probe_started = now
+        return True
+
+    def record_success(self):
+        if self.opened_at is not None:
+            pretty_log(tag="db", message="Postgres reachable again, circuit closed.")
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started = None
+
+    def record_failure(self):
+        self.failures += 1
+        self._probe_started = None
+        if self.failures < self.failure_threshold:
+            return
+        if self.opened_at is None:
+            pretty_log(
+                tag="critical",
+                message=f"Postgres circuit opened after {self.failures} connection failures; "
+                f"failing fast for {self.open_seconds:.0f}s.",
+                include_trace=False,
+            )
+        self.opened_at = time.monotonic()
+
 
 # -------------------- [💙 SAFE POOL WRAPPER WITH RETRY] --------------------
 class SafePool:
@@ -18,61 +112,178 @@ class SafePool:
         min_size=1,
         max_size=10,
         retry_count=3,
+        command_timeout: float = DEFAULT_COMMAND_TIMEOUT,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
     ):
         self.dsn = dsn
         self.ssl_context = ssl_context
         self.min_size = min_size
         self.max_size = max_size
         self.retry_count = retry_count
+        self.command_timeout = command_timeout
+        self.acquire_timeout = acquire_timeout
+        self.breaker = CircuitBreaker()
         self._pool: Pool | None = None
+        self._generation = 0  # bumped on every reconnect attempt
+        self._reconnect_lock = asyncio.Lock()
+        self._reconnect_failures = 0
+        # Keep references so closing replaced pools are not garbage collected
+        self._close_tasks: set[asyncio.Task] = set()
 
-    async def connect(self):
-        self._pool = await asyncpg.create_pool(
+    async def _create_pool(self) -> Pool:
+        return await asyncpg.create_pool(
             dsn=self.dsn,
             ssl=self.ssl_context,
             min_size=self.min_size,
             max_size=self.max_size,
+            timeout=CONNECT_TIMEOUT,
+            # Client-side default for every statement; a call's own timeout= wins
+            command_timeout=self.command_timeout,
+            server_settings={
+                "application_name": DB_APPLICATION_NAME,
+                # Server-side backstop in case the client goes away mid-query;
+                # long maintenance queries raise it per transaction (SET LOCAL)
+                "statement_timeout": str(int(self.command_timeout * 1000)),
+            },
         )
 
-    def acquire(self):
+    async def connect(self):
+        self._pool = await self._create_pool()
+
+    def acquire(self, timeout: float | None = None):
         if not self._pool:
             raise RuntimeError("SafePool not connected. Call connect() first.")
-        return SafeConnection(self._pool)
+        return SafeConnection(self, timeout)
+
+    def stats(self) -> dict:
+        """Connection counts for the current pool plus breaker state."""
+        pool = self._pool
+        size = pool.get_size() if pool else 0
+        idle = pool.get_idle_size() if pool else 0
+        return {
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "max_size": self.max_size,
+            "circuit_open": self.breaker.is_open,
+            "reconnects": self._generation,
+        }
+
+    def _check_circuit(self):
+        if not self.breaker.allow_request():
+            raise DatabaseUnavailableError(
+                "Postgres is unavailable (circuit open); not waiting for a connection."
+            )
+
+    async def _acquire(self, timeout: float | None = None):
+        """
+        Acquires a raw connection, returning it with the pool it belongs to.
+        A connection failure triggers one (single-flight) reconnect and retry;
+        acquiring is safe to retry since nothing has run yet.
+        """
+        for attempt in range(2):
+            self._check_circuit()
+            pool, generation = self._pool, self._generation
+            wait_started = time.perf_counter()
+            try:
+                conn = await pool.acquire(timeout=timeout or self.acquire_timeout)
+                record_pool_wait(wait_started)
+                return conn, pool
+            except asyncio.TimeoutError:
+                # No free connection in time: the pool is saturated, which says
+                # nothing about the server, so neither the breaker nor a reconnect
+                raise
+            except CONNECTION_ERRORS:
+                self.breaker.record_failure()
+                if attempt:
+                    raise
+                await self._reconnect(generation)
+
+    def _record_outcome(self, exc: BaseException | None):
+        """
+        Called by ProfiledConnection for each statement, so only errors raised
+        by asyncpg count; whatever else fails inside an acquire() block doesn't.
+        """
+        if isinstance(exc, asyncio.TimeoutError):
+            return  # command_timeout: the statement was slow, the server may be fine
+        if isinstance(exc, CONNECTION_ERRORS):
+            self.breaker.record_failure()
+        elif exc is None or isinstance(exc, Exception):
+            # Any answer from the server (even an SQL error) means it's up
+            self.breaker.record_success()
 
     async def _retry(self, method, *args, **kwargs):
         last_exc = None
         for attempt in range(1, self.retry_count + 2):
+            generation = self._generation
             try:
                 async with self.acquire() as conn:
                     return await method(conn, *args, **kwargs)
-            except (
-                asyncpg.exceptions.ConnectionDoesNotExistError,
-                ConnectionResetError,
-                OSError,
-                asyncio.TimeoutError,  # <— added
-            ) as e:
+            except (DatabaseUnavailableError, asyncio.TimeoutError):
+                # Timeouts are not retried: the statement may still have run
+                raise
+            except CONNECTION_ERRORS as e:
                 last_exc = e
                 pretty_log(
                     tag="warn",
                     message=f"[Retry {attempt}/{self.retry_count + 1}] {method.__name__} failed: {e}. Reconnecting...",
                     include_trace=False,
                 )
-                await asyncio.sleep(0.5)
-                await self._reconnect()
+                if attempt <= self.retry_count:
+                    await self._reconnect(generation)
         raise last_exc
 
-    async def _reconnect(self):
-        if self._pool:
+    async def _reconnect(self, seen_generation: int):
+        """
+        Replaces the pool, once per failure: callers pass the generation they
+        failed on, and anyone queued behind the lock after an attempt was made
+        (successful or not) returns instead of reconnecting again. Attempts
+        back off exponentially with jitter.
+        """
+        async with self._reconnect_lock:
+            if self._generation != seen_generation:
+                return
+            self._generation += 1
+
+            delay = min(
+                RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2**self._reconnect_failures
+            )
+            await asyncio.sleep(random.uniform(delay / 2, delay))
             try:
-                await self._pool.close()
-            except Exception:
-                pass
-        self._pool = await asyncpg.create_pool(
-            dsn=self.dsn,
-            ssl=self.ssl_context,
-            min_size=self.min_size,
-            max_size=self.max_size,
-        )
+                new_pool = await self._create_pool()
+            except Exception as e:
+                self._reconnect_failures += 1
+                self.breaker.record_failure()
+                pretty_log(
+                    tag="warn",
+                    message=f"Postgres reconnect attempt {self._reconnect_failures} failed: {e}",
+                    include_trace=False,
+                )
+                return
+
+            old_pool, self._pool = self._pool, new_pool
+            self._reconnect_failures = 0
+            pretty_log(tag="db", message="Postgres pool reconnected.")
+            if old_pool:
+                # Connections still checked out get released to the old pool
+                task = asyncio.create_task(self._close_pool(old_pool))
+                self._close_tasks.add(task)
+                task.add_done_callback(self._close_tasks.discard)
+
+    @staticmethod
+    async def _close_pool(pool: Pool):
+        try:
+            await asyncio.wait_for(pool.close(), POOL_CLOSE_TIMEOUT)
+        except Exception:
+            pool.terminate()
+
+    async def close(self):
+        """Closes the current pool and waits for replaced pools still closing."""
+        if self._close_tasks:
+            await asyncio.gather(*self._close_tasks, return_exceptions=True)
+        pool, self._pool = self._pool, None
+        if pool:
+            await self._close_pool(pool)
 
     async def fetch(self, *args, **kwargs):
         return await self._retry(
@@ -96,13 +307,15 @@ class SafePool:
 
 # -------------------- [💜 SAFE CONNECTION CONTEXT] --------------------
 class SafeConnection:
-    def __init__(self, pool: Pool):
-        self.pool = pool
+    def __init__(self, safe_pool: SafePool, timeout: float | None = None):
+        self.safe_pool = safe_pool
+        self.timeout = timeout
+        self.pool: Pool | None = None
         self.conn = None
 
     async def __aenter__(self):
-        self.conn = await self.pool.acquire()
-        return self.conn
+        self.conn, self.pool = await self.safe_pool._acquire(self.timeout)
+        return ProfiledConnection(self.conn, self.safe_pool)
 
     async def __aexit__(self, exc_type, exc, tb):
         try:
@@ -0,0 +1,252 @@
+import asyncio
+import time
+from datetime import datetime
+
+import discord
+
+from utils.logs.market_trace import record_market_duration
+from utils.logs.pretty_log import pretty_log
+
+"""CREATE TABLE market_price_history (
+    id BIGSERIAL PRIMARY KEY,
+    pokemon_name TEXT NOT NULL,
+    listing_id TEXT,
+    listed_price BIGINT NOT NULL,
+    lowest_market BIGINT,
+    amount INT NOT NULL DEFAULT 1,
+    observed_at TIMESTAMP NOT NULL
+);
+CREATE INDEX market_price_history_name_time_idx
+    ON market_price_history (pokemon_name, observed_at DESC);
+
+CREATE TABLE market_price_history_daily (
+    pokemon_name TEXT NOT NULL,
+    day DATE NOT NULL,
+    min_price BIGINT NOT NULL,
+    median_price BIGINT NOT NULL,
+    max_price BIGINT NOT NULL,
+    listings INT NOT NULL,
+    PRIMARY KEY (pokemon_name, day)
+);"""
+
+# Startup and compaction scan the whole history table; these statements get
+# their own limit instead of the pool's 30s default (client and server side)
+MAINTENANCE_STATEMENT_TIMEOUT = 600  # seconds
+
+
+async def _set_maintenance_timeout(conn):
+    """Must run inside a transaction; SET LOCAL ends with it."""
+    await conn.execute(
+        f"SET LOCAL statement_timeout = {MAINTENANCE_STATEMENT_TIMEOUT * 1000}"
+    )
+
+
+# --------------------
+#  Batched history inserts
+# --------------------
+PRICE_HISTORY_FLUSH_INTERVAL = 5.0  # seconds
+PRICE_HISTORY_FLUSH_THRESHOLD = 200  # rows
+PRICE_HISTORY_MAX_PENDING = 20_000  # rows kept through failed flushes; oldest go first
+
+# (pokemon_name, listing_id, listed_price, lowest_market, amount, observed_at)
+_pending_price_history: list[tuple] = []
+_price_history_flush_task: asyncio.Task | None = None
+# Size-threshold flushes in flight; referenced so they can't be collected mid-flush
+_price_history_flush_tasks: set[asyncio.Task] = set()
+_price_history_flush_lock = asyncio.Lock()
+
+
+def queue_price_history(
+    bot: discord.Client,
+    pokemon_name: str,
+    listing_id: str,
+    listed_price: int,
+    lowest_market: int,
+    amount: int,
+):
+    """
+    Queues one observed listing for the append-only history table.
+    Rows are written in batches by flush_price_history_buffer.
+    """
+    global _price_history_flush_task
+
+    _pending_price_history.append(
+        (
+            pokemon_name.lower(),
+            listing_id,
+            listed_price,
+            lowest_market,
+            amount,
+            datetime.utcnow(),
+        )
+    )
+    # One threshold flush at a time: while the DB is failing, every queued
+    # listing would otherwise start another flush that waits on the lock
+    if (
+        len(_pending_price_history) >= PRICE_HISTORY_FLUSH_THRESHOLD
+        and not _price_history_flush_tasks
+    ):
+        task = asyncio.create_task(flush_price_history_buffer(bot))
+        _price_history_flush_tasks.add(task)
+        task.add_done_callback(_price_history_flush_tasks.discard)
+    elif _price_history_flush_task is None or _price_history_flush_task.done():
+        _price_history_flush_task = asyncio.create_task(
+            _delayed_price_history_flush(bot)
+        )
+
+
+async def wait_for_price_history_flushes():
+    """Waits for in-flight size-threshold flushes; used on shutdown."""
+    if _price_history_flush_tasks:
+        await asyncio.gather(*_price_history_flush_tasks, return_exceptions=True)
+
+
+async def _delayed_price_history_flush(bot: discord.Client):
+    await asyncio.sleep(PRICE_HISTORY_FLUSH_INTERVAL)
+    await flush_price_history_buffer(bot)
+
+
+async def flush_price_history_buffer(bot: discord.Client) -> int:
+    """
+    Inserts every queued history row in one statement.
+    Returns the number of rows written.
+    """
+    async with _price_history_flush_lock:
+        if not _pending_price_history:
+            return 0
+        batch = list(_pending_price_history)
+        _pending_price_history.clear()
+
+        started = time.perf_counter()
+        try:
+            async with bot.pg_pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    INSERT INTO market_price_history (
+                        pokemon_name, listing_id, listed_price, lowest_market, amount, observed_at
+                    )
+                    SELECT * FROM unnest(
+                        $1::text[], $2::text[], $3::bigint[], $4::bigint[], $5::int[], $6::timestamp[]
+                    )
+                    """,
+                    *(list(column) for column in zip(*batch)),
+                )
+        except Exception as e:
+            # Keep the rows for the next flush, up to PRICE_HISTORY_MAX_PENDING
+            _pending_price_history[:0] = batch
+            dropped = len(_pending_price_history) - PRICE_HISTORY_MAX_PENDING
+            if dropped > 0:
+                del _pending_price_history[:dropped]
+            pretty_log(
+                tag="error",
+                message=f"Failed to flush {len(batch)} market price history rows: {e}"
+                + (f" (dropped {dropped} oldest queued rows)" if dropped > 0 else ""),
+            )
+            return 0
+
+        record_market_duration("db_flush", started)
+        return len(batch)
+
+
+# --------------------
+#  Fetch recent history
+# --------------------
+async def fetch_recent_price_history(bot: discord.Client, per_pokemon: int = 256):
+    """
+    Returns the newest per_pokemon rows for every Pokémon, oldest first.
+    """
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            async with conn.transaction():
+                await _set_maintenance_timeout(conn)
+                rows = await conn.fetch(
+                    """
+                    SELECT pokemon_name, listed_price, observed_at FROM (
+                        SELECT pokemon_name, listed_price, observed_at,
+                            ROW_NUMBER() OVER (
+                                PARTITION BY pokemon_name ORDER BY observed_at DESC
+                            ) AS rn
+                        FROM market_price_history
+                    ) recent
+                    WHERE rn <= $1
+                    ORDER BY observed_at ASC
+                    """,
+                    per_pokemon,
+                    timeout=MAINTENANCE_STATEMENT_TIMEOUT,
+                )
+            return rows
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            message=f"Failed to fetch recent market price history: {e}",
+        )
+        return []
+
+
+# --------------------
+#  Compact old history
+# --------------------
+async def compact_market_price_history(
+    bot: discord.Client, keep_raw_days: int = 14, keep_daily_days: int = 365
+):
+    """
+    Downsamples raw history older than keep_raw_days into one daily
+    min/median/max row per Pokémon, then deletes the compacted raw rows and
+    any daily rows older than keep_daily_days.
+    """
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            async with conn.transaction():
+                await _set_maintenance_timeout(conn)
+                await conn.execute(
+                    """
+                    INSERT INTO market_price_history_daily (
+                        pokemon_name, day, min_price, median_price, max_price, listings
+                    )
+                    SELECT pokemon_name,
+                        observed_at::date,
+                        MIN(listed_price),
+                        PERCENTILE_DISC(0.5) WITHIN GROUP (ORDER BY listed_price),
+                        MAX(listed_price),
+                        COUNT(*)
+                    FROM market_price_history
+                    WHERE observed_at < (NOW() AT TIME ZONE 'UTC')::date - $1::int
+                    GROUP BY pokemon_name, observed_at::date
+                    ON CONFLICT (pokemon_name, day) DO UPDATE SET
+                        min_price = LEAST(market_price_history_daily.min_price, EXCLUDED.min_price),
+                        median_price = EXCLUDED.median_price,
+                        max_price = GREATEST(market_price_history_daily.max_price, EXCLUDED.max_price),
+                        listings = market_price_history_daily.listings + EXCLUDED.listings
+                    """,
+                    keep_raw_days,
+                    timeout=MAINTENANCE_STATEMENT_TIMEOUT,
+                )
+                deleted_raw = await conn.execute(
+                    """
+                    DELETE FROM market_price_history
+                    WHERE observed_at < (NOW() AT TIME ZONE 'UTC')::date - $1::int
+                    """,
+                    keep_raw_days,
+                    timeout=MAINTENANCE_STATEMENT_TIMEOUT,
+                )
+                deleted_daily = await conn.execute(
+                    """
+                    DELETE FROM market_price_history_daily
+                    WHERE day < (NOW() AT TIME ZONE 'UTC')::date - $1::int
+                    """,
+                    keep_daily_days,
+                    timeout=MAINTENANCE_STATEMENT_TIMEOUT,
+                )
+
+        pretty_log(
+            tag="db",
+            message=f"Compacted market price history: {deleted_raw.split()[-1]} raw rows downsampled, "
+            f"{deleted_daily.split()[-1]} expired daily rows removed",
+        )
+        return True
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            message=f"Failed to compact market price history: {e}",
+        )
+        return False
@@ -1,7 +1,9 @@
 # 🟣────────────────────────────────────────────
 #        Market Value DB Functions for Mew (bot.pg_pool)
 # 🟣────────────────────────────────────────────
+import asyncio
 import re
+import time
 from datetime import datetime
 
 import discord
@@ -9,6 +11,7 @@ from discord import app_commands
 
 from utils.cache.cache_list import market_value_cache, pokemon_list_cache
 from utils.logs.debug_log import debug_log, enable_debug
+from utils.logs.market_trace import record_market_duration
 from utils.logs.pretty_log import pretty_log
 
 
@@ -155,44 +158,167 @@ def build_pokemon_list_from_cache():
     return pokemon_list_cache
 
 
-async def update_rarity(bot, pokemon_name: str, rarity: str):
+# --------------------
+#  Field-diff updates
+# --------------------
+# Columns apply_market_value_diff may set. Listing/price columns go through the
+# write-behind buffer instead.
+MARKET_VALUE_DIFF_FIELDS = ("dex_number", "is_exclusive", "image_link", "rarity")
+
+
+def market_value_cache_entry(row) -> dict:
+    """Cache entry for a market_value row (a Record or a plain dict)."""
+    return {
+        "pokemon": row["pokemon_name"],
+        "dex_number": row["dex_number"],
+        "is_exclusive": row.get("is_exclusive", False),
+        "lowest_market": row["lowest_market"],
+        "current_listing": row["current_listing"],
+        "true_lowest": row["true_lowest"],
+        "listing_seen": row["listing_seen"],
+        "image_link": row.get("image_link", None),
+        "rarity": row.get("rarity", "unknown"),
+    }
+
+
+def _market_value_diff_sql(fields: tuple[str, ...], insert_if_missing: bool) -> str:
     """
-    Update the rarity for a Pokémon in the market value table.
+    One statement per field combination, so the text (and asyncpg's prepared
+    statement) is reused. $1 is the name, then one param per field, then
+    last_updated.
+    """
+    params = [f"${i}" for i in range(2, len(fields) + 3)]
+    if insert_if_missing:
+        columns = ", ".join(("pokemon_name",) + fields + ("last_updated",))
+        updates = ", ".join(
+            f"{field} = EXCLUDED.{field}" for field in fields + ("last_updated",)
+        )
+        return (
+            f"INSERT INTO market_value ({columns}) VALUES ($1, {', '.join(params)}) "
+            f"ON CONFLICT (pokemon_name) DO UPDATE SET {updates} RETURNING *"
+        )
+    updates = ", ".join(
+        f"{field} = {param}"
+        for field, param in zip(fields + ("last_updated",), params)
+    )
+    return f"UPDATE market_value SET {updates} WHERE pokemon_name = $1 RETURNING *"
+
+
+async def apply_market_value_diff(
+    bot, pokemon_name: str, diff: dict, insert_if_missing: bool = False
+) -> dict | None:
+    """
+    Applies a partial update (any of MARKET_VALUE_DIFF_FIELDS) to a Pokémon's
+    market value in one statement and refreshes market_value_cache from the
+    returned row.
+
+    Fields that already match the cache are dropped, and if nothing is left
+    the DB isn't touched at all. Without insert_if_missing, a Pokémon with no
+    market_value row is skipped. Returns the cache entry, or None if skipped
+    or on error.
     """
     pokemon_name = pokemon_name.lower()
+    unknown = set(diff) - set(MARKET_VALUE_DIFF_FIELDS)
+    if unknown:
+        raise ValueError(f"Unsupported market value fields: {', '.join(sorted(unknown))}")
+
+    cached = market_value_cache.get(pokemon_name)
+    if cached is not None:
+        diff = {
+            field: value
+            for field, value in diff.items()
+            if field not in cached or cached[field] != value
+        }
+        if not diff:
+            return cached
+
+    fields = tuple(field for field in MARKET_VALUE_DIFF_FIELDS if field in diff)
     try:
         async with bot.pg_pool.acquire() as conn:
-            # Only update if row exists
             row = await conn.fetchrow(
-                "SELECT pokemon_name FROM market_value WHERE pokemon_name = $1",
+                _market_value_diff_sql(fields, insert_if_missing),
                 pokemon_name,
-            )
-            if not row:
-                pretty_log(
-                    tag="db",
-                    message=f"No market value row found for {pokemon_name}, skipping rarity update.",
-                )
-                return
-            await conn.execute(
-                "UPDATE market_value SET rarity = $1, last_updated = $2 WHERE pokemon_name = $3",
-                rarity,
+                *(diff[field] for field in fields),
                 datetime.utcnow(),
-                pokemon_name,
             )
-            # Update in cache as well
-            if pokemon_name in market_value_cache:
-                market_value_cache[pokemon_name]["rarity"] = rarity
-
+    except Exception as e:
         pretty_log(
-            tag="db",
-            message=f"Updated rarity for {pokemon_name} to {rarity}",
+            tag="error",
+            message=f"Failed to update {', '.join(fields)} for {pokemon_name}: {e}",
         )
+        return None
 
-    except Exception as e:
+    if row is None:
         pretty_log(
-            tag="error",
-            message=f"Failed to update rarity for {pokemon_name}: {e}",
+            tag="db",
+            message=f"No market value row found for {pokemon_name}, skipping {', '.join(fields)} update.",
         )
+        return None
+
+    if cached is not None:
+        # Only take the diffed columns: listing columns in the cache may be
+        # newer than the DB while the write-behind buffer is pending
+        for field in fields:
+            cached[field] = row[field]
+    else:
+        cached = market_value_cache[pokemon_name] = market_value_cache_entry(row)
+
+    pretty_log(
+        tag="db",
+        message=f"Updated {pokemon_name}: "
+        + ", ".join(f"{field}={diff[field]}" for field in fields),
+    )
+    return cached
+
+
+async def update_rarity(bot, pokemon_name: str, rarity: str):
+    """
+    Update the rarity for a Pokémon in the market value table.
+    """
+    await apply_market_value_diff(bot, pokemon_name, {"rarity": rarity})
+
+
+async def update_dex_number(bot, pokemon_name: str, dex_number: int):
+    """
+    Update the dex number for a Pokémon in the market value table.
+    """
+    await apply_market_value_diff(bot, pokemon_name, {"dex_number": dex_number})
+
+
+async def upsert_image_link(
+    bot, pokemon_name: str, image_link: str, is_exclusive: bool = None
+):
+    """
+    Upsert the image link for a Pokémon in the market value table.
+    """
+    diff = {"image_link": image_link}
+    if is_exclusive is not None:
+        diff["is_exclusive"] = is_exclusive
+    await apply_market_value_diff(bot, pokemon_name, diff, insert_if_missing=True)
+
+
+async def update_image_link(
+    bot, pokemon_name: str, image_link: str, is_exclusive: bool = None
+):
+    """
+    Update the image link for a Pokémon in the market value table.
+    """
+    diff = {"image_link": image_link}
+    if is_exclusive is not None:
+        diff["is_exclusive"] = is_exclusive
+    await apply_market_value_diff(bot, pokemon_name, diff)
+
+
+async def update_is_exclusive(
+    bot, pokemon_name: str, is_exclusive: bool, image_link: str = None
+):
+    """
+    Update the is_exclusive field for a Pokémon in the market value table.
+    """
+    diff = {"is_exclusive": is_exclusive}
+    if image_link is not None:
+        diff["image_link"] = image_link
+    await apply_market_value_diff(bot, pokemon_name, diff)
 
 
 def fetch_rarity_cache(pokemon_name: str):
@@ -371,6 +497,182 @@ async def set_market_value(
         )
 
 
+# --------------------
+#  Write-behind market value buffer
+# --------------------
+MARKET_VALUE_FLUSH_INTERVAL = 2.0  # seconds a queued row may wait before flushing
+MARKET_VALUE_FLUSH_THRESHOLD = 100  # flush immediately once this many names are queued
+
+# Structure:
+# _pending_market_values = {
+#     "pikachu": {
+#         "dex_number": 25,
+#         "is_exclusive": False,
+#         "lowest_market": 5000,
+#         "current_listing": 4500,
+#         "true_lowest": 4000,
+#         "listing_seen": "5 minutes ago",
+#         "image_link": "https://...",
+#         "last_updated": datetime,
+#         "rarity": "common",
+#     },
+# }
+_pending_market_values: dict[str, dict] = {}
+_market_value_flush_task: asyncio.Task | None = None
+# Size-threshold flushes in flight; referenced so they can't be collected mid-flush
+_market_value_flush_tasks: set[asyncio.Task] = set()
+_market_value_flush_lock = asyncio.Lock()
+
+
+def _merge_pending_market_value(old: dict, new: dict) -> dict:
+    """
+    Coalesce two queued rows for the same Pokémon the same way the upsert would:
+    plain columns take the newest value, true_lowest keeps the minimum and the
+    nullable columns only overwrite when the newer value is not None.
+    """
+    merged = dict(new)
+    merged["true_lowest"] = min(old["true_lowest"], new["true_lowest"])
+    for column in ("listing_seen", "image_link", "rarity"):
+        if new[column] is None:
+            merged[column] = old[column]
+    return merged
+
+
+def queue_market_value(
+    bot,
+    pokemon_name: str,
+    dex_number: int,
+    is_exclusive: bool = False,
+    lowest_market: int = 0,
+    current_listing: int = 0,
+    true_lowest: int = 0,
+    listing_seen: str | None = None,
+    image_link: str = None,
+    rarity: str = "unknown",
+):
+    """
+    Queue a market value upsert instead of writing it inline.
+    Rows are coalesced per Pokémon and written by flush_market_value_buffer,
+    either after MARKET_VALUE_FLUSH_INTERVAL or once MARKET_VALUE_FLUSH_THRESHOLD
+    names are pending.
+    """
+    global _market_value_flush_task
+
+    key = pokemon_name.lower()
+    row = {
+        "dex_number": dex_number,
+        "is_exclusive": is_exclusive,
+        "lowest_market": lowest_market,
+        "current_listing": current_listing,
+        "true_lowest": true_lowest,
+        "listing_seen": listing_seen,
+        "image_link": image_link,
+        "last_updated": datetime.utcnow(),
+        "rarity": rarity,
+    }
+    existing = _pending_market_values.get(key)
+    _pending_market_values[key] = (
+        _merge_pending_market_value(existing, row) if existing else row
+    )
+
+    # One threshold flush at a time: after a failed flush the merged-back batch
+    # keeps the buffer over the threshold, and each listing would start another
+    if (
+        len(_pending_market_values) >= MARKET_VALUE_FLUSH_THRESHOLD
+        and not _market_value_flush_tasks
+    ):
+        task = asyncio.create_task(flush_market_value_buffer(bot))
+        _market_value_flush_tasks.add(task)
+        task.add_done_callback(_market_value_flush_tasks.discard)
+    elif _market_value_flush_task is None or _market_value_flush_task.done():
+        _market_value_flush_task = asyncio.create_task(
+            _delayed_market_value_flush(bot)
+        )
+
+
+async def wait_for_market_value_flushes():
+    """Waits for in-flight size-threshold flushes; used on shutdown."""
+    if _market_value_flush_tasks:
+        await asyncio.gather(*_market_value_flush_tasks, return_exceptions=True)
+
+
+async def _delayed_market_value_flush(bot):
+    await asyncio.sleep(MARKET_VALUE_FLUSH_INTERVAL)
+    await flush_market_value_buffer(bot)
+
+
+async def flush_market_value_buffer(bot) -> int:
+    """
+    Write every queued market value row in a single multi-row upsert.
+    Keeps the LEAST(true_lowest) / COALESCE semantics of set_market_value.
+    Returns the number of rows written.
+    """
+    async with _market_value_flush_lock:
+        if not _pending_market_values:
+            return 0
+
+        batch = dict(_pending_market_values)
+        _pending_market_values.clear()
+        names = list(batch)
+        rows = [batch[name] for name in names]
+
+        started = time.perf_counter()
+        try:
+            async with bot.pg_pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    INSERT INTO market_value (
+                        pokemon_name, dex_number, is_exclusive, lowest_market,
+                        current_listing, true_lowest, listing_seen, image_link, last_updated, rarity
+                    )
+                    SELECT * FROM unnest(
+                        $1::text[], $2::int[], $3::bool[], $4::bigint[], $5::bigint[],
+                        $6::bigint[], $7::text[], $8::text[], $9::timestamp[], $10::text[]
+                    )
+                    ON CONFLICT (pokemon_name) DO UPDATE SET
+                        dex_number = EXCLUDED.dex_number,
+                        is_exclusive = EXCLUDED.is_exclusive,
+                        lowest_market = EXCLUDED.lowest_market,
+                        current_listing = EXCLUDED.current_listing,
+                        true_lowest = LEAST(EXCLUDED.true_lowest, market_value.true_lowest),
+                        listing_seen = COALESCE(EXCLUDED.listing_seen, market_value.listing_seen),
+                        image_link = COALESCE(EXCLUDED.image_link, market_value.image_link),
+                        last_updated = EXCLUDED.last_updated,
+                        rarity = COALESCE(EXCLUDED.rarity, market_value.rarity)
+                    """,
+                    names,
+                    [row["dex_number"] for row in rows],
+                    [row["is_exclusive"] for row in rows],
+                    [row["lowest_market"] for row in rows],
+                    [row["current_listing"] for row in rows],
+                    [row["true_lowest"] for row in rows],
+                    [row["listing_seen"] for row in rows],
+                    [row["image_link"] for row in rows],
+                    [row["last_updated"] for row in rows],
+                    [row["rarity"] for row in rows],
+                )
+        except Exception as e:
+            # Put the batch back so the next flush retries it, without
+            # clobbering anything queued while this one was in flight.
+            for name, row in batch.items():
+                newer = _pending_market_values.get(name)
+                _pending_market_values[name] = (
+                    _merge_pending_market_value(row, newer) if newer else row
+                )
+            pretty_log(
+                tag="error",
+                message=f"Failed to flush {len(batch)} buffered market values: {e}",
+            )
+            return 0
+
+        record_market_duration("db_flush", started)
+        pretty_log(
+            tag="db",
+            message=f"Flushed {len(batch)} buffered market values",
+        )
+        return len(batch)
+
+
 def fetch_image_link_cache(pokemon_name: str):
     """
     Get image link for a Pokémon from cache.
@@ -527,170 +829,6 @@ async def update_market_value_via_listener(
         )
 
 
-async def update_dex_number(bot, pokemon_name: str, dex_number: int):
-    """
-    Update the dex number for a Pokémon in the market value table.
-    """
-    pokemon_name = pokemon_name.lower()
-    try:
-        async with bot.pg_pool.acquire() as conn:
-            # Only update if row exists
-            row = await conn.fetchrow(
-                "SELECT pokemon_name FROM market_value WHERE pokemon_name = $1",
-                pokemon_name,
-            )
-            if not row:
-                pretty_log(
-                    tag="db",
-                    message=f"No market value row found for {pokemon_name}, skipping dex number update.",
-                )
-                return
-            await conn.execute(
-                "UPDATE market_value SET dex_number = $1, last_updated = $2 WHERE pokemon_name = $3",
-                dex_number,
-                datetime.utcnow(),
-                pokemon_name,
-            )
-            # Update in cache as well
-            if pokemon_name in market_value_cache:
-                market_value_cache[pokemon_name]["dex_number"] = dex_number
-
-        pretty_log(
-            tag="db",
-            message=f"Updated dex number for {pokemon_name} to {dex_number}",
-        )
-
-    except Exception as e:
-        pretty_log(
-            tag="error",
-            message=f"Failed to update dex number for {pokemon_name}: {e}",
-        )
-
-
-async def upsert_image_link(
-    bot, pokemon_name: str, image_link: str, is_exclusive: bool = None
-):
-    """
-    Upsert the image link for a Pokémon in the market value table.
-    """
-    pokemon_name = pokemon_name.lower()
-    try:
-        async with bot.pg_pool.acquire() as conn:
-            if is_exclusive is not None:
-                await conn.execute(
-                    """
-                    INSERT INTO market_value (pokemon_name, image_link, last_updated, is_exclusive)
-                    VALUES ($1, $2, $3, $4)
-                    ON CONFLICT (pokemon_name) DO UPDATE SET
-                        image_link = $2,
-                        last_updated = $3,
-                        is_exclusive = $4
-                    """,
-                    pokemon_name,
-                    image_link,
-                    datetime.utcnow(),
-                    is_exclusive,
-                )
-            else:
-                await conn.execute(
-                    """
-                    INSERT INTO market_value (pokemon_name, image_link, last_updated)
-                    VALUES ($1, $2, $3)
-                    ON CONFLICT (pokemon_name) DO UPDATE SET
-                        image_link = $2,
-                        last_updated = $3
-                    """,
-                    pokemon_name,
-                    image_link,
-                    datetime.utcnow(),
-                )
-            # Update in cache as well
-            if pokemon_name in market_value_cache:
-                market_value_cache[pokemon_name]["image_link"] = image_link
-                if is_exclusive is not None:
-                    market_value_cache[pokemon_name]["is_exclusive"] = is_exclusive
-            else:
-                market_value_cache[pokemon_name] = {
-                    "pokemon": pokemon_name,
-                    "image_link": image_link,
-                    "is_exclusive": is_exclusive if is_exclusive is not None else False,
-                }
-
-        pretty_log(
-            tag="db",
-            message=f"Upserted image link for {pokemon_name}"
-            + (
-                f", is_exclusive set to {is_exclusive}"
-                if is_exclusive is not None
-                else ""
-            ),
-        )
-
-    except Exception as e:
-        pretty_log(
-            tag="error",
-            message=f"Failed to upsert image link for {pokemon_name}: {e}",
-        )
-
-
-async def update_image_link(
-    bot, pokemon_name: str, image_link: str, is_exclusive: bool = None
-):
-    """
-    Update the image link for a Pokémon in the market value table.
-    """
-    pokemon_name = pokemon_name.lower()
-    try:
-        async with bot.pg_pool.acquire() as conn:
-            # Only update if row exists
-            row = await conn.fetchrow(
-                "SELECT pokemon_name FROM market_value WHERE pokemon_name = $1",
-                pokemon_name,
-            )
-            if not row:
-                pretty_log(
-                    tag="db",
-                    message=f"No market value row found for {pokemon_name}, skipping image link update.",
-                )
-                return
-            if is_exclusive is not None:
-                await conn.execute(
-                    "UPDATE market_value SET image_link = $1, last_updated = $2, is_exclusive = $3 WHERE pokemon_name = $4",
-                    image_link,
-                    datetime.utcnow(),
-                    is_exclusive,
-                    pokemon_name,
-                )
-            else:
-                await conn.execute(
-                    "UPDATE market_value SET image_link = $1, last_updated = $2 WHERE pokemon_name = $3",
-                    image_link,
-                    datetime.utcnow(),
-                    pokemon_name,
-                )
-            # Update in cache as well
-            if pokemon_name in market_value_cache:
-                market_value_cache[pokemon_name]["image_link"] = image_link
-                if is_exclusive is not None:
-                    market_value_cache[pokemon_name]["is_exclusive"] = is_exclusive
-
-        pretty_log(
-            tag="db",
-            message=f"Updated image link for {pokemon_name}"
-            + (
-                f", is_exclusive set to {is_exclusive}"
-                if is_exclusive is not None
-                else ""
-            ),
-        )
-
-    except Exception as e:
-        pretty_log(
-            tag="error",
-            message=f"Failed to update image link for {pokemon_name}: {e}",
-        )
-
-
 async def update_market_value(
     bot,
     pokemon_name: str,
@@ -757,56 +895,6 @@ async def update_market_value(
         )
 
 
-async def update_is_exclusive(
-    bot, pokemon_name: str, is_exclusive: bool, image_link: str = None
-):
-    """
-    Update the is_exclusive field for a Pokémon in the market value table.
-    """
-    pokemon_name = pokemon_name.lower()
-    try:
-        async with bot.pg_pool.acquire() as conn:
-            # Only update if row exists
-            row = await conn.fetchrow(
-                "SELECT pokemon_name FROM market_value WHERE pokemon_name = $1",
-                pokemon_name,
-            )
-            if not row:
-                pretty_log(
-                    tag="db",
-                    message=f"No market value row found for {pokemon_name}, skipping update.",
-                )
-                return
-            # Build update query
-            update_fields = ["is_exclusive = $1", "last_updated = $2"]
-            update_values = [is_exclusive, datetime.utcnow()]
-            param_index = 3
-            if image_link is not None:
-                update_fields.insert(1, f"image_link = ${param_index}")
-                update_values.append(image_link)
-                param_index += 1
-            update_query = f"UPDATE market_value SET {', '.join(update_fields)} WHERE pokemon_name = ${param_index}"
-            update_values.append(pokemon_name)
-            await conn.execute(update_query, *update_values)
-            # Update in cache as well
-            if pokemon_name in market_value_cache:
-                market_value_cache[pokemon_name]["is_exclusive"] = is_exclusive
-                if image_link is not None:
-                    market_value_cache[pokemon_name]["image_link"] = image_link
-
-        pretty_log(
-            tag="db",
-            message=f"Updated is_exclusive for {pokemon_name} to {is_exclusive}"
-            + (f", image_link updated" if image_link is not None else ""),
-        )
-
-    except Exception as e:
-        pretty_log(
-            tag="error",
-            message=f"Failed to update is_exclusive for {pokemon_name}: {e}",
-        )
-
-
 # --------------------
 #  Fetch single Pokémon market value
 # --------------------
@@ -983,17 +1071,7 @@ async def load_market_cache_from_db(bot) -> dict:
             rows = await conn.fetch("SELECT * FROM market_value")
 
             for row in rows:
-                cache[row["pokemon_name"]] = {
-                    "pokemon": row["pokemon_name"],
-                    "dex_number": row["dex_number"],
-                    "is_exclusive": row.get("is_exclusive", False),
-                    "lowest_market": row["lowest_market"],
-                    "current_listing": row["current_listing"],
-                    "true_lowest": row["true_lowest"],
-                    "listing_seen": row["listing_seen"],
-                    "image_link": row.get("image_link", None),
-                    "rarity": row.get("rarity", "unknown"),
-                }
+                cache[row["pokemon_name"]] = market_value_cache_entry(row)
 
         """pretty_log(
             tag="",
@@ -1010,4 +1088,4 @@ async def load_market_cache_from_db(bot) -> dict:
             tag="error",
             message=f"Failed to load market cache from database: {e}",
         )
-        return {}
+        raise e
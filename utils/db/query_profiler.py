@@ -0,0 +1,248 @@
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from functools import lru_cache
+
+from Constants.variables import DATA_DIR
+from utils.logs.market_trace import LatencyHistogram
+from utils.logs.pretty_log import append_jsonl
+
+# 🟣────────────────────────────────────────────
+#   🔎 Query Profiler
+# 🟣────────────────────────────────────────────
+# Every statement run on a connection from SafePool.acquire() is recorded here
+# under its SQL text (whitespace-collapsed), along with how long callers waited
+# for a pool connection. Statements slower than SLOW_QUERY_MS are appended to
+# SLOW_QUERY_LOG_FILE, optionally with their EXPLAIN plan.
+SLOW_QUERY_MS = 250
+SLOW_QUERY_LOG_FILE = os.path.join(DATA_DIR, "slow_queries.jsonl")
+SLOW_QUERY_SQL_CHARS = 2000  # SQL text kept per slow log line
+
+AUTO_EXPLAIN_MS = 1000  # slow statements above this also get an EXPLAIN
+AUTO_EXPLAIN_COOLDOWN_SECONDS = 600  # at most one EXPLAIN per statement per window
+auto_explain_enabled = False
+
+QUERY_STATS_DUMP_FILE = os.path.join(DATA_DIR, "query_stats.json")
+
+
+class QueryStats:
+    __slots__ = ("sql", "calls", "errors", "total_ms", "max_ms", "rows")
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "sql": self.sql,
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "rows": self.rows,
+        }
+
+
+query_stats: dict[str, QueryStats] = {}
+pool_latency_histograms = {"pool_wait": LatencyHistogram()}
+_last_explained: dict[str, float] = {}
+# Keep references so running EXPLAINs are not garbage collected
+_explain_tasks: set[asyncio.Task] = set()
+
+QUERY_STATS_SORT_KEYS = {
+    "total": lambda s: s.total_ms,
+    "mean": lambda s: s.mean_ms,
+    "max": lambda s: s.max_ms,
+    "calls": lambda s: s.calls,
+    "rows": lambda s: s.rows,
+}
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """The repo's queries are string literals, so this is a memo hit after the first call."""
+    return " ".join(sql.split())
+
+
+def _row_count(method: str, result) -> int:
+    if result is None:
+        return 0
+    if method == "fetch":
+        return len(result)
+    if method in ("fetchrow", "fetchval"):
+        return 1
+    if method == "execute" and isinstance(result, str):
+        # Status tags look like "INSERT 0 5", "UPDATE 3", "DELETE 0"
+        count = result.rsplit(" ", 1)[-1]
+        return int(count) if count.isdigit() else 0
+    return 0
+
+
+def record_pool_wait(started_perf: float):
+    elapsed_ms = (time.perf_counter() - started_perf) * 1000
+    pool_latency_histograms["pool_wait"].add(elapsed_ms)
+
+
+def record_query(sql: str, method: str, elapsed_ms: float, result, error: bool):
+    key = normalize_sql(sql)
+    stats = query_stats.get(key)
+    if stats is None:
+        stats = query_stats[key] = QueryStats(key)
+    stats.calls += 1
+    stats.total_ms += elapsed_ms
+    if elapsed_ms > stats.max_ms:
+        stats.max_ms = elapsed_ms
+    if error:
+        stats.errors += 1
+    else:
+        stats.rows += _row_count(method, result)
+    return stats
+
+
+def _append_slow_log(entry: dict):
+    # Written by the log thread; a slow DB shouldn't also block the loop on disk
+    append_jsonl(SLOW_QUERY_LOG_FILE, entry, tag="slow_query")
+
+
+async def _explain_statement(pool, sql: str, args: tuple):
+    # Plain EXPLAIN (no ANALYZE) only plans, so it's safe for writes too
+    try:
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(f"EXPLAIN {sql}", *args, timeout=10)
+        plan = "\n".join(row[0] for row in rows)
+    except Exception as e:
+        plan = f"EXPLAIN failed: {e}"
+    _append_slow_log(
+        {
+            "at": datetime.utcnow().isoformat(),
+            "sql": normalize_sql(sql)[:SLOW_QUERY_SQL_CHARS],
+            "explain": plan,
+        }
+    )
+
+
+def log_slow_query(
+    pool, sql: str, method: str, args: tuple, elapsed_ms: float, error: bool
+):
+    key = normalize_sql(sql)
+    _append_slow_log(
+        {
+            "at": datetime.utcnow().isoformat(),
+            "ms": round(elapsed_ms, 3),
+            "method": method,
+            "error": error,
+            "sql": key[:SLOW_QUERY_SQL_CHARS],
+        }
+    )
+    if (
+        not auto_explain_enabled
+        or method == "executemany"
+        or key.startswith("EXPLAIN")
+        or elapsed_ms < AUTO_EXPLAIN_MS
+    ):
+        return
+    now = time.monotonic()
+    last = _last_explained.get(key)
+    if last is not None and now - last < AUTO_EXPLAIN_COOLDOWN_SECONDS:
+        return
+    _last_explained[key] = now
+    task = asyncio.create_task(_explain_statement(pool, sql, args))
+    _explain_tasks.add(task)
+    task.add_done_callback(_explain_tasks.discard)
+
+
+class ProfiledConnection:
+    """
+    Wraps a pooled asyncpg connection so execute/fetch* are timed and their
+    outcome is reported to the pool's circuit breaker; every other attribute
+    (transaction(), add_listener(), ...) passes straight through.
+    """
+
+    __slots__ = ("_conn", "_safe_pool")
+
+    def __init__(self, conn, safe_pool):
+        self._conn = conn
+        self._safe_pool = safe_pool
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    async def _profiled(self, method: str, sql: str, args: tuple, kwargs: dict):
+        started = time.perf_counter()
+        result = None
+        error = False
+        try:
+            result = await getattr(self._conn, method)(sql, *args, **kwargs)
+        except Exception as e:
+            error = True
+            self._safe_pool._record_outcome(e)
+            raise
+        else:
+            self._safe_pool._record_outcome(None)
+            return result
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            record_query(sql, method, elapsed_ms, result, error)
+            if elapsed_ms >= SLOW_QUERY_MS:
+                log_slow_query(self._safe_pool, sql, method, args, elapsed_ms, error)
+
+    async def execute(self, sql: str, *args, **kwargs):
+        return await self._profiled("execute", sql, args, kwargs)
+
+    async def executemany(self, sql: str, args, **kwargs):
+        return await self._profiled("executemany", sql, (args,), kwargs)
+
+    async def fetch(self, sql: str, *args, **kwargs):
+        return await self._profiled("fetch", sql, args, kwargs)
+
+    async def fetchrow(self, sql: str, *args, **kwargs):
+        return await self._profiled("fetchrow", sql, args, kwargs)
+
+    async def fetchval(self, sql: str, *args, **kwargs):
+        return await self._profiled("fetchval", sql, args, kwargs)
+
+
+def top_query_stats(limit: int = 10, sort_by: str = "total") -> list[QueryStats]:
+    key = QUERY_STATS_SORT_KEYS.get(sort_by, QUERY_STATS_SORT_KEYS["total"])
+    return sorted(query_stats.values(), key=key, reverse=True)[:limit]
+
+
+def query_stats_snapshot(sort_by: str = "total") -> dict:
+    return {
+        "generated_at": datetime.utcnow().isoformat(),
+        "slow_query_ms": SLOW_QUERY_MS,
+        "pool_wait": pool_latency_histograms["pool_wait"].to_dict(),
+        "statements": [
+            stats.to_dict() for stats in top_query_stats(len(query_stats), sort_by)
+        ],
+    }
+
+
+def reset_query_stats():
+    query_stats.clear()
+    _last_explained.clear()
+    pool_latency_histograms["pool_wait"] = LatencyHistogram()
+
+
+def set_auto_explain(enabled: bool):
+    global auto_explain_enabled
+    auto_explain_enabled = enabled
+
+
+def dump_query_stats(path: str = QUERY_STATS_DUMP_FILE, sort_by: str = "total") -> str:
+    """Writes every statement's stats as JSON and returns the path."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(query_stats_snapshot(sort_by), f, indent=2)
+    return path
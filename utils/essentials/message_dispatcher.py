@@ -0,0 +1,151 @@
+import asyncio
+import time
+from functools import cached_property
+from typing import Awaitable, Callable, NamedTuple
+
+import discord
+from discord.ext import commands
+
+from utils.logs.metrics import record_handler
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#         📬 Message Dispatcher
+# 🟣────────────────────────────────────────────
+# Routes are looked up by channel ID in a table built once, then filtered by
+# cheap predicates. Every matched handler runs as its own supervised task, so
+# a slow donation handler never holds up the next market feed message.
+
+
+class MessageContext:
+    """Per-message view whose embed fields are only read when a predicate asks."""
+
+    def __init__(self, message: discord.Message):
+        self.message = message
+        self.channel_id = message.channel.id
+        # Wall clock when on_message saw it, before any handler task is scheduled
+        self.received_at = time.time()
+
+    @cached_property
+    def content(self) -> str:
+        return self.message.content or ""
+
+    @cached_property
+    def first_embed(self) -> discord.Embed | None:
+        return self.message.embeds[0] if self.message.embeds else None
+
+    @cached_property
+    def first_embed_field_names(self) -> frozenset[str]:
+        embed = self.first_embed
+        if embed is None or not embed.fields:
+            return frozenset()
+        return frozenset(field.name for field in embed.fields)
+
+
+class MessageRoute(NamedTuple):
+    name: str
+    handler: Callable[[commands.Bot, discord.Message], Awaitable[None]]
+    # None = every channel; otherwise only these channel IDs
+    channel_ids: frozenset[int] | None = None
+    predicate: Callable[[MessageContext], bool] | None = None
+    # Start only after this message's other handlers have finished
+    run_after_others: bool = False
+    # Call handler(bot, message, received_at=...) with MessageContext.received_at
+    pass_received_at: bool = False
+    # Logged when the route matches; {content} is the message content
+    log_message: str | None = None
+    log_label: str | None = None
+
+
+class MessageDispatcher:
+    def __init__(self, bot: commands.Bot, routes: list[MessageRoute]):
+        self.bot = bot
+        self.routes = tuple(routes)
+        self._any_channel_routes = tuple(
+            route for route in self.routes if route.channel_ids is None
+        )
+        # channel ID -> routes to check, in registration order
+        self._routes_by_channel: dict[int, tuple[MessageRoute, ...]] = {}
+        routed_channel_ids = set()
+        for route in self.routes:
+            routed_channel_ids.update(route.channel_ids or ())
+        for channel_id in routed_channel_ids:
+            self._routes_by_channel[channel_id] = tuple(
+                route
+                for route in self.routes
+                if route.channel_ids is None or channel_id in route.channel_ids
+            )
+        # Keep references so running handlers are not garbage collected
+        self._tasks: set[asyncio.Task] = set()
+
+    def routes_for(self, channel_id: int) -> tuple[MessageRoute, ...]:
+        return self._routes_by_channel.get(channel_id, self._any_channel_routes)
+
+    def dispatch(self, message: discord.Message) -> list[asyncio.Task]:
+        """Starts a task for every route that matches message and returns them."""
+        ctx = MessageContext(message)
+        first: list[MessageRoute] = []
+        after: list[MessageRoute] = []
+        for route in self.routes_for(ctx.channel_id):
+            if route.predicate is not None and not route.predicate(ctx):
+                continue
+            (after if route.run_after_others else first).append(route)
+
+        tasks = [self._spawn(route, ctx, None) for route in first]
+        waiting_on = list(tasks)
+        tasks += [self._spawn(route, ctx, waiting_on) for route in after]
+        return tasks
+
+    def _spawn(
+        self,
+        route: MessageRoute,
+        ctx: MessageContext,
+        wait_for: list[asyncio.Task] | None,
+    ) -> asyncio.Task:
+        task = asyncio.create_task(
+            self._run(route, ctx, wait_for), name=f"on_message:{route.name}"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run(
+        self,
+        route: MessageRoute,
+        ctx: MessageContext,
+        wait_for: list[asyncio.Task] | None,
+    ):
+        if wait_for:
+            await asyncio.wait(wait_for)
+        if route.log_message:
+            pretty_log(
+                "info",
+                route.log_message.format(content=ctx.content),
+                label=route.log_label,
+            )
+
+        kwargs = {"received_at": ctx.received_at} if route.pass_received_at else {}
+        started = time.perf_counter()
+        try:
+            await route.handler(self.bot, ctx.message, **kwargs)
+        except Exception as e:
+            record_handler(route.name, started, error=True)
+            pretty_log(
+                "critical",
+                f"Unhandled exception in {route.name}: {e}",
+                label="MESSAGE",
+                bot=self.bot,
+                include_trace=True,
+            )
+            return
+        record_handler(route.name, started)
+
+    async def drain(self, timeout: float | None = None):
+        """Waits for running handlers; whatever is left after timeout is cancelled."""
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -8,6 +8,7 @@ from zoneinfo import ZoneInfo
 
 from Constants.vn_allstars_constants import VN_ALLSTARS_EMOJIS
 from Constants.weakness_chart import weakness_chart
+from utils.cache.pokemon_catalog import get_pokemon_catalog
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 
@@ -35,29 +36,18 @@ def resolve_pokemon_input(pokemon_input: str):
     Returns: (display_name, dex_number)
     """
     pokemon_input = pokemon_input.strip().lower()
+    catalog = get_pokemon_catalog()
 
     # ── Numeric Dex input ──
     if pokemon_input.isdigit():
         dex_int = int(pokemon_input)
-
-        first_digit = pokemon_input[0]
-        prefix = ""
-        if first_digit == "9" and len(pokemon_input) > 3:
-            base_dex = int(pokemon_input[1:])
-            prefix = "Golden "
-        elif first_digit == "1" and len(pokemon_input) > 3:
-            base_dex = int(pokemon_input[1:])
-            prefix = "Shiny "
-        else:
-            base_dex = int(pokemon_input)
+        prefix, base_dex = catalog.split_dex(pokemon_input)
 
         # Lookup in weakness chart
-        for name, data in weakness_chart.items():
-            chart_dex = int(str(data.get("dex")).lstrip("0"))
-            if chart_dex == base_dex:
-                display_name = prefix + format_mega_pokemon_name(name)
-
-                return display_name, dex_int
+        name = catalog.chart_key_for_dex(base_dex)
+        if name is not None:
+            display_name = prefix + format_mega_pokemon_name(name)
+            return display_name, dex_int
 
         raise ValueError(f"No Pokemon found with Dex #{dex_int}")
 
@@ -73,7 +63,7 @@ def resolve_pokemon_input(pokemon_input: str):
         else:
             base_name = normalize_mega_input(pokemon_input)
 
-        chart_data = weakness_chart.get(base_name)
+        chart_data = catalog.chart_entry(base_name)
         if not chart_data or "dex" not in chart_data:
 
             raise ValueError(f"No Pokemon found with name {base_name}")
@@ -82,17 +72,7 @@ def resolve_pokemon_input(pokemon_input: str):
 
         #
         # Calculate Dex with offsets, but skip for 7xxx forms
-        chart_dex_int = int(chart_data["dex"])
-        if chart_dex_int >= 7000:
-            dex_number = chart_dex_int  # already a form, skip Shiny/Golden offsets
-
-        else:
-            if prefix == "Shiny ":
-                dex_number = chart_dex_int + 1000
-            elif prefix == "Golden ":
-                dex_number = chart_dex_int + 9000
-            else:
-                dex_number = chart_dex_int
+        dex_number = catalog.apply_dex_offset(prefix, int(chart_data["dex"]))
 
         return display_name, dex_number
 
@@ -189,13 +169,14 @@ def parse_special_mega_input(name: str) -> int:
     lookup_name = lookup_name.strip()
     debug_log(f"Trying lookup_name: '{lookup_name}'")
 
-    if lookup_name in weakness_chart:
+    catalog = get_pokemon_catalog()
+    if (entry := catalog.chart_entry(lookup_name)) is not None:
         debug_log(f"{lookup_name}' found in weakness_chart")
-        dex_number = int(weakness_chart[lookup_name]["dex"])
+        dex_number = int(entry["dex"])
         debug_log(f"Found dex for '{lookup_name}': {dex_number}")
-    elif name in weakness_chart:
+    elif (entry := catalog.chart_entry(name)) is not None:
         debug_log(f"'{name}' found in weakness_chart")
-        dex_number = int(weakness_chart[name]["dex"])
+        dex_number = int(entry["dex"])
         debug_log(f"Found dex for '{name}': {dex_number}")
     else:
         raise ValueError(
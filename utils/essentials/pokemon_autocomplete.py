@@ -1,4 +1,5 @@
 import re
+from functools import cache
 
 import discord
 from Constants.weakness_chart import weakness_chart as WEAKNESS_CHART
@@ -17,42 +18,17 @@ def format_price(n: int) -> str:
     return str(n)
 
 
-# ==================== 🗂 Build Weakness Indexes ==================== #
-def build_weakness_indexes(weakness_chart: dict):
-    dex_to_key = {}
-    key_normalized = {}
-    for key, data in weakness_chart.items():
-        dex_raw = data.get("dex")
-        try:
-            dex_int = int(dex_raw) if dex_raw is not None else None
-        except Exception:
-            dex_int = None
-
-        if dex_int is not None:
-            dex_to_key[dex_int] = key
-
-        norm = key.lower().replace("-", " ").replace("_", " ").strip()
-        key_normalized[norm] = key
-        simple = re.sub(r"[^\w\s]", "", norm)
-        key_normalized[simple] = key
-
-    return dex_to_key, key_normalized
-
-
-DEX_TO_KEY, KEY_NORMALIZED = build_weakness_indexes(WEAKNESS_CHART)
-
-# Pre-build clean list
-POKEMON_LIST: list[tuple[str, int]] = [
-    (key.title(), int(data.get("dex", 0)))
-    for key, data in WEAKNESS_CHART.items()
-    if data.get("dex") is not None
-]
-
-# ==================== 🐉 Unified Mega/Golden/Shiny Formatter ==================== #
-POKEMON_NORMALIZED: list[tuple[str, str, int]] = []
-for name, dex in POKEMON_LIST:
-    norm = re.sub(r"[^\w\s]", "", name.lower()).replace(" ", "")
-    POKEMON_NORMALIZED.append((name, norm, dex))
+# Built on the first autocomplete call so importing this module doesn't load the chart
+@cache
+def get_pokemon_normalized() -> list[tuple[str, str, int]]:
+    pokemon_normalized = []
+    for key, dex in WEAKNESS_CHART.dex_items():
+        if dex is None:
+            continue
+        name = key.title()
+        norm = re.sub(r"[^\w\s]", "", name.lower()).replace(" ", "")
+        pokemon_normalized.append((name, norm, int(dex)))
+    return pokemon_normalized
 
 
 def old_format_display_name(raw_name: str) -> str:
@@ -151,7 +127,7 @@ async def pokemon_autocomplete(
         except ValueError:
             dex_query = None
 
-    for name, norm, dex in POKEMON_NORMALIZED:
+    for name, norm, dex in get_pokemon_normalized():
         # Match by name
         if not current_simple or current_simple in norm:
             display_name = format_display_name(name)
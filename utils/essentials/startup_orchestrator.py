@@ -0,0 +1,107 @@
+import asyncio
+import inspect
+import os
+import time
+from typing import Any, Awaitable, Callable
+
+from discord.ext import commands
+
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#         ⏱️ Startup Orchestrator ⏱️
+# 🟣────────────────────────────────────────────
+SLOW_STARTUP_STEP_MS = 500  # steps slower than this are flagged in the report
+
+# section -> {step name: (elapsed ms, ok)}
+startup_timings: dict[str, dict[str, tuple[float, bool]]] = {}
+
+
+def record_startup_timing(section: str, name: str, elapsed_ms: float, ok: bool):
+    startup_timings.setdefault(section, {})[name] = (elapsed_ms, ok)
+
+
+async def run_timed_step(
+    section: str,
+    name: str,
+    step: Callable[[], Awaitable[Any] | Any],
+) -> bool:
+    """
+    Runs one startup step (sync or async), records how long it took and
+    logs its failure without raising, so sibling steps keep going.
+    Returns True on success.
+    """
+    started = time.perf_counter()
+    ok = True
+    try:
+        result = step()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        ok = False
+        pretty_log(
+            tag="error",
+            message=f"❌ Startup step '{name}' ({section}) failed: {e}",
+        )
+    record_startup_timing(section, name, (time.perf_counter() - started) * 1000, ok)
+    return ok
+
+
+async def run_concurrent_steps(
+    section: str,
+    steps: dict[str, Callable[[], Awaitable[Any] | Any]],
+) -> dict[str, bool]:
+    """Runs independent steps concurrently; returns {name: succeeded}."""
+    names = list(steps)
+    results = await asyncio.gather(
+        *(run_timed_step(section, name, steps[name]) for name in names)
+    )
+    return dict(zip(names, results))
+
+
+def discover_cog_modules(root_dir: str = "cogs", skip: set[str] = frozenset()):
+    """Every cog module path under root_dir, ignoring __pycache__ and dunder files."""
+    modules = []
+    for root, dirs, files in os.walk(root_dir):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for file in sorted(files):
+            if file.endswith(".py") and not file.startswith("__"):
+                module_path = (
+                    os.path.join(root, file).replace(os.sep, ".").removesuffix(".py")
+                )
+                if module_path not in skip:
+                    modules.append(module_path)
+    return modules
+
+
+async def load_cogs_timed(bot: commands.Bot, modules: list[str]) -> list[str]:
+    """
+    Loads each cog (module import + setup) and records its time under "cogs".
+    Cogs load one at a time: imports are CPU-bound and share the import lock,
+    but each load yields to the loop so I/O started earlier (the DB pool) can
+    progress in between.
+    """
+    loaded = []
+    for module_path in modules:
+        if await run_timed_step(
+            "cogs", module_path, lambda m=module_path: bot.load_extension(m)
+        ):
+            loaded.append(module_path)
+        await asyncio.sleep(0)
+    return loaded
+
+
+def print_startup_timing_report():
+    """Prints per-step startup timings, slowest first, below the startup checklist."""
+    print("\n────────────────────────⋆⋅☆⋅⋆ ────────────────────────")
+    print("⏱️  Startup Timing Report")
+    for section, steps in startup_timings.items():
+        total_ms = sum(elapsed for elapsed, _ in steps.values())
+        print(f"\n{section} ({len(steps)} steps, {total_ms:,.0f} ms summed)")
+        for name, (elapsed_ms, ok) in sorted(
+            steps.items(), key=lambda item: item[1][0], reverse=True
+        ):
+            status = "✅" if ok else "❌"
+            slow = " 🐢" if elapsed_ms >= SLOW_STARTUP_STEP_MS else ""
+            print(f"{status} {elapsed_ms:>8,.1f} ms  {name}{slow}")
+    print("────────────────────────⋆⋅☆⋅⋆ ────────────────────────\n")
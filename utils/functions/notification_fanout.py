@@ -0,0 +1,61 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#   ⚡ Notification Fan-out ⚡
+# 🟣────────────────────────────────────────────
+# Global cap on notification sends in flight across every listing
+NOTIFICATION_CONCURRENCY = 10
+
+_notification_semaphore = asyncio.Semaphore(NOTIFICATION_CONCURRENCY)
+_channel_locks: dict[int, asyncio.Lock] = {}  # per-channel send ordering
+
+
+async def _run_notification(
+    channel_id: int,
+    label: str,
+    send: Callable[[], Awaitable[None]],
+):
+    # Take the channel lock first: asyncio locks are FIFO, so sends to the same
+    # channel go out in the order they were dispatched.
+    lock = _channel_locks.setdefault(channel_id, asyncio.Lock())
+    async with lock:
+        async with _notification_semaphore:
+            await send()
+
+
+async def fan_out_notifications(
+    targets: list[tuple[int, str, Callable[[], Awaitable[None]]]],
+) -> int:
+    """
+    Dispatches every notification for a listing concurrently.
+
+    targets: list of (channel_id, label, send) where send is a zero-argument
+    coroutine function that performs the actual send.
+    A failing target is logged on its own and does not cancel the others.
+    Returns the number of targets that failed.
+    """
+    if not targets:
+        return 0
+
+    results = await asyncio.gather(
+        *(
+            _run_notification(channel_id, label, send)
+            for channel_id, label, send in targets
+        ),
+        return_exceptions=True,
+    )
+
+    failed = 0
+    for (channel_id, label, _), result in zip(targets, results):
+        if isinstance(result, BaseException):
+            failed += 1
+            pretty_log(
+                "error",
+                f"Notification '{label}' to channel {channel_id} failed: {result}",
+                label="FAN-OUT",
+                include_trace=False,
+            )
+    return failed
@@ -1,34 +1,17 @@
 from Constants.paldea_galar_dict import get_dex_number_by_name, rarity_meta
-from Constants.pokemon_dex import *
 from Constants.vn_allstars_constants import (
     KHY_USER_ID,
     VN_ALLSTARS_EMOJIS,
     VN_ALLSTARS_ROLES,
     YUKI_USER_ID,
 )
+from utils.cache.pokemon_catalog import get_pokemon_catalog
 from utils.db.market_value_db import (
     fetch_market_value_cache,
     is_pokemon_exclusive_cache,
 )
-from utils.logs.debug_log import debug_log, enable_debug
-from utils.logs.pretty_log import pretty_log
-
-IN_GAME_MONS_LIST = (
-    list(common_mons.keys())
-    + list(uncommon_mons.keys())
-    + list(rare_mons.keys())
-    + list(superrare_mons.keys())
-    + list(legendary_mons.keys())
-    + list(mega_mons.keys())
-    + list(gigantamax_mons.keys())
-    + list(shiny_mons.keys())
-    + list(shiny_mega_mons.keys())
-    + list(shiny_gigantamax_mons.keys())
-    + list(golden_mons.keys())
-    + list(exclusive_mons.keys())
-)
-
-exclusive_mons_list = list(exclusive_mons.keys())
+from utils.logs.debug_log import debug_log
+from utils.parsers.rarity_classifier import form_rarity
 
 
 def get_embed_color_by_rarity(pokemon_name: str) -> int:
@@ -114,7 +97,7 @@ def is_mon_exclusive(pokemon: str) -> bool:
     """
     debug_log(f"Checking exclusivity for: {pokemon}")
     name = pokemon.lower()
-    if any(name == mon.lower() for mon in exclusive_mons_list):
+    if get_pokemon_catalog().is_exclusive(name):
         debug_log(f"{pokemon} is exclusive based on the exclusive_mons list.")
         return True
     # Check cache for exclusivity, if it's exclusive then it's not auctionable
@@ -127,54 +110,12 @@ def is_mon_exclusive(pokemon: str) -> bool:
         return False
 
 
-enable_debug(f"{__name__}.get_rarity")
-
-
 def get_rarity(pokemon: str):
     """Determines the rarity of a given Pokemon based on the name"""
 
     name = pokemon.lower()
-    pretty_log("info", f"Determining rarity for: {pokemon}")
-    debug_log(f"Checking rarity for: {name}")
-    if "golden" in name:
-        debug_log(f"Matched 'golden' in name: {name}")
-        return "golden"
-    elif "shiny" in name and "gigantamax" in name:
-        debug_log(f"Matched 'shiny' and 'gigantamax' in name: {name}")
-        return "shiny gigantamax"
-    elif "shiny" in name and "mega" in name:
-        debug_log(f"Matched 'shiny' and 'mega' in name: {name}")
-        return "shiny mega"
-    elif "shiny" in name:
-        debug_log(f"Matched 'shiny' in name: {name}")
-        return "shiny"
-    elif "gigantamax" in name:
-        debug_log(f"Matched 'gigantamax' in name: {name}")
-        return "gigantamax"
-    elif "mega" in name and not "yanmega" in name and not "meganium" in name:
-        debug_log(f"Matched 'mega' in name (not yanmega/meganium): {name}")
-        return "mega"
-
-    # Fallback to the list (case-insensitive)
-    debug_log(f"Checking fallback rarity lists for: {name}")
-    if name in (mon.lower() for mon in legendary_mons):
-        debug_log(f"Matched legendary_mons: {name}")
-        return "legendary"
-    elif name in (mon.lower() for mon in superrare_mons):
-        debug_log(f"Matched superrare_mons: {name}")
-        return "superrare"
-    elif name in (mon.lower() for mon in rare_mons):
-        debug_log(f"Matched rare_mons: {name}")
-        return "rare"
-    elif name in (mon.lower() for mon in uncommon_mons):
-        debug_log(f"Matched uncommon_mons: {name}")
-        return "uncommon"
-    elif name in (mon.lower() for mon in common_mons):
-        debug_log(f"Matched common_mons: {name}")
-        return "common"
-    else:
-        debug_log(f"No rarity matched for: {name}")
-        return None
+    # Name forms first (golden/shiny/mega/gigantamax), then the rarity lists
+    return form_rarity(name) or get_pokemon_catalog().base_rarity(name)
 
 
 def format_names_for_market_value_lookup(pokemon_name: str):
@@ -215,7 +156,7 @@ def format_names_for_market_value_lookup(pokemon_name: str):
 def is_mon_in_game(pokemon_name: str) -> bool:
     """Check if a Pokémon is in the game."""
     name_lower = pokemon_name.lower()
-    if name_lower in IN_GAME_MONS_LIST:
+    if get_pokemon_catalog().is_in_game(name_lower):
         return True
     # Fallback to check if the formatted name is in the market value cache
     pokemon_name_formatted = format_names_for_market_value_lookup(pokemon_name)
@@ -1,18 +1,68 @@
+import asyncio
 from datetime import datetime
+from typing import Callable
 
 import discord
 
 from utils.cache.cache_list import webhook_url_cache
-from utils.db.webhook_db_url import upsert_webhook_url
+from utils.db.webhook_db_url import remove_webhook_url, upsert_webhook_url
+from utils.logs.metrics import record_webhook_send
 from utils.logs.pretty_log import pretty_log
 
+# 🟣────────────────────────────────────────────
+#   🪝 Webhook Pool
+# 🟣────────────────────────────────────────────
+# key = (bot_id, channel_id), value = (url, webhook)
+# Webhooks are built once with client=bot so every send reuses the bot's HTTP session.
+_webhook_pool: dict[tuple[int, int], tuple[str, discord.Webhook]] = {}
+
+# key = bot_id, value = avatar bytes used when creating new webhooks
+_avatar_bytes_cache: dict[int, bytes] = {}
+
+# Keep references to fire-and-forget sends so they are not garbage collected mid-flight
+_background_sends: set[asyncio.Task] = set()
+
+
+def get_pooled_webhook(bot: discord.Client, key: tuple[int, int], url: str):
+    """Returns the pooled Webhook for key, rebuilding it if the URL changed."""
+    pooled = _webhook_pool.get(key)
+    if pooled and pooled[0] == url:
+        return pooled[1]
+    webhook = discord.Webhook.from_url(url, client=bot)
+    _webhook_pool[key] = (url, webhook)
+    return webhook
+
+
+def evict_pooled_webhook(bot_id: int, channel_id: int):
+    _webhook_pool.pop((bot_id, channel_id), None)
+
+
+async def forget_dead_webhook(bot: discord.Client, channel: discord.TextChannel):
+    """Drops a deleted webhook from the pool, the URL cache and the DB."""
+    key = (bot.user.id, channel.id)
+    evict_pooled_webhook(*key)
+    webhook_url_cache.pop(key, None)
+    try:
+        await remove_webhook_url(bot, channel)
+    except Exception:
+        pass  # already logged; the cache miss still recreates the webhook
+
+
+async def _get_avatar_bytes(bot) -> bytes | None:
+    avatar_bytes = _avatar_bytes_cache.get(bot.user.id)
+    if avatar_bytes is None and bot.user.avatar:
+        avatar_bytes = await bot.user.avatar.read()
+        _avatar_bytes_cache[bot.user.id] = avatar_bytes
+    return avatar_bytes
+
 
 async def create_webhook_func(
     bot, channel: discord.TextChannel, name: str
 ) -> str | None:
+    webhook = None
     try:
 
-        avatar_bytes = await bot.user.avatar.read()
+        avatar_bytes = await _get_avatar_bytes(bot)
         webhook = await channel.create_webhook(name=name, avatar=avatar_bytes)
         pretty_log(
             "info",
@@ -29,11 +79,59 @@ async def create_webhook_func(
     return webhook.url if webhook else None
 
 
+def _log_background_send_error(channel: discord.TextChannel, error: Exception):
+    pretty_log(
+        "error",
+        f"Background webhook send to '{channel.name}' (ID: {channel.id}) failed: {error}",
+        label="🌐 WEBHOOK SEND",
+        include_trace=False,
+    )
+
+
 async def send_webhook(
     bot: discord.Client,
     channel: discord.TextChannel,
     content: str = None,
     embed: discord.Embed = None,
+    *,
+    background: bool = False,
+    on_error: Callable[[discord.TextChannel, Exception], None] = None,
+):
+    """
+    Sends a message through the channel's pooled webhook.
+
+    With background=True the send is scheduled and this returns immediately;
+    errors are reported through on_error (defaults to an error log).
+    """
+    if background:
+        task = asyncio.create_task(_send_webhook(bot, channel, content, embed))
+        _background_sends.add(task)
+
+        def _done(t: asyncio.Task):
+            _background_sends.discard(t)
+            if t.cancelled():
+                return
+            error = t.exception()
+            record_webhook_send(error is None)
+            if error is not None:
+                (on_error or _log_background_send_error)(channel, error)
+
+        task.add_done_callback(_done)
+        return
+
+    try:
+        await _send_webhook(bot, channel, content, embed)
+    except Exception:
+        record_webhook_send(False)
+        raise
+    record_webhook_send(True)
+
+
+async def _send_webhook(
+    bot: discord.Client,
+    channel: discord.TextChannel,
+    content: str = None,
+    embed: discord.Embed = None,
 ):
     bot_id = bot.user.id
     channel_id = channel.id
@@ -73,5 +171,12 @@ async def send_webhook(
 
     webhook_url = webhook_url_row["url"]
     if webhook_url:
-        webhook = discord.Webhook.from_url(webhook_url, client=bot)
-        await webhook.send(content=content, embed=embed, wait=True)
+        webhook = get_pooled_webhook(bot, key, webhook_url)
+        try:
+            # wait=False: we never use the returned message, so skip waiting for it
+            await webhook.send(content=content, embed=embed, wait=False)
+        except discord.NotFound:
+            # Webhook was deleted on Discord's side; forget it everywhere so the
+            # next send creates a fresh one instead of failing on the dead URL
+            await forget_dead_webhook(bot, channel)
+            raise
@@ -16,6 +16,7 @@ from Constants.vn_allstars_constants import (
 from utils.db.donations_db import (
     fetch_donation_record,
     increment_monthly_donator_streak,
+    set_permanent_monthly_donator,
     update_monthly_donations,
     update_monthly_donator_status,
     update_total_donations,
@@ -35,8 +36,11 @@ from .update_leaderboard import update_leaderboard_func
 async def check_monthly_and_update_donation_status(
     bot: commands.Bot,
     member: discord.Member,
+    donation_record: dict | None = None,
 ):
-    donation_record = await fetch_donation_record(bot, member.id)
+    # Donations pass the record add_donation returned; no need to re-fetch it
+    if donation_record is None:
+        donation_record = await fetch_donation_record(bot, member.id)
     total_donations = donation_record.get("total_donations", 0)
     monthly_donations = donation_record.get("monthly_donations", 0)
     permanent_monthly_donator = donation_record.get("permanent_monthly_donator", False)
@@ -114,9 +118,7 @@ async def check_monthly_and_update_donation_status(
                         include_trace=True,
                     )
             if monthly_donator_streak >= 2 and not permanent_monthly_donator:
-                await update_monthly_donator_status(
-                    bot, member.id, True, permanent=True
-                )
+                await set_permanent_monthly_donator(bot, member.id, True)
                 milestone_added = True
                 pretty_log(
                     message=f"🏆 User ID: {member.id} ({member.name}) has reached a monthly donator streak of {monthly_donator_streak} and is now a permanent monthly donator!",
@@ -1,3 +1,13 @@
+from .debug_toggle import debug_toggle_func
 from .edit_embed import edit_embed_func
+from .market_latency import market_latency_func
+from .query_stats import query_stats_func
+from .stall_watch import stall_watch_func
 
-__all__ = ["edit_embed_func"]
\ No newline at end of file
+__all__ = [
+    "debug_toggle_func",
+    "edit_embed_func",
+    "market_latency_func",
+    "query_stats_func",
+    "stall_watch_func",
+]
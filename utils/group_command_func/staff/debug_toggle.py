@@ -0,0 +1,60 @@
+import discord
+from discord.ext import commands
+
+from Constants.vn_allstars_constants import DEFAULT_EMBED_COLOR
+from utils.logs.debug_log import (
+    DEBUG_TOGGLES,
+    clear_debug_toggles,
+    disable_debug,
+    enable_debug,
+)
+from utils.logs.pretty_log import pretty_log
+
+
+def build_debug_toggles_embed() -> discord.Embed:
+    enabled = sorted(key for key, on in DEBUG_TOGGLES.items() if on)
+    disabled = sorted(key for key, on in DEBUG_TOGGLES.items() if not on)
+    embed = discord.Embed(title="🧪 Debug Toggles", color=DEFAULT_EMBED_COLOR)
+    embed.add_field(
+        name="Enabled",
+        value="\n".join(f"`{key}`" for key in enabled)[:1024] or "> None",
+        inline=False,
+    )
+    if disabled:
+        embed.add_field(
+            name="Disabled",
+            value="\n".join(f"`{key}`" for key in disabled)[:1024],
+            inline=False,
+        )
+    return embed
+
+
+async def debug_toggle_func(
+    bot: commands.Bot,
+    interaction: discord.Interaction,
+    action: str = "list",
+    key: str | None = None,
+):
+    """
+    Turns debug_log output on or off at runtime. Keys are either a module
+    (utils.listener_func.market_feed_listener) or module.function.
+    """
+    if action in ("enable", "disable"):
+        if not key:
+            await interaction.response.send_message(
+                f"Please give a module or module.function key to {action}.",
+                ephemeral=True,
+            )
+            return
+        if action == "enable":
+            enable_debug(key)
+        else:
+            disable_debug(key)
+        pretty_log("info", f"Debug logging {action}d for {key} by {interaction.user}")
+    elif action == "clear":
+        clear_debug_toggles()
+        pretty_log("info", f"Debug toggles cleared by {interaction.user}")
+
+    await interaction.response.send_message(
+        embed=build_debug_toggles_embed(), ephemeral=True
+    )
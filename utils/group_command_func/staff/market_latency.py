@@ -0,0 +1,75 @@
+import discord
+from discord.ext import commands
+
+from Constants.vn_allstars_constants import DEFAULT_EMBED_COLOR
+from utils.logs.market_trace import (
+    MARKET_TRACE_DURATIONS,
+    MARKET_TRACE_STAGES,
+    dump_market_latency,
+    market_latency_histograms,
+    reset_market_latency,
+)
+from utils.logs.pretty_log import pretty_log
+
+STAGE_LABELS = {
+    "receive": "📨 Created → received",
+    "parse": "🧾 → parsed",
+    "decision": "🎯 → snipe/alert decision",
+    "send": "🪝 → notifications sent",
+    "db_queued": "💾 → DB writes queued",
+    "webhook_send": "🪝 Webhook send",
+    "db_flush": "💾 DB batch flush",
+}
+
+
+def _fmt_ms(value: float | None) -> str:
+    return "—" if value is None else f"{value:,.1f}"
+
+
+def build_market_latency_embed() -> discord.Embed:
+    embed = discord.Embed(
+        title="⏱️ Market Pipeline Latency",
+        description="Cumulative stages are measured from the feed message's creation time.\n"
+        "p50 / p95 / p99 over recent samples, in ms.",
+        color=DEFAULT_EMBED_COLOR,
+    )
+    for name in MARKET_TRACE_STAGES + MARKET_TRACE_DURATIONS:
+        hist = market_latency_histograms[name]
+        embed.add_field(
+            name=STAGE_LABELS.get(name, name),
+            value=(
+                f"> {_fmt_ms(hist.percentile(50))} / {_fmt_ms(hist.percentile(95))} / "
+                f"{_fmt_ms(hist.percentile(99))}\n"
+                f"> max {_fmt_ms(hist.max_ms if hist.total else None)} · {hist.total:,} samples"
+            ),
+            inline=False,
+        )
+    return embed
+
+
+async def market_latency_func(
+    bot: commands.Bot,
+    interaction: discord.Interaction,
+    dump: bool = False,
+    reset: bool = False,
+):
+    """
+    Shows the market pipeline latency histograms, optionally attaching a
+    JSON dump and/or resetting them afterwards.
+    """
+    embed = build_market_latency_embed()
+
+    file = None
+    if dump:
+        path = dump_market_latency()
+        file = discord.File(path, filename="market_latency.json")
+        pretty_log("info", f"Market latency histograms dumped to {path}")
+
+    if file:
+        await interaction.response.send_message(embed=embed, file=file, ephemeral=True)
+    else:
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    if reset:
+        reset_market_latency()
+        pretty_log("info", f"Market latency histograms reset by {interaction.user}")
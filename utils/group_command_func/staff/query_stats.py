@@ -0,0 +1,94 @@
+import discord
+from discord.ext import commands
+
+from Constants.vn_allstars_constants import DEFAULT_EMBED_COLOR
+from utils.db import query_profiler
+from utils.db.query_profiler import (
+    SLOW_QUERY_MS,
+    dump_query_stats,
+    pool_latency_histograms,
+    query_stats,
+    reset_query_stats,
+    set_auto_explain,
+    top_query_stats,
+)
+from utils.logs.pretty_log import pretty_log
+
+MAX_EMBED_STATEMENTS = 10  # keeps the embed under Discord's size limits
+SQL_PREVIEW_CHARS = 300
+
+
+def _fmt_ms(value: float | None) -> str:
+    return "—" if value is None else f"{value:,.1f}"
+
+
+def build_query_stats_embed(top: int, sort_by: str) -> discord.Embed:
+    pool_wait = pool_latency_histograms["pool_wait"]
+    embed = discord.Embed(
+        title="🔎 Top Database Statements",
+        description=(
+            f"Sorted by **{sort_by}** · {len(query_stats):,} distinct statements\n"
+            f"Pool wait p50 / p95 / p99: {_fmt_ms(pool_wait.percentile(50))} / "
+            f"{_fmt_ms(pool_wait.percentile(95))} / {_fmt_ms(pool_wait.percentile(99))} ms "
+            f"over {pool_wait.total:,} acquires\n"
+            f"Slow log ≥ {SLOW_QUERY_MS} ms · auto-EXPLAIN "
+            f"{'on' if query_profiler.auto_explain_enabled else 'off'}"
+        ),
+        color=DEFAULT_EMBED_COLOR,
+    )
+    for rank, stats in enumerate(top_query_stats(top, sort_by), start=1):
+        sql = stats.sql
+        if len(sql) > SQL_PREVIEW_CHARS:
+            sql = sql[: SQL_PREVIEW_CHARS - 1] + "…"
+        embed.add_field(
+            name=f"#{rank} · {stats.calls:,} calls · {_fmt_ms(stats.total_ms)} ms total",
+            value=(
+                f"```sql\n{sql}\n```"
+                f"> mean {_fmt_ms(stats.mean_ms)} · max {_fmt_ms(stats.max_ms)} ms · "
+                f"{stats.rows:,} rows · {stats.errors:,} errors"
+            ),
+            inline=False,
+        )
+    if not query_stats:
+        embed.add_field(name="No statements yet", value="> Nothing recorded.")
+    return embed
+
+
+async def query_stats_func(
+    bot: commands.Bot,
+    interaction: discord.Interaction,
+    top: int = 10,
+    sort_by: str = "total",
+    dump: bool = False,
+    reset: bool = False,
+    auto_explain: bool | None = None,
+):
+    """
+    Shows the top-N statements by total/mean/max time, calls or rows,
+    optionally attaching every statement as JSON, resetting the stats,
+    or toggling EXPLAIN for very slow statements.
+    """
+    if auto_explain is not None:
+        set_auto_explain(auto_explain)
+        pretty_log(
+            "info",
+            f"Slow query auto-EXPLAIN {'enabled' if auto_explain else 'disabled'} by {interaction.user}",
+        )
+
+    top = max(1, min(top, MAX_EMBED_STATEMENTS))
+    embed = build_query_stats_embed(top, sort_by)
+
+    file = None
+    if dump:
+        path = dump_query_stats(sort_by=sort_by)
+        file = discord.File(path, filename="query_stats.json")
+        pretty_log("info", f"Query stats dumped to {path}")
+
+    if file:
+        await interaction.response.send_message(embed=embed, file=file, ephemeral=True)
+    else:
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    if reset:
+        reset_query_stats()
+        pretty_log("info", f"Query stats reset by {interaction.user}")
@@ -0,0 +1,79 @@
+import discord
+from discord.ext import commands
+
+from Constants.vn_allstars_constants import DEFAULT_EMBED_COLOR
+from utils.logs import stall_watchdog
+from utils.logs.pretty_log import pretty_log
+
+MAX_EMBED_LOCATIONS = 10
+
+
+def _fmt_ms(value: float | None) -> str:
+    return "—" if value is None else f"{value:,.0f}"
+
+
+def build_stall_watch_embed() -> discord.Embed:
+    status = stall_watchdog.stall_watchdog_status()
+    stalls = status["stalls"]
+    state = (
+        f"running · threshold {status['threshold_ms']:,.0f} ms"
+        if status["running"]
+        else "stopped"
+    )
+    embed = discord.Embed(
+        title="🐢 Event Loop Stalls",
+        description=(
+            f"Watchdog {state}\n"
+            f"{stalls['total']:,} stalls · p50 / p95 / max: "
+            f"{_fmt_ms(stalls['p50_ms'])} / {_fmt_ms(stalls['p95_ms'])} / "
+            f"{_fmt_ms(stalls['max_ms'] or None)} ms"
+        ),
+        color=DEFAULT_EMBED_COLOR,
+    )
+    locations = "\n".join(
+        f"`{count:,}×` {location}"
+        for location, count in stall_watchdog.top_stall_locations(MAX_EMBED_LOCATIONS)
+    )
+    embed.add_field(
+        name="Top locations",
+        value=locations[:1024] or "> No stalls recorded.",
+        inline=False,
+    )
+    recent = list(stall_watchdog.recent_stalls)[-5:]
+    if recent:
+        embed.add_field(
+            name="Most recent",
+            value="\n".join(
+                f"{stall['ms']:,.0f} ms · {stall['location']}" for stall in recent
+            )[:1024],
+            inline=False,
+        )
+    return embed
+
+
+async def stall_watch_func(
+    bot: commands.Bot,
+    interaction: discord.Interaction,
+    action: str = "status",
+    threshold_ms: int | None = None,
+):
+    """
+    Starts, stops or reports on the event loop stall watchdog, or clears its
+    stall counts. Enabling while running restarts it with the new threshold.
+    """
+    if action == "enable":
+        watchdog = stall_watchdog.start_stall_watchdog(threshold_ms)
+        pretty_log(
+            "info",
+            f"Stall watchdog enabled at {watchdog.threshold_ms:,.0f} ms by {interaction.user}",
+        )
+    elif action == "disable":
+        stall_watchdog.stop_stall_watchdog()
+        pretty_log("info", f"Stall watchdog disabled by {interaction.user}")
+    elif action == "reset":
+        stall_watchdog.reset_stall_stats()
+        pretty_log("info", f"Stall stats reset by {interaction.user}")
+
+    await interaction.response.send_message(
+        embed=build_stall_watch_embed(), ephemeral=True
+    )
@@ -7,14 +7,11 @@ from typing import Optional, Tuple
 import discord
 
 from utils.db.market_value_db import (
+    apply_market_value_diff,
     fetch_dex_number_cache,
     fetch_image_link_cache,
     fetch_pokemon_exclusivity_cache,
     fetch_rarity_cache,
-    update_dex_number,
-    update_is_exclusive,
-    update_rarity,
-    upsert_image_link,
 )
 from utils.functions.pokemon_func import is_mon_exclusive
 from utils.logs.debug_log import debug_log, enable_debug
@@ -59,14 +56,14 @@ def extract_rarity_from_embed(embed) -> str:
     # Try to get fields from embed object (discord.py Embed or dict)
     if hasattr(embed, "fields"):
         fields = embed.fields
-        debug_log(f"Embed fields attribute found: {fields}")
+        debug_log("Embed fields attribute found: %s", fields)
     elif isinstance(embed, dict) and "fields" in embed:
         fields = embed["fields"]
-        debug_log(f"Embed fields key found: {fields}")
+        debug_log("Embed fields key found: %s", fields)
     else:
-        debug_log(f"Embed has no fields attribute or key. Embed: {embed}")
+        debug_log("Embed has no fields attribute or key. Embed: %s", embed)
     for idx, field in enumerate(fields):
-        debug_log(f"Checking field {idx}: {field}")
+        debug_log("Checking field %s: %s", idx, field)
         name = (
             field.get("name")
             if isinstance(field, dict)
@@ -77,17 +74,17 @@ def extract_rarity_from_embed(embed) -> str:
             if isinstance(field, dict)
             else getattr(field, "value", None)
         )
-        debug_log(f"Field name: {name}, value: {value}")
+        debug_log("Field name: %s, value: %s", name, value)
         if name and name.lower() == "rarity":
-            debug_log(f"Found 'Rarity' field with value: {value}")
+            debug_log("Found 'Rarity' field with value: %s", value)
             match = re.search(r"<:([a-zA-Z0-9_]+):[0-9]+>", value)
             if match:
                 emoji_name = match.group(1)
-                debug_log(f"Extracted emoji name: {emoji_name}")
+                debug_log("Extracted emoji name: %s", emoji_name)
                 mapped_rarity = emoji_map.get(emoji_name.lower(), emoji_name)
-                debug_log(f"Mapped rarity: {mapped_rarity}")
+                debug_log("Mapped rarity: %s", mapped_rarity)
                 return mapped_rarity
-            debug_log(f"Returning plain rarity value: {value.strip()}")
+            debug_log("Returning plain rarity value: %s", value.strip())
             return value.strip()
     debug_log("'Rarity' field not found in embed.")
     return ""
@@ -104,45 +101,52 @@ async def dex_listener(bot, message: discord.Message):
     pokemon_name, dex_number = extract_pokemon_name_and_dex(embed_author_name)
     if not pokemon_name:
         debug_log(
-            f"Could not extract pokemon name from embed title: '{embed_author_name}'"
+            "Could not extract pokemon name from embed title: '%s'",
+            embed_author_name,
         )
         return
     embed_image_url = embed.image.url if embed.image else None
-    image_link_cache = fetch_image_link_cache(pokemon_name)
+
+    # Collect every changed field and write them in one statement
+    diff = {}
     existing_exclusive_status = fetch_pokemon_exclusivity_cache(pokemon_name)
     is_exclusive = is_mon_exclusive(pokemon_name)
     if existing_exclusive_status != is_exclusive and is_exclusive == False:
-        new_exclusive = is_exclusive
-        await update_is_exclusive(bot, pokemon_name, new_exclusive)
-    else:
-        new_exclusive = existing_exclusive_status
-    if embed_image_url and image_link_cache != embed_image_url:
-        await upsert_image_link(bot, pokemon_name, embed_image_url, new_exclusive)
-        debug_log(
-            f"Updated image link for {pokemon_name} to {embed_image_url} based on mh lookup command output."
-        )
-        pretty_log(
-            "info",
-            f"Updated image link for {pokemon_name} to {embed_image_url} based on mh lookup command output.",
-        )
+        diff["is_exclusive"] = is_exclusive
+
+    image_changed = bool(
+        embed_image_url and fetch_image_link_cache(pokemon_name) != embed_image_url
+    )
+    if image_changed:
+        diff["image_link"] = embed_image_url
+        # A new row gets the exclusivity the old image upsert always wrote
+        diff.setdefault("is_exclusive", existing_exclusive_status)
+
     old_dex_number = fetch_dex_number_cache(pokemon_name)
     if dex_number and str(old_dex_number) != str(dex_number):
-        dex_number = int(dex_number)
-        await update_dex_number(bot, pokemon_name, dex_number)
-        debug_log(
-            f"Updated dex number for {pokemon_name} to {dex_number} based on mh lookup command output."
-        )
-        pretty_log(
-            "info",
-            f"Updated dex number for {pokemon_name} to {dex_number} based on mh lookup command output.",
-        )
+        diff["dex_number"] = int(dex_number)
+
     old_rarity = fetch_rarity_cache(pokemon_name)
     rarity = extract_rarity_from_embed(embed)
-
     if rarity and old_rarity != rarity:
-        await update_rarity(bot, pokemon_name, rarity)
-        debug_log(f"Updated rarity for {pokemon_name} to {rarity}.")
-        pretty_log(
-            "info",
-            f"Updated rarity for {pokemon_name} to {rarity}.",
-        )
+        diff["rarity"] = rarity
+
+    if not diff:
+        return
+
+    # Only the image link upsert ever created a missing row
+    entry = await apply_market_value_diff(
+        bot, pokemon_name, diff, insert_if_missing=image_changed
+    )
+    if entry is None:
+        return
+    changes = ", ".join(f"{field} to {value}" for field, value in diff.items())
+    debug_log(
+        "Updated %s for %s based on mh lookup command output.",
+        changes,
+        pokemon_name,
+    )
+    pretty_log(
+        "info",
+        f"Updated {changes} for {pokemon_name} based on mh lookup command output.",
+    )
@@ -1,4 +1,6 @@
+import asyncio
 import re
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 import discord
@@ -12,14 +14,7 @@ from Constants.vn_allstars_constants import (
     VN_ALLSTARS_TEXT_CHANNELS,
     YUKI_USER_ID,
 )
-from utils.db.donations_db import (
-    fetch_donation_record,
-    increment_monthly_donator_streak,
-    update_monthly_donations,
-    update_monthly_donator_status,
-    update_total_donations,
-    upsert_donation_record,
-)
+from utils.db.donations_db import add_donation
 from utils.essentials.format import format_comma_pokecoins
 from utils.functions.get_pokemeow_reply import get_pokemeow_reply_member
 from utils.functions.webhook_func import send_webhook
@@ -33,6 +28,26 @@ CLAN_BANK_IDS = [CLAN_BANK_ID, YUKI_USER_ID]
 
 LOG_CHANNEL_ID = VN_ALLSTARS_TEXT_CHANNELS.member_logs
 
+# user_id -> [lock, holders + waiters]; dropped once nobody needs it
+_donation_user_locks: dict[int, list] = {}
+
+
+@asynccontextmanager
+async def donation_user_lock(user_id: int):
+    """
+    Serializes one user's donations in arrival order (asyncio locks are FIFO),
+    so milestone checks see each increment once and in sequence.
+    """
+    entry = _donation_user_locks.setdefault(user_id, [asyncio.Lock(), 0])
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del _donation_user_locks[user_id]
+
 
 def extract_pokecoins_amount_from_donate(text: str) -> int:
     """
@@ -156,19 +171,27 @@ async def process_donation(
     context: str,
     message: discord.Message,
 ):
+    async with donation_user_lock(member.id):
+        await _process_donation(bot, member, amount, context, message)
 
-    # Fetch donation record
-    donation_record = await fetch_donation_record(bot, member.id)
-    old_total = donation_record["total_donations"] if donation_record else 0
-    old_monthly = donation_record["monthly_donations"] if donation_record else 0
-    new_total = old_total + amount
-    new_monthly = old_monthly + amount
 
-    # Upsert donation record
-    await upsert_donation_record(bot, member.id, member.name, total_donations=new_total)
-
-    # Update monthly donations
-    await update_monthly_donations(bot, member.id, new_monthly)
+async def _process_donation(
+    bot: discord.Client,
+    member: discord.Member,
+    amount: int,
+    context: str,
+    message: discord.Message,
+):
+    # Add to total and monthly donations in one statement
+    donation_record = await add_donation(bot, member.id, member.name, amount)
+    if donation_record is None:
+        pretty_log(
+            "error",
+            f"Donation of {amount} PokeCoins from member {member.name} (ID: {member.id}) was not recorded.",
+        )
+        return
+    new_total = donation_record["total_donations"]
+    new_monthly = donation_record["monthly_donations"]
 
     # Log the donation
     if context == "clan bank":
@@ -203,6 +226,7 @@ async def process_donation(
     await check_monthly_and_update_donation_status(
         bot=bot,
         member=member,
+        donation_record=donation_record,
     )
     pretty_log(
         "info",
@@ -1,32 +1,31 @@
 import asyncio
-import re
+import time
+from functools import partial
 
 import discord
 
-# If colors are different just check terminal and update the one in rarity_meta
-from Constants.paldea_galar_dict import (
-    Legendary_icon_url,
-    get_rarity_by_color,
-    icon_url_map,
-    paldean_mons,
-    rarity_meta,
-)
 from Constants.vn_allstars_constants import (
     VN_ALLSTARS_EMOJIS,
     VN_ALLSTARS_ROLES,
     VN_ALLSTARS_TEXT_CHANNELS,
 )
 from utils.cache.cache_list import (
-    _market_alert_index,
-    market_alert_cache,
     market_value_cache,
     processed_market_feed_ids,
     processed_market_feed_message_ids,
 )
-from utils.db.market_value_db import set_market_value
+from utils.cache.market_alert_cache import fetch_triggered_alerts
+from utils.cache.market_price_history_cache import record_market_price
+from utils.cache.snipe_threshold_cache import is_snipe_price
+from utils.db.market_price_history_db import queue_price_history
+from utils.db.market_value_db import queue_market_value
+from utils.functions.notification_fanout import fan_out_notifications
 from utils.functions.webhook_func import send_webhook
 from utils.logs.debug_log import debug_log, enable_debug
+from utils.logs.market_trace import record_market_duration, start_market_trace
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.market_listing import MarketListing, parse_market_listing
+from utils.parsers.rarity_classifier import secondary_snipe_rarity, snipe_rarity
 
 # enable_debug(f"{__name__}.market_snipe_handler")
 # enable_debug(f"{__name__}.handle_market_alert")
@@ -57,127 +56,70 @@ SNIPE_MAP = {
 SNIPE_CHANNEL_ID = VN_ALLSTARS_TEXT_CHANNELS.snipe_channel
 
 
-def determine_rarity_from_name_and_author_icon(
-    poke_name: str, author_icon_url: str, embed_color: int
-) -> str:
-    rarity = get_rarity_by_color(embed_color)
-    if rarity == "golden":
-        if "mega " in poke_name.lower():
-            rarity = "golden mega"
-    if rarity == "unknown":
-        if "shiny mega " in poke_name.lower():
-            rarity = "shiny mega"
-        elif (
-            "shiny gigantamax-" in poke_name.lower()
-            or "shiny eternamax-" in poke_name.lower()
-        ):
-            rarity = "shiny gigantamax"
-        elif "shiny" in poke_name.lower():
-            rarity = "shiny"
-        elif "mega" in poke_name.lower():
-            rarity = "mega"
-        elif "gigantamax-" in poke_name.lower() or "eternamax-" in poke_name.lower():
-            rarity = "gigantamax"
-        elif author_icon_url == Legendary_icon_url:
-            rarity = "legendary"
-    return rarity
-
-
 # 🟣────────────────────────────────────────────
 #           👂 Market Snipe Handler
 # 🟣────────────────────────────────────────────
 async def market_snipe_handler(
     bot: discord.Client,
-    poke_name: str,
-    listed_price: int,
-    id: str,
-    lowest_market: int,
-    amount: int,
-    listing_seen: str,
+    listing: MarketListing,
+    lowest_market: int | str,
     guild: discord.Guild,
-    embed: discord.Embed,
 ):
-    debug_log(f"Handling market snipe for {poke_name} with ID {id}")
-    try:
-        embed_color = embed.color.value if embed.color else 0x0855FB
-    except Exception as e:
-        embed_color = 0x0855FB
-        debug_log(f"Error getting embed color: {e}", highlight=True)
-    debug_log(f"Embed color: {embed_color}")
-    rarity = get_rarity_by_color(embed_color)
-    debug_log(f"Initial rarity: {rarity}")
-    display_pokemon_name = poke_name.title()
-
-    if rarity == "unknown":
-        debug_log(f"Rarity unknown, checking name and author for special cases.")
-        if (
-            "shiny gigantamax-" in poke_name.lower()
-            or "shiny eternamax-" in poke_name.lower()
-            or "shiny mega " in poke_name.lower()
-        ):
-            rarity = "shiny"
-            debug_log(f"Set rarity to shiny due to name.")
-        elif "mega " in poke_name.lower():
-            rarity = "mega"
-            debug_log(f"Set rarity to mega due to name.")
-        elif "gigantamax-" in poke_name.lower() or "eternamax-" in poke_name.lower():
-            rarity = "gmax"
-            debug_log(f"Set rarity to gmax due to name.")
-        elif embed.author and embed.author.icon_url == Legendary_icon_url:
-            rarity = "legendary"
-            debug_log(f"Set rarity to legendary due to author icon.")
-
-    debug_log(f"Final rarity: {rarity}")
+    poke_name = listing.poke_name
+    listed_price = listing.listed_price
+    listing_id = listing.listing_id
+    debug_log("Handling market snipe for %s with ID %s", poke_name, listing_id)
+    embed_color = listing.color or 0x0855FB
+    debug_log("Embed color: %s", embed_color)
+    rarity = snipe_rarity(listing.rarity, embed_color)
+    debug_log("Snipe rarity: %s", rarity)
+    display_pokemon_name = listing.display_name
+
     ping_role_id = SNIPE_MAP.get(rarity, {}).get("role")
     ping_role_line = f"<@&{ping_role_id}> " if ping_role_id else ""
     if rarity == "event_exclusive":
-        icon_url = embed.author.icon_url
-        if "shiny" in poke_name.lower():
-            shiny_ping_role_id = SNIPE_MAP.get("shiny", {}).get("role")
-            ping_role_line += f"<@&{shiny_ping_role_id}> "
-        elif poke_name.title() in paldean_mons:
-            second_snipe_rarity_role_id = VN_ALLSTARS_ROLES.paldean_snipe
-            ping_role_line += f"<@&{second_snipe_rarity_role_id}> "
-
-        else:
-            second_snipe_rarity = icon_url_map.get(icon_url)
-            second_rarity_role_id = SNIPE_MAP.get(second_snipe_rarity, {}).get("role")
-            if second_rarity_role_id:
-                ping_role_line += f"<@&{second_rarity_role_id}> "
+        second_rarity = secondary_snipe_rarity(
+            poke_name, display_pokemon_name, listing.author_icon_url
+        )
+        second_rarity_role_id = SNIPE_MAP.get(second_rarity, {}).get("role")
+        if second_rarity_role_id:
+            ping_role_line += f"<@&{second_rarity_role_id}> "
 
-    debug_log(f"Ping role line: {ping_role_line}")
+    debug_log("Ping role line: %s", ping_role_line)
 
     snipe_channel = guild.get_channel(SNIPE_CHANNEL_ID)
     if snipe_channel:
         content = f"{ping_role_line} {display_pokemon_name} listed for {VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,}!"
-        debug_log(f"Snipe content: {content}")
+        debug_log("Snipe content: %s", content)
 
         # 🧾 Build embed
-        new_embed = discord.Embed(color=embed.color or 0x0855FB)
-        debug_log(f"Building new embed for snipe notification.")
-        if embed.thumbnail:
-            new_embed.set_thumbnail(url=embed.thumbnail.url)
-            debug_log(f"Set thumbnail: {embed.thumbnail.url}")
+        new_embed = discord.Embed(color=embed_color)
+        debug_log("Building new embed for snipe notification.")
+        if listing.thumbnail_url:
+            new_embed.set_thumbnail(url=listing.thumbnail_url)
+            debug_log("Set thumbnail: %s", listing.thumbnail_url)
         new_embed.set_author(
-            name=embed.author.name if embed.author else "",
-            icon_url=embed.author.icon_url if embed.author else None,
+            name=listing.author_name,
+            icon_url=listing.author_icon_url,
         )
         debug_log(
-            f"Set author: {embed.author.name if embed.author else ''}, icon: {embed.author.icon_url if embed.author else None}"
+            "Set author: %s, icon: %s",
+            listing.author_name,
+            listing.author_icon_url,
         )
         new_embed.add_field(
-            name="Buy Command (Android)", value=f";m b {id}", inline=False
+            name="Buy Command (Android)", value=f";m b {listing_id}", inline=False
         )
         new_embed.add_field(
-            name="Buy Command (Iphone)", value=f"`;m b {id}`", inline=False
+            name="Buy Command (Iphone)", value=f"`;m b {listing_id}`", inline=False
         )
-        new_embed.add_field(name="ID", value=id, inline=True)
+        new_embed.add_field(name="ID", value=listing_id, inline=True)
         new_embed.add_field(
             name="Listed Price",
             value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,}",
             inline=True,
         )
-        new_embed.add_field(name="Amount", value=str(amount), inline=True)
+        new_embed.add_field(name="Amount", value=str(listing.amount), inline=True)
         new_embed.add_field(
             name="Lowest Market",
             value=(
@@ -190,7 +132,7 @@ async def market_snipe_handler(
 
         new_embed.add_field(
             name="Listing Seen",
-            value=listing_seen,
+            value=listing.listing_seen or "N/A",
             inline=True,
         )
 
@@ -199,20 +141,20 @@ async def market_snipe_handler(
             icon_url=guild.icon.url if guild else None,
         )
         debug_log(
-            f"Set footer: Kindly check market listing before purchasing. Icon: {guild.icon.url if guild else None}"
+            "Set footer: Kindly check market listing before purchasing. Icon: %s",
+            guild.icon.url if guild else None,
         )
         # await snipe_channel.send(content=content, embed=new_embed)
-        debug_log(f"Sending webhook for snipe notification.")
-        try:
-            await send_webhook(
-                bot=bot,
-                channel=snipe_channel,
-                content=content,
-                embed=new_embed,
-            )
-        except Exception as e:
-            debug_log(f"Exception in send_webhook for snipe: {e}", highlight=True)
-            return
+        debug_log("Sending webhook for snipe notification.")
+        # Failures propagate to the fan-out, which reports them per target
+        started = time.perf_counter()
+        await send_webhook(
+            bot=bot,
+            channel=snipe_channel,
+            content=content,
+            embed=new_embed,
+        )
+        record_market_duration("webhook_send", started)
 
         pretty_log(
             "sent",
@@ -221,94 +163,115 @@ async def market_snipe_handler(
 
 
 # 🟣────────────────────────────────────────────
-#        👂 Market Alert Handler
+#        👂 Market Alert Embed
 # 🟣────────────────────────────────────────────
-async def handle_market_alert(
-    bot: discord.Client,
-    user_name: str,
+def build_market_alert_embed(
     guild: discord.Guild,
-    original_id: str,
-    poke_name: str,
-    listed_price: int,
-    channel_id: int,
-    role_id: int,
-    amount: int,
-    lowest_market: int,
-    listing_seen: str,
-    embed: discord.Embed,
-):
-
-    alert_channel = guild.get_channel(channel_id)
-    if not alert_channel:
-        pretty_log(
-            "error",
-            f"Alert channel with ID {channel_id} not found in guild {guild.name}",
-        )
-        return
-
-    # Build embed
-    color = embed.color or 0x00FF00
-    alert_embed = discord.Embed(color=color)
-    if embed.thumbnail:
-        alert_embed.set_thumbnail(url=embed.thumbnail.url)
+    listing: MarketListing,
+) -> discord.Embed:
+    """
+    Builds the alert embed for a listing. Built once per listing and shared by
+    every alert channel it is sent to.
+    """
+    alert_embed = discord.Embed(color=listing.color or 0x00FF00)
+    if listing.thumbnail_url:
+        alert_embed.set_thumbnail(url=listing.thumbnail_url)
     alert_embed.set_author(
-        name=embed.author.name if embed.author else "",
-        icon_url=embed.author.icon_url if embed.author else None,
+        name=listing.author_name,
+        icon_url=listing.author_icon_url,
     )
 
     # Buy command
-    alert_embed.add_field(name="Buy Command", value=f";m b {original_id}", inline=False)
-    alert_embed.add_field(name="ID", value=original_id, inline=True)
+    alert_embed.add_field(
+        name="Buy Command", value=f";m b {listing.listing_id}", inline=False
+    )
+    alert_embed.add_field(name="ID", value=listing.listing_id, inline=True)
     alert_embed.add_field(
         name="Listed Price",
-        value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,}",
+        value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {listing.listed_price:,}",
         inline=True,
     )
-    alert_embed.add_field(name="Amount", value=amount, inline=True)
+    alert_embed.add_field(name="Amount", value=str(listing.amount), inline=True)
     alert_embed.add_field(
         name="Lowest Market",
-        value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {lowest_market:,}",
+        value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {listing.lowest_market:,}",
         inline=True,
     )
     alert_embed.add_field(
         name="Listing Seen",
-        value=listing_seen,
+        value=listing.listing_seen or "N/A",
         inline=True,
     )
     alert_embed.set_footer(
         text="Kindly check market listing before purchasing.",
         icon_url=guild.icon.url if guild else None,
     )
-    if role_id:
-        content = f"<@&{role_id}> {poke_name.title()} listed for {VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,} each!"
-    else:
-        content = f"{poke_name.title()} listed for {VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,} each!"
+    return alert_embed
+
+
+# 🟣────────────────────────────────────────────
+#        👂 Market Alert Handler
+# 🟣────────────────────────────────────────────
+async def handle_market_alert(
+    bot: discord.Client,
+    user_names: list[str],
+    guild: discord.Guild,
+    listing: MarketListing,
+    channel_id: int,
+    role_ids: list[int],
+    alert_embed: discord.Embed,
+):
+    """
+    Sends one alert message to channel_id for every alert that points at it,
+    pinging all of their roles at once.
+    """
+    alert_channel = guild.get_channel(channel_id)
+    if not alert_channel:
+        pretty_log(
+            "error",
+            f"Alert channel with ID {channel_id} not found in guild {guild.name}",
+        )
+        return
+
+    # Ping each role once, keeping the order the alerts matched in
+    role_pings = " ".join(f"<@&{role_id}>" for role_id in dict.fromkeys(role_ids))
+    content = f"{listing.display_name} listed for {VN_ALLSTARS_EMOJIS.vna_pokecoin} {listing.listed_price:,} each!"
+    if role_pings:
+        content = f"{role_pings} {content}"
     # await alert_channel.send(content=content, embed=alert_embed)
+    started = time.perf_counter()
     await send_webhook(
         bot=bot,
         channel=alert_channel,
         content=content,
         embed=alert_embed,
     )
+    record_market_duration("webhook_send", started)
 
     pretty_log(
         "sent",
-        f"Market alert sent in channel {alert_channel.name} for {user_name} {poke_name.title()} at {listed_price:,}",
+        f"Market alert sent in channel {alert_channel.name} for {', '.join(user_names)} {listing.display_name} at {listing.listed_price:,}",
     )
 
 
 # 🟣────────────────────────────────────────────
 #           👂 Market Feeds Listener
 # 🟣────────────────────────────────────────────
-async def market_feeds_listener(bot: discord.Client, message: discord.Message):
+async def market_feeds_listener(
+    bot: discord.Client, message: discord.Message, received_at: float | None = None
+):
     """
     Listens for market listings and detects potential snipes.
+    received_at (time.time() when on_message saw the message) anchors the
+    latency trace's receive stage; it defaults to now.
     """
     debug_log(
-        f"Received message with ID: {message.id} from webhook: {message.webhook_id}"
+        "Received message with ID: %s from webhook: %s",
+        message.id,
+        message.webhook_id,
     )
     if message.webhook_id not in MH_WEBHOOK_IDS:
-        debug_log(f"Message from unallowed webhook: {message.webhook_id}")
+        debug_log("Message from unallowed webhook: %s", message.webhook_id)
         return
 
     if not message.embeds:
@@ -316,253 +279,209 @@ async def market_feeds_listener(bot: discord.Client, message: discord.Message):
         return
 
     if message.id in processed_market_feed_message_ids:
-        debug_log(f"Message ID {message.id} already processed")
+        debug_log("Message ID %s already processed", message.id)
         return
     processed_market_feed_message_ids.add(message.id)
+    trace = start_market_trace(message, received_at)
 
     for embed in message.embeds:
         try:
-            embed_author_name = embed.author.name if embed.author else ""
-            debug_log(f"Processing embed with author: {embed_author_name}")
-
-            match = re.match(r"(.+?)\s+#(\d+)", embed_author_name)
-            if not match:
-                debug_log(f"Could not parse embed author name: {embed_author_name}")
+            listing = parse_market_listing(embed)
+            if listing is None:
+                debug_log("Could not parse market embed author: %s", embed.author)
                 continue
+            trace.mark("parse")
+            debug_log("Parsed listing: %s", listing)
 
-            poke_name = match.group(1)
-            poke_dex = int(match.group(2))
-            debug_log(f"Parsed poke_name: {poke_name}, poke_dex: {poke_dex}")
-
-            fields = {f.name: f.value for f in embed.fields}
-            debug_log(f"Embed fields: {fields}")
-
-            # Extract Listed Price and Lowest Market, removing any emojis
-            listed_price_str = re.sub(
-                r"<a?:\w+:\d+>", "", fields.get("Listed Price", "0")
-            )
-            match_price = re.search(r"(\d[\d,]*)", listed_price_str)
-            listed_price = (
-                int(match_price.group(1).replace(",", "")) if match_price else 0
-            )
-            debug_log(f"Parsed listed_price: {listed_price}")
-
-            lowest_market_str = re.sub(
-                r"<a?:\w+:\d+>", "", fields.get("Lowest Market", "0")
-            )
-            lowest_market_match = re.search(r"(\d[\d,]*)", lowest_market_str)
-            lowest_market = (
-                int(lowest_market_match.group(1).replace(",", ""))
-                if lowest_market_match
-                else 0
-            )
-            debug_log(f"Parsed lowest_market: {lowest_market}")
-
-            listing_seen = fields.get("Listing Seen", "N/A")
-            amount = fields.get("Amount", "1")
-            debug_log(f"Parsed listing_seen: {listing_seen}, amount: {amount}")
-
-            original_id = fields.get("ID", "0")
-            # Robustly handle embed.color
-            embed_color = 0x000000
-            if hasattr(embed, "color") and embed.color:
-                if hasattr(embed.color, "value"):
-                    embed_color = embed.color.value
-                else:
-                    try:
-                        embed_color = int(embed.color)
-                    except Exception:
-                        embed_color = 0x000000
-            debug_log(f"Parsed embed_color: {embed_color}")
-            is_exclusive = True if embed_color == 0xEA260B else False
-            display_pokemon_name = poke_name.title()
-            thumbnail_url = embed.thumbnail.url if embed.thumbnail else None
-            author_icon_url = embed.author.icon_url if embed.author else None
+            poke_name = listing.poke_name
+            listed_price = listing.listed_price
+            lowest_market = listing.lowest_market
+            original_id = listing.listing_id
+            display_pokemon_name = listing.display_name
 
             if original_id in processed_market_feed_ids:
-                debug_log(f"Market Feed ID {original_id} already processed")
+                debug_log("Market Feed ID %s already processed", original_id)
                 continue
-            debug_log(f"Market Feed ID {original_id}")
+            debug_log("Market Feed ID %s", original_id)
             processed_market_feed_ids.add(original_id)
 
-            # If Listed Price is 30% or more below Lowest Market, it's a snipe
-            if lowest_market > 0 and listed_price <= lowest_market * 0.7:
+            # 📣 Every notification for this listing is dispatched together
+            notifications = []
+
+            # Snipe under the fixed 30% rule, tightened by the adaptive threshold
+            snipe_lowest_market = None
+            if is_snipe_price(poke_name, listed_price, lowest_market):
                 debug_log(
-                    f"Snipe detected for {poke_name} at price {listed_price} (lowest market: {lowest_market})"
+                    "Snipe detected for %s at price %s (lowest market: %s)",
+                    poke_name,
+                    listed_price,
+                    lowest_market,
                 )
-
-                try:
-                    await market_snipe_handler(
-                        bot=bot,
-                        poke_name=poke_name,
-                        listed_price=listed_price,
-                        id=original_id,
-                        lowest_market=lowest_market,
-                        amount=int(amount),
-                        listing_seen=listing_seen,
-                        guild=message.guild,
-                        embed=embed,
-                    )
-                except Exception as e:
-                    debug_log(f"Exception in market_snipe_handler: {e}", highlight=True)
+                snipe_lowest_market = lowest_market if lowest_market > 0 else "?"
             elif lowest_market == 0:
-                # First listing, no lowest market to compare
-                pretty_log(
-                    "info",
-                    f"First listing detected for {display_pokemon_name} with ID {original_id}. Treating as potential snipe.",
+                debug_log(
+                    "First listing for %s with ID %s has no price history, not a snipe",
+                    display_pokemon_name,
+                    original_id,
                 )
-                lowest_market = "?"
-                try:
-                    await market_snipe_handler(
-                        bot=bot,
-                        poke_name=poke_name,
-                        listed_price=listed_price,
-                        id=original_id,
-                        lowest_market=lowest_market,
-                        amount=int(amount),
-                        listing_seen=listing_seen,
-                        guild=message.guild,
-                        embed=embed,
-                    )
-                except Exception as e:
-                    debug_log(f"Exception in market_snipe_handler: {e}", highlight=True)
-                    pretty_log(
-                        "error",
-                        f"Error handling market snipe for {display_pokemon_name} with ID {original_id}: {e}",
-                    )
 
-            # Check for market alerts
-            if not market_alert_cache:
-                debug_log("Market alert cache is empty, skipping alert checks.")
-                continue  # Skip if cache is empty
-
-            # ✅ O(1) lookup using indexed cache
-            alerts_to_check = [
-                alert
-                for key, alert in _market_alert_index.items()
-                if key[0].lower() == poke_name.lower()
-            ]
-            debug_log(f"Alerts to check: {alerts_to_check}")
-
-            for alert in alerts_to_check:
-                if not isinstance(alert, dict):
-                    debug_log(f"Skipping alert (not a dict): {alert}")
-                    continue
-                debug_log(
-                    f"Checking alert for user {alert['user_name']} and pokemon {alert['pokemon']}"
+            if snipe_lowest_market is not None:
+                notifications.append(
+                    (
+                        SNIPE_CHANNEL_ID,
+                        f"snipe {display_pokemon_name} ({original_id})",
+                        partial(
+                            market_snipe_handler,
+                            bot=bot,
+                            listing=listing,
+                            lowest_market=snipe_lowest_market,
+                            guild=message.guild,
+                        ),
+                    )
                 )
-                debug_log(f"Alert type: {type(alert)}, value: {alert}")
-                if (
-                    alert["pokemon"].lower() == poke_name.lower()
-                    and listed_price <= alert["max_price"]
-                ):
-                    role_id = alert["role_id"]
-                    channel_id = alert["channel_id"]
-                    user_name = alert["user_name"]
 
+            # ✅ Check for market alerts: bisect over the per-Pokémon price-sorted alert index
+            triggered_alerts = fetch_triggered_alerts(poke_name, listed_price)
+            debug_log("Triggered alerts: %s", triggered_alerts)
+
+            if triggered_alerts:
+                alert_embed = build_market_alert_embed(message.guild, listing)
+
+                # Merge alerts that share a channel into a single message
+                alerts_by_channel: dict[int, list[dict]] = {}
+                for alert in triggered_alerts:
+                    alerts_by_channel.setdefault(alert["channel_id"], []).append(alert)
+
+                for channel_id, channel_alerts in alerts_by_channel.items():
+                    user_names = [alert["user_name"] for alert in channel_alerts]
                     debug_log(
-                        f"Triggering market alert for {user_name} on {poke_name} at price {listed_price}"
+                        "Triggering market alert in %s for %s on %s at price %s",
+                        channel_id,
+                        user_names,
+                        poke_name,
+                        listed_price,
                     )
-                    await handle_market_alert(
-                        bot=bot,
-                        user_name=user_name,
-                        guild=message.guild,
-                        original_id=original_id,
-                        poke_name=poke_name,
-                        listed_price=listed_price,
-                        channel_id=channel_id,
-                        role_id=role_id,
-                        amount=amount,
-                        lowest_market=lowest_market,
-                        listing_seen=listing_seen,
-                        embed=embed,
+                    notifications.append(
+                        (
+                            channel_id,
+                            f"alert {display_pokemon_name} ({original_id}) for {', '.join(user_names)}",
+                            partial(
+                                handle_market_alert,
+                                bot=bot,
+                                user_names=user_names,
+                                guild=message.guild,
+                                listing=listing,
+                                channel_id=channel_id,
+                                role_ids=[
+                                    alert["role_id"]
+                                    for alert in channel_alerts
+                                    if alert["role_id"]
+                                ],
+                                alert_embed=alert_embed,
+                            ),
+                        )
                     )
+
+            trace.mark("decision")
+            await fan_out_notifications(notifications)
+            if notifications:
+                trace.mark("send")
+
             # 💎────────────────────────────────────────────
             #           🏪 Update Market Value Cache & DB
             # 💎────────────────────────────────────────────
-            # Update market value cache with new listing data
-            # Extract additional market data
-            market_value_rarity = determine_rarity_from_name_and_author_icon(
-                poke_name, author_icon_url, embed_color
-            )
-            poke_dex = int(poke_dex)
-            lowest_market_str = re.sub(
-                r"<a?:\w+:\d+>", "", fields.get("Lowest Market", "0")
-            )
-            lowest_market_match = re.search(r"(\d[\d,]*)", lowest_market_str)
-            lowest_market = (
-                int(lowest_market_match.group(1).replace(",", ""))
-                if lowest_market_match
-                else 0
+            update_market_value_from_listing(bot, listing)
+
+            # 📈 Price history: rolling window in memory, batched append to DB
+            record_market_price(poke_name, listed_price)
+            queue_price_history(
+                bot,
+                pokemon_name=poke_name,
+                listing_id=original_id,
+                listed_price=listed_price,
+                lowest_market=lowest_market,
+                amount=listing.amount,
             )
+            trace.mark("db_queued")
 
-            listing_seen = fields.get("Listing Seen", "Unknown")
-
-            # Upsert into market value cache
-            cache_key = poke_name.lower()
-
-            # Get existing data to preserve true lowest price
-            existing_data = market_value_cache.get(cache_key, {})
-            existing_lowest = existing_data.get("true_lowest", float("inf"))
-
-            # Ensure all values are not None for min/max
-            price_candidates = [listed_price, lowest_market, existing_lowest]
-            price_candidates = [p for p in price_candidates if p is not None]
-            if price_candidates:
-                true_lowest = min(price_candidates)
-            else:
-                true_lowest = 0
-
-            # Only update if we have a valid price (not 0)
-            if true_lowest == float("inf") or true_lowest == 0:
-                max_candidates = [listed_price, lowest_market]
-                max_candidates = [p for p in max_candidates if p is not None]
-                if max_candidates and max(max_candidates) > 0:
-                    true_lowest = max(max_candidates)
-                else:
-                    true_lowest = 0
-
-            # Only update DB if any value has changed
-            cache_update = {
-                "pokemon": poke_name,
-                "dex_number": poke_dex,
-                "is_exclusive": is_exclusive,
-                "lowest_market": lowest_market,
-                "current_listing": listed_price,
-                "true_lowest": true_lowest,
-                "listing_seen": listing_seen,
-                "image_link": thumbnail_url,
-                "rarity": market_value_rarity,
-            }
-            prev = market_value_cache.get(cache_key, {})
-            needs_update = (
-                prev.get("lowest_market") != lowest_market
-                or prev.get("current_listing") != listed_price
-                or prev.get("true_lowest") != true_lowest
-                or prev.get("listing_seen") != listing_seen
-                or prev.get("dex_number") != poke_dex
-                or prev.get("is_exclusive") != is_exclusive
-                or prev.get("image_link") != thumbnail_url
-                or prev.get("rarity") != market_value_rarity
+        except Exception as e:
+            debug_log(
+                "Exception in embed processing: %s",
+                e,
+                highlight=True,
+                force=True,
             )
-            market_value_cache[cache_key] = cache_update
-            if needs_update:
-                await set_market_value(
-                    bot,
-                    pokemon_name=poke_name,
-                    dex_number=poke_dex,
-                    is_exclusive=is_exclusive,
-                    lowest_market=lowest_market,
-                    current_listing=listed_price,
-                    true_lowest=true_lowest,
-                    listing_seen=listing_seen,
-                    image_link=thumbnail_url,
-                    rarity=market_value_rarity,
-                )
-                pretty_log(
-                    "debug",
-                    f"Updated market value cache and DB for {poke_name}: {cache_update}",
-                )
 
-        except Exception as e:
-            debug_log(f"Exception in embed processing: {e}", highlight=True, force=True)
+
+def update_market_value_from_listing(bot: discord.Client, listing: MarketListing):
+    """
+    Updates market_value_cache from a parsed listing and queues a DB write
+    when anything changed.
+    """
+    poke_name = listing.poke_name
+    listed_price = listing.listed_price
+    lowest_market = listing.lowest_market
+    market_value_rarity = listing.rarity
+    listing_seen = listing.listing_seen or "Unknown"
+
+    # Upsert into market value cache
+    cache_key = poke_name.lower()
+
+    # Get existing data to preserve true lowest price
+    existing_data = market_value_cache.get(cache_key, {})
+    existing_lowest = existing_data.get("true_lowest", float("inf"))
+
+    # Ensure all values are not None for min/max
+    price_candidates = [listed_price, lowest_market, existing_lowest]
+    price_candidates = [p for p in price_candidates if p is not None]
+    if price_candidates:
+        true_lowest = min(price_candidates)
+    else:
+        true_lowest = 0
+
+    # Only update if we have a valid price (not 0)
+    if true_lowest == float("inf") or true_lowest == 0:
+        max_candidates = [listed_price, lowest_market]
+        max_candidates = [p for p in max_candidates if p is not None]
+        if max_candidates and max(max_candidates) > 0:
+            true_lowest = max(max_candidates)
+        else:
+            true_lowest = 0
+
+    # Only update DB if any value has changed
+    cache_update = {
+        "pokemon": poke_name,
+        "dex_number": listing.dex,
+        "is_exclusive": listing.is_exclusive,
+        "lowest_market": lowest_market,
+        "current_listing": listed_price,
+        "true_lowest": true_lowest,
+        "listing_seen": listing_seen,
+        "image_link": listing.thumbnail_url,
+        "rarity": market_value_rarity,
+    }
+    prev = market_value_cache.get(cache_key, {})
+    needs_update = any(
+        prev.get(key) != value
+        for key, value in cache_update.items()
+        if key != "pokemon"
+    )
+    market_value_cache[cache_key] = cache_update
+    if needs_update:
+        # Written by the write-behind buffer, off the notification path
+        queue_market_value(
+            bot,
+            pokemon_name=poke_name,
+            dex_number=listing.dex,
+            is_exclusive=listing.is_exclusive,
+            lowest_market=lowest_market,
+            current_listing=listed_price,
+            true_lowest=true_lowest,
+            listing_seen=listing_seen,
+            image_link=listing.thumbnail_url,
+            rarity=market_value_rarity,
+        )
+        pretty_log(
+            "debug",
+            f"Updated market value cache and queued DB write for {poke_name}: {cache_update}",
+        )
@@ -1,44 +1,95 @@
 # utils/loggers/smart_debug.py
-import inspect
+import sys
 from datetime import datetime
 import discord
 
 # -----------------------------
 # 🔹 Global Debug Toggles
 # -----------------------------
+# Keys are "module.function" (as in enable_debug(f"{__name__}.func")) or a bare
+# module name to enable every debug_log in that module.
 DEBUG_TOGGLES: dict[str, bool] = {}
 
+# Derived from DEBUG_TOGGLES on every change so debug_log only does set lookups
+_enabled_keys: set[str] = set()
+_enabled_modules: set[str] = set()  # modules with at least one enabled key
+
+
+def _rebuild_enabled():
+    _enabled_keys.clear()
+    _enabled_modules.clear()
+    for key, enabled in DEBUG_TOGGLES.items():
+        if not enabled:
+            continue
+        _enabled_keys.add(key)
+        _enabled_modules.add(key)  # a bare module name
+        module_name, _, _ = key.rpartition(".")
+        if module_name:
+            _enabled_modules.add(module_name)  # the module of "module.func"
+
 
 def enable_debug(func_path: str):
     DEBUG_TOGGLES[func_path] = True
+    _rebuild_enabled()
 
 
 def disable_debug(func_path: str):
     DEBUG_TOGGLES[func_path] = False
+    _rebuild_enabled()
+
+
+def clear_debug_toggles():
+    DEBUG_TOGGLES.clear()
+    _rebuild_enabled()
 
 
 def debug_enabled(func_path: str) -> bool:
-    return DEBUG_TOGGLES.get(func_path, False)
+    if func_path in _enabled_keys:
+        return True
+    module_name, _, _ = func_path.rpartition(".")
+    return module_name in _enabled_keys
 
 
 # -----------------------------
 # 🔹 Core debug_log
 # -----------------------------
 def debug_log(
-    message: str, highlight: bool = False, disabled: bool = False, force: bool = False
+    message,
+    *args,
+    highlight: bool = False,
+    disabled: bool = False,
+    force: bool = False,
 ):
+    """
+    Prints message when debugging is enabled for the calling function (or its
+    module). With nothing enabled this returns before touching the stack.
+
+    Formatting is lazy: pass %-style args (debug_log("Listing: %s", listing))
+    or a zero-arg callable, and they're only rendered when the line prints.
+    """
     if disabled:
         return
-
-    stack = inspect.stack()
-    caller_frame = stack[1]
-    func_name = caller_frame.function
-    module_name = caller_frame.frame.f_globals.get("__name__", "__main__")
-    key = f"{module_name}.{func_name}"
-
-    if not debug_enabled(key) and not force:
+    if not force and not _enabled_modules:
         return
 
+    # Only the caller's frame is needed, not inspect.stack()'s full walk
+    caller = sys._getframe(1)
+    func_name = caller.f_code.co_name
+    if not force:
+        module_name = caller.f_globals.get("__name__", "__main__")
+        if module_name not in _enabled_modules:
+            return
+        if (
+            f"{module_name}.{func_name}" not in _enabled_keys
+            and module_name not in _enabled_keys
+        ):
+            return
+
+    if callable(message):
+        message = message()
+    elif args:
+        message = message % args
+
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     log_line = f"[{timestamp}] [🧪 {func_name}] {message}"
 
@@ -0,0 +1,138 @@
+import json
+import os
+import time
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+
+import discord
+
+from Constants.variables import DATA_DIR
+
+# 🟣────────────────────────────────────────────
+#   ⏱️ Market Pipeline Latency Tracing
+# 🟣────────────────────────────────────────────
+# Stages are cumulative: ms from message.created_at until the stage completes.
+MARKET_TRACE_STAGES = ("receive", "parse", "decision", "send", "db_queued")
+# Durations are standalone: ms spent inside one operation.
+MARKET_TRACE_DURATIONS = ("webhook_send", "db_flush")
+
+HISTOGRAM_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+HISTOGRAM_SAMPLE_SIZE = 2048  # recent samples kept per histogram for percentiles
+
+MARKET_TRACE_DUMP_FILE = os.path.join(DATA_DIR, "market_latency.json")
+
+
+class LatencyHistogram:
+    """
+    Rolling latency histogram: cumulative bucket counts since startup plus the
+    most recent HISTOGRAM_SAMPLE_SIZE samples for percentiles.
+    """
+
+    __slots__ = ("counts", "samples", "total", "sum_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)  # last bucket is +Inf
+        self.samples = deque(maxlen=HISTOGRAM_SAMPLE_SIZE)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float):
+        self.counts[bisect_left(HISTOGRAM_BUCKETS_MS, ms)] += 1
+        self.samples.append(ms)
+        self.total += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, pct: float) -> float | None:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[round(pct / 100 * (len(ordered) - 1))]
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+            "buckets": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(HISTOGRAM_BUCKETS_MS, self.counts)
+                },
+                "le_inf": self.counts[-1],
+            },
+        }
+
+
+market_latency_histograms: dict[str, LatencyHistogram] = {
+    name: LatencyHistogram()
+    for name in MARKET_TRACE_STAGES + MARKET_TRACE_DURATIONS
+}
+
+
+class MarketTrace:
+    """
+    Per-message trace. The receive stage is created_at -> received_at (when
+    on_message saw the message; defaults to now), so handler task scheduling
+    lands in the later stages. mark() records the elapsed time since
+    message.created_at for a stage.
+    """
+
+    __slots__ = ("_origin",)
+
+    def __init__(self, created_at: datetime, received_at: float | None = None):
+        now = time.perf_counter()
+        wall_now = time.time()
+        created = created_at.timestamp()
+        if received_at is None:
+            received_at = wall_now
+        # Gateway delay is wall-clock; everything after is monotonic
+        receive_ms = max(0.0, (received_at - created) * 1000)
+        self._origin = now - max(0.0, wall_now - created)
+        market_latency_histograms["receive"].add(receive_ms)
+
+    def mark(self, stage: str):
+        market_latency_histograms[stage].add(
+            (time.perf_counter() - self._origin) * 1000
+        )
+
+
+def start_market_trace(
+    message: discord.Message, received_at: float | None = None
+) -> MarketTrace:
+    return MarketTrace(message.created_at, received_at)
+
+
+def record_market_duration(name: str, started: float):
+    """Records the time since started (a time.perf_counter() value) under name."""
+    market_latency_histograms[name].add((time.perf_counter() - started) * 1000)
+
+
+def market_latency_snapshot() -> dict:
+    return {name: hist.to_dict() for name, hist in market_latency_histograms.items()}
+
+
+def reset_market_latency():
+    for name in market_latency_histograms:
+        market_latency_histograms[name] = LatencyHistogram()
+
+
+def dump_market_latency(path: str = MARKET_TRACE_DUMP_FILE) -> str:
+    """Writes the current snapshot as JSON and returns the path."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "generated_at": datetime.utcnow().isoformat(),
+                "bucket_bounds_ms": HISTOGRAM_BUCKETS_MS,
+                "histograms": market_latency_snapshot(),
+            },
+            f,
+            indent=2,
+        )
+    return path
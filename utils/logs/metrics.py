@@ -0,0 +1,315 @@
+import asyncio
+import json
+import os
+import time
+
+from aiohttp import web
+from discord.ext import commands
+
+from utils.logs.market_trace import (
+    HISTOGRAM_BUCKETS_MS,
+    LatencyHistogram,
+    market_latency_histograms,
+)
+from utils.logs import stall_watchdog
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#   📈 Metrics & Health Endpoint
+# 🟣────────────────────────────────────────────
+# Served by aiohttp on the bot's own event loop (no Flask thread):
+#   /         plain liveness string
+#   /health   JSON startup-checklist snapshot, 503 until the bot and pool are up
+#   /metrics  Prometheus text format
+METRICS_HOST = os.getenv("METRICS_HOST", "0.0.0.0")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "8080"))
+
+LOOP_LAG_INTERVAL_SECONDS = 0.5
+
+loop_lag_histogram = LatencyHistogram()
+handler_latency_histograms: dict[str, LatencyHistogram] = {}
+handler_error_counts: dict[str, int] = {}
+webhook_send_counts = {"sent": 0, "failed": 0}
+
+_metrics_runner: web.AppRunner | None = None
+_loop_lag_task: asyncio.Task | None = None
+
+
+# -------------------- 🧮 Recorders --------------------
+def record_handler(name: str, started: float, error: bool = False):
+    """Records the time since started (a time.perf_counter() value) for a message handler."""
+    hist = handler_latency_histograms.get(name)
+    if hist is None:
+        hist = handler_latency_histograms[name] = LatencyHistogram()
+    hist.add((time.perf_counter() - started) * 1000)
+    if error:
+        handler_error_counts[name] = handler_error_counts.get(name, 0) + 1
+
+
+def record_webhook_send(ok: bool):
+    webhook_send_counts["sent" if ok else "failed"] += 1
+
+
+async def _measure_loop_lag():
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + LOOP_LAG_INTERVAL_SECONDS
+        await asyncio.sleep(LOOP_LAG_INTERVAL_SECONDS)
+        loop_lag_histogram.add(max(0.0, loop.time() - expected) * 1000)
+
+
+# -------------------- 🩺 Snapshots --------------------
+def cache_sizes() -> dict[str, int]:
+    """Entry counts for every container in utils/cache/cache_list.py."""
+    from utils.cache import cache_list
+    from utils.cache.ttl_dedup import TTLDedupStore
+
+    return {
+        name: len(value)
+        for name, value in vars(cache_list).items()
+        if not name.startswith("_")
+        and isinstance(value, (dict, list, set, TTLDedupStore))
+    }
+
+
+def pool_stats(bot: commands.Bot) -> dict | None:
+    pool = getattr(bot, "pg_pool", None)
+    return pool.stats() if pool is not None else None
+
+
+def health_snapshot(bot: commands.Bot) -> dict:
+    pool = pool_stats(bot)
+    return {
+        "ready": bot.is_ready(),
+        "gateway_latency_ms": _gateway_latency_ms(bot),
+        "cogs_loaded": len(bot.cogs),
+        "slash_commands": sum(1 for _ in bot.tree.walk_commands()),
+        "pg_pool": pool,
+        "caches": cache_sizes(),
+        "loop_lag_p99_ms": loop_lag_histogram.percentile(99),
+    }
+
+
+def _gateway_latency_ms(bot: commands.Bot) -> float | None:
+    latency = bot.latency
+    # discord.py reports inf/nan before the first heartbeat ack
+    if latency != latency or latency == float("inf"):
+        return None
+    return latency * 1000
+
+
+# -------------------- 📝 Prometheus Text --------------------
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict | None) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+    return "{" + inner + "}"
+
+
+class _MetricsWriter:
+    def __init__(self):
+        self.lines: list[str] = []
+        self._declared: set[str] = set()
+
+    def _declare(self, name: str, kind: str, help_text: str):
+        if name not in self._declared:
+            self._declared.add(name)
+            self.lines.append(f"# HELP {name} {help_text}")
+            self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(
+        self, name: str, kind: str, help_text: str, value, labels: dict | None = None
+    ):
+        if value is None:
+            return
+        self._declare(name, kind, help_text)
+        self.lines.append(f"{name}{_labels(labels)} {float(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        hist: LatencyHistogram,
+        labels: dict | None = None,
+    ):
+        self._declare(name, "histogram", help_text)
+        cumulative = 0
+        for bound, count in zip(HISTOGRAM_BUCKETS_MS, hist.counts):
+            cumulative += count
+            self.lines.append(
+                f"{name}_bucket{_labels({**(labels or {}), 'le': bound})} {cumulative}"
+            )
+        self.lines.append(
+            f"{name}_bucket{_labels({**(labels or {}), 'le': '+Inf'})} {hist.total}"
+        )
+        self.lines.append(f"{name}_sum{_labels(labels)} {hist.sum_ms}")
+        self.lines.append(f"{name}_count{_labels(labels)} {hist.total}")
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_metrics(bot: commands.Bot) -> str:
+    from utils.db.query_profiler import pool_latency_histograms
+
+    out = _MetricsWriter()
+    out.sample(
+        "vna_up", "gauge", "1 once the gateway session is ready.", int(bot.is_ready())
+    )
+    out.sample(
+        "vna_gateway_latency_ms",
+        "gauge",
+        "Discord heartbeat round trip.",
+        _gateway_latency_ms(bot),
+    )
+    out.sample("vna_cogs_loaded", "gauge", "Loaded cogs.", len(bot.cogs))
+    out.histogram(
+        "vna_event_loop_lag_ms",
+        f"How late a {LOOP_LAG_INTERVAL_SECONDS}s sleep on the event loop woke up.",
+        loop_lag_histogram,
+    )
+    out.histogram(
+        "vna_event_loop_stall_ms",
+        "Loop stalls past the watchdog threshold.",
+        stall_watchdog.stall_histogram,
+    )
+    for location, count in stall_watchdog.top_stall_locations():
+        out.sample(
+            "vna_event_loop_stalls_total",
+            "counter",
+            "Loop stalls by innermost project frame.",
+            count,
+            {"location": location},
+        )
+
+    # 🩵 Message handlers
+    for name, hist in handler_latency_histograms.items():
+        out.histogram(
+            "vna_handler_latency_ms",
+            "on_message handler run time.",
+            hist,
+            {"handler": name},
+        )
+    for name, count in handler_error_counts.items():
+        out.sample(
+            "vna_handler_errors_total",
+            "counter",
+            "on_message handler exceptions.",
+            count,
+            {"handler": name},
+        )
+
+    # 🛒 Market pipeline
+    for name, hist in market_latency_histograms.items():
+        out.histogram(
+            "vna_market_latency_ms",
+            "Market feed pipeline stage latency.",
+            hist,
+            {"stage": name},
+        )
+
+    # 🪝 Webhooks
+    for result, count in webhook_send_counts.items():
+        out.sample(
+            "vna_webhook_sends_total",
+            "counter",
+            "Webhook sends by result.",
+            count,
+            {"result": result},
+        )
+
+    # 💙 Postgres pool
+    pool = pool_stats(bot)
+    if pool is not None:
+        for key in ("size", "idle", "in_use", "max_size"):
+            out.sample(
+                f"vna_pg_pool_{key}", "gauge", f"Postgres pool {key}.", pool[key]
+            )
+        out.sample(
+            "vna_pg_circuit_open",
+            "gauge",
+            "1 while the Postgres circuit breaker fails fast.",
+            int(pool["circuit_open"]),
+        )
+        out.sample(
+            "vna_pg_reconnects_total",
+            "counter",
+            "Postgres pool reconnect attempts.",
+            pool["reconnects"],
+        )
+    out.histogram(
+        "vna_pg_pool_wait_ms",
+        "Time spent waiting for a pooled connection.",
+        pool_latency_histograms["pool_wait"],
+    )
+
+    # 🧀 Caches
+    for name, size in cache_sizes().items():
+        out.sample(
+            "vna_cache_entries", "gauge", "Entries per cache.", size, {"cache": name}
+        )
+    return out.render()
+
+
+# -------------------- 🌐 HTTP Server --------------------
+def _build_app(bot: commands.Bot) -> web.Application:
+    async def home(request: web.Request):
+        return web.Response(text="Gholdengo is watching...")
+
+    async def health(request: web.Request):
+        snapshot = health_snapshot(bot)
+        healthy = snapshot["ready"] and snapshot["pg_pool"] is not None
+        return web.Response(
+            text=json.dumps(snapshot, default=str),
+            content_type="application/json",
+            status=200 if healthy else 503,
+        )
+
+    async def metrics(request: web.Request):
+        return web.Response(
+            text=render_metrics(bot),
+            content_type="text/plain",
+            charset="utf-8",
+            headers={"X-Content-Type-Options": "nosniff"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/", home)
+    app.router.add_get("/health", health)
+    app.router.add_get("/metrics", metrics)
+    return app
+
+
+async def start_metrics_server(
+    bot: commands.Bot, host: str = METRICS_HOST, port: int = METRICS_PORT
+):
+    """Starts the HTTP endpoint and the loop lag probe on the running loop."""
+    global _metrics_runner, _loop_lag_task
+    if _loop_lag_task is None:
+        _loop_lag_task = asyncio.create_task(_measure_loop_lag())
+    if _metrics_runner is not None:
+        return
+    runner = web.AppRunner(_build_app(bot), access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        await runner.cleanup()
+        pretty_log("warn", f"Metrics server could not bind {host}:{port}: {e}")
+        return
+    _metrics_runner = runner
+    pretty_log("ready", f"✅ Metrics server listening on {host}:{port}")
+
+
+async def stop_metrics_server():
+    global _metrics_runner, _loop_lag_task
+    if _loop_lag_task is not None:
+        _loop_lag_task.cancel()
+        _loop_lag_task = None
+    if _metrics_runner is not None:
+        await _metrics_runner.cleanup()
+        _metrics_runner = None
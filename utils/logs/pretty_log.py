@@ -1,9 +1,19 @@
+import asyncio
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
 import traceback
 from datetime import datetime
 
 import discord
 from discord.ext import commands
 
+from Constants.variables import DATA_DIR
+
 CC_ERROR_LOGS_CHANNEL_ID = 1444997181244444672
 # -------------------- 🧩 Global Bot Reference --------------------
 from typing import Optional
@@ -60,6 +70,330 @@ CRITICAL_LOG_CHANNEL_LIST = [
 ]
 
 
+# -------------------- 🚚 Log Pipeline --------------------
+# pretty_log only builds a record and queues it; a background writer thread
+# does the console print, appends to a rotating JSON-lines file, and batches
+# Discord-bound entries so an error storm becomes one message per channel
+# per DISCORD_FLUSH_SECONDS with "×N" counts instead of one send per line.
+# append_jsonl() hands the same thread other JSON-lines files (slow query log).
+LOG_QUEUE_MAX = 10_000
+LOG_QUEUE_SHED_AT = 8_000  # past this, only warn/error/critical are queued
+LOG_BATCH_MAX = 500  # records handled per writer wake-up
+LOG_FILE = os.path.join(DATA_DIR, "logs", "bot.jsonl")
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+DISCORD_FLUSH_SECONDS = 5
+DISCORD_MAX_MESSAGES_PER_FLUSH = 3  # per channel; the rest is summarized
+DISCORD_MESSAGE_LIMIT = 2000
+DISCORD_TAGS = ("critical", "error", "warn")
+TRACE_TAGS = ("error", "critical")
+
+_log_queue: "queue.Queue[dict]" = queue.Queue(maxsize=LOG_QUEUE_MAX)
+_dropped_logs: dict[str, int] = {}  # tag -> records shed while the queue was full
+_dropped_lock = threading.Lock()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+_write_lock = threading.Lock()  # writer thread vs flush_logs()
+
+
+def _format_console_line(record: dict) -> str:
+    tag = record["tag"]
+    color = MAIN_COLORS["yellow"]
+    if tag in ("warn",):
+        color = MAIN_COLORS["orange"]
+    elif tag in ("error",):
+        color = MAIN_COLORS["red"]
+    elif tag in ("critical",):
+        color = MAIN_COLORS["peach"]
+    now = datetime.fromtimestamp(record["ts"]).strftime("%H:%M:%S")
+    return f"{color}[{now}] {record['prefix']}{record['label']}{record['message']}{COLOR_RESET}"
+
+
+class _RotatingJsonlSink:
+    def __init__(self, path: str, max_bytes: int, backups: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def _rotate(self):
+        for index in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{index}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def write(self, records: list[dict]):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            if (
+                os.path.exists(self.path)
+                and os.path.getsize(self.path) >= self.max_bytes
+            ):
+                self._rotate()
+            with open(self.path, "a", encoding="utf-8") as f:
+                for record in records:
+                    f.write(
+                        json.dumps(
+                            {
+                                "at": datetime.fromtimestamp(record["ts"]).isoformat(),
+                                "tag": record["tag"],
+                                "label": record["raw_label"],
+                                "message": record["message"],
+                                "trace": record["trace"],
+                            },
+                            ensure_ascii=False,
+                            default=str,
+                        )
+                        + "\n"
+                    )
+        except OSError as e:
+            print(f"{COLOR_SOFT_RED}[❌ ERROR] Failed to write log file: {e}{COLOR_RESET}")
+
+
+class _DiscordBatcher:
+    """Collects Discord-bound entries and dedups them between flushes."""
+
+    def __init__(self):
+        self.bot: Optional[commands.Bot] = None
+        # (prefix, label, message) -> [count, first trace]
+        self.pending: dict[tuple, list] = {}
+        self.last_flush = time.monotonic()
+
+    def add(self, record: dict):
+        self.bot = record["bot"]
+        key = (record["prefix"], record["label"], record["message"])
+        entry = self.pending.get(key)
+        if entry is None:
+            self.pending[key] = [1, record["trace"]]
+        else:
+            entry[0] += 1
+
+    def _build_messages(self) -> list[str]:
+        blocks = []
+        for (prefix, label, message), (count, trace) in self.pending.items():
+            block = f"{prefix}{label}{message}"
+            if count > 1:
+                block += f" ×{count}"
+            if trace:
+                block += f"\n```py\n{trace}```"
+            if len(block) > DISCORD_MESSAGE_LIMIT:
+                block = block[: DISCORD_MESSAGE_LIMIT - 3] + "..."
+            blocks.append(block)
+
+        # Pack whole blocks into messages so code fences are never split
+        messages: list[list[str]] = []
+        size = DISCORD_MESSAGE_LIMIT
+        for index, block in enumerate(blocks):
+            if size + 1 + len(block) > DISCORD_MESSAGE_LIMIT:
+                if len(messages) == DISCORD_MAX_MESSAGES_PER_FLUSH:
+                    last = messages[-1]
+                    remaining = len(blocks) - index
+                    note = f"…and {remaining} more distinct entries"
+                    while len(last) > 1 and len("\n".join(last + [note])) > (
+                        DISCORD_MESSAGE_LIMIT
+                    ):
+                        last.pop()
+                        remaining += 1
+                        note = f"…and {remaining} more distinct entries"
+                    last.append(note)
+                    break
+                messages.append([])
+                size = -1
+            messages[-1].append(block)
+            size += 1 + len(block)
+        return ["\n".join(parts) for parts in messages]
+
+    def flush_due(self) -> bool:
+        return (
+            bool(self.pending)
+            and time.monotonic() - self.last_flush >= DISCORD_FLUSH_SECONDS
+        )
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+        bot_to_use = self.bot
+        messages = self._build_messages()
+        self.pending.clear()
+        try:
+            # discord.py's loop sentinel raises before bot.start()
+            loop = bot_to_use.loop
+            if loop.is_closed():
+                return
+            # Channel lookups and sends belong on the loop thread
+            loop.call_soon_threadsafe(_send_log_messages, bot_to_use, messages)
+        except Exception as e:
+            print(
+                f"{COLOR_SOFT_RED}[❌ ERROR] Could not schedule Discord log batch: {e}{COLOR_RESET}",
+                file=sys.stderr,
+            )
+
+
+# Keep references to in-flight log sends so they are not garbage collected
+_log_send_tasks: set[asyncio.Task] = set()
+
+
+def _send_log_messages(bot_to_use: commands.Bot, messages: list[str]):
+    """Runs on the bot loop."""
+    for channel_id in CRITICAL_LOG_CHANNEL_LIST:
+        try:
+            channel = bot_to_use.get_channel(channel_id)
+            if channel:
+                for content in messages:
+                    task = asyncio.create_task(channel.send(content))
+                    _log_send_tasks.add(task)
+                    task.add_done_callback(_log_send_tasks.discard)
+        except Exception:
+            print(
+                f"{COLOR_SOFT_RED}[❌ ERROR] Failed to send log to Discord channel {channel_id}{COLOR_RESET}"
+            )
+            traceback.print_exc()
+
+
+def _append_jsonl_lines(path: str, entries: list[dict]):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, default=str) + "\n")
+    except OSError as e:
+        print(
+            f"{COLOR_SOFT_RED}[❌ ERROR] Failed to write {path}: {e}{COLOR_RESET}",
+            file=sys.stderr,
+        )
+
+
+_file_sink = _RotatingJsonlSink(LOG_FILE, LOG_FILE_MAX_BYTES, LOG_FILE_BACKUPS)
+_discord_batcher = _DiscordBatcher()
+
+
+def _take_dropped_summary() -> Optional[dict]:
+    with _dropped_lock:
+        if not _dropped_logs:
+            return None
+        dropped = dict(_dropped_logs)
+        _dropped_logs.clear()
+    counts = ", ".join(f"{tag} ×{count}" for tag, count in dropped.items())
+    return _build_record(
+        "warn",
+        f"Log queue full, dropped {sum(dropped.values())} entries ({counts})",
+        label="pretty_log",
+        bot=None,
+        trace=None,
+    )
+
+
+def _write_batch(records: list[dict]):
+    summary = _take_dropped_summary()
+    if summary:
+        records.append(summary)
+    log_records = []
+    jsonl_entries: dict[str, list[dict]] = {}  # path -> entries from append_jsonl
+    lines = []
+    for record in records:
+        if "jsonl_path" in record:
+            jsonl_entries.setdefault(record["jsonl_path"], []).append(record["entry"])
+            continue
+        log_records.append(record)
+        lines.append(_format_console_line(record))
+        if record["trace"]:
+            lines.append(record["trace"].rstrip("\n"))
+        if record["bot"] and record["tag"] in DISCORD_TAGS:
+            _discord_batcher.add(record)
+    if lines:
+        print("\n".join(lines), flush=True)
+    if log_records:
+        _file_sink.write(log_records)
+    for path, entries in jsonl_entries.items():
+        _append_jsonl_lines(path, entries)
+
+
+def _drain(block_seconds: Optional[float]) -> list[dict]:
+    records = []
+    try:
+        if block_seconds:
+            records.append(_log_queue.get(timeout=block_seconds))
+        while len(records) < LOG_BATCH_MAX:
+            records.append(_log_queue.get_nowait())
+    except queue.Empty:
+        pass
+    return records
+
+
+def _writer_loop():
+    while True:
+        try:
+            records = _drain(DISCORD_FLUSH_SECONDS)
+            with _write_lock:
+                if records:
+                    _write_batch(records)
+                if _discord_batcher.flush_due():
+                    _discord_batcher.flush()
+        except Exception:
+            # Never let one bad batch kill the writer; that would drop every later log
+            print(
+                f"{COLOR_SOFT_RED}[❌ ERROR] pretty_log writer failed a batch{COLOR_RESET}",
+                file=sys.stderr,
+            )
+            traceback.print_exc()
+
+
+def _ensure_writer():
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="pretty-log-writer", daemon=True
+            )
+            _writer_thread.start()
+
+
+def _write_pending():
+    while True:
+        records = _drain(None)
+        if not records:
+            return
+        _write_batch(records)
+
+
+def flush_logs():
+    """Writes out everything still queued and sends pending Discord batches now."""
+    with _write_lock:
+        _write_pending()
+        _discord_batcher.flush()
+
+
+@atexit.register
+def _flush_logs_at_exit():
+    # Console and file only; the bot loop is gone by now
+    with _write_lock:
+        _write_pending()
+
+
+def _build_record(
+    tag: str,
+    message: str,
+    *,
+    label: Optional[str],
+    bot: Optional[commands.Bot],
+    trace: Optional[str],
+) -> dict:
+    prefix = TAGS.get(tag) if tag else ""
+    return {
+        "ts": time.time(),
+        "tag": tag,
+        "prefix": f"[{prefix}] " if prefix else "",
+        "label": f"[{label}] " if label else "",
+        "raw_label": label,
+        "message": str(message),
+        "trace": trace,
+        "bot": bot,
+    }
+
+
 # -------------------- 🌟 Pretty Log --------------------
 def pretty_log(
     tag: str = "info",
@@ -72,46 +406,43 @@ def pretty_log(
     """
     Prints a colored log for Ghouldengo-themed bots with timestamp and emoji.
     Sends critical/error/warn messages to Discord if bot is set.
-    """
-    prefix = TAGS.get(tag) if tag else ""
-    prefix_part = f"[{prefix}] " if prefix else ""
-    label_str = f"[{label}] " if label else ""
 
-    # Choose color based on tag
-    color = MAIN_COLORS["yellow"]
-    if tag in ("warn",):
-        color = MAIN_COLORS["orange"]
-    elif tag in ("error",):
-        color = MAIN_COLORS["red"]
-    elif tag in ("critical",):
-        color = MAIN_COLORS["peach"]
+    The record is queued and written by a background thread. Under
+    backpressure low-priority tags are shed first and every drop is counted
+    in a summary line instead of blocking the caller.
+    """
+    # Tracebacks only exist for the current exception, so format it now
+    trace = None
+    if include_trace and tag in TRACE_TAGS and sys.exc_info()[0] is not None:
+        trace = traceback.format_exc()
 
-    now = datetime.now().strftime("%H:%M:%S")
-    log_message = f"{color}[{now}] {prefix_part}{label_str}{message}{COLOR_RESET}"
-    print(log_message)
+    record = _build_record(
+        tag, message, label=label, bot=bot or BOT_INSTANCE, trace=trace
+    )
+    _ensure_writer()
+    try:
+        if tag not in DISCORD_TAGS and _log_queue.qsize() >= LOG_QUEUE_SHED_AT:
+            raise queue.Full
+        _log_queue.put_nowait(record)
+    except queue.Full:
+        with _dropped_lock:
+            _dropped_logs[tag] = _dropped_logs.get(tag, 0) + 1
 
-    # Optionally print traceback
-    if include_trace and tag in ("error", "critical"):
-        traceback.print_exc()
 
-    # Send to all Discord channels in the list if bot available
-    bot_to_use = bot or BOT_INSTANCE
-    if bot_to_use and tag in ("critical", "error", "warn"):
-        for channel_id in CRITICAL_LOG_CHANNEL_LIST:
-            try:
-                channel = bot_to_use.get_channel(channel_id)
-                if channel:
-                    full_message = f"{prefix_part}{label_str}{message}"
-                    if include_trace and tag in ("error", "critical"):
-                        full_message += f"\n```py\n{traceback.format_exc()}```"
-                    if len(full_message) > 2000:
-                        full_message = full_message[:1997] + "..."
-                    bot_to_use.loop.create_task(channel.send(full_message))
-            except Exception:
-                print(
-                    f"{COLOR_SOFT_RED}[❌ ERROR] Failed to send log to Discord channel {channel_id}{COLOR_RESET}"
-                )
-                traceback.print_exc()
+def append_jsonl(path: str, entry: dict, *, tag: str = "jsonl"):
+    """
+    Queues entry as one JSON line appended to path by the log writer thread,
+    so callers on the event loop never touch the disk. Shed like a low-priority
+    log under backpressure (counted under tag in the dropped summary).
+    """
+    _ensure_writer()
+    try:
+        if _log_queue.qsize() >= LOG_QUEUE_SHED_AT:
+            raise queue.Full
+        _log_queue.put_nowait({"jsonl_path": path, "entry": entry})
+    except queue.Full:
+        with _dropped_lock:
+            _dropped_logs[tag] = _dropped_logs.get(tag, 0) + 1
 
 
 # -------------------- 🌸 UI Error Logger --------------------
@@ -27,11 +27,13 @@ async def send_log_to_server_log(
             pretty_log(f"Server log channel with ID {log_channel_id} not found.")
             return
 
+        # Server logs are not latency critical; don't hold up the caller
         await send_webhook(
             bot,
             log_channel,
             content=content,
             embed=embed,
+            background=True,
         )
     except Exception as e:
         pretty_log(f"Failed to send log to server log channel: {e}")
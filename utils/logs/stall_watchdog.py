@@ -0,0 +1,195 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+from utils.logs.market_trace import LatencyHistogram
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#   🐢 Event Loop Stall Watchdog
+# 🟣────────────────────────────────────────────
+# A helper thread posts a no-op onto the loop every STALL_PROBE_INTERVAL_SECONDS.
+# If it isn't run within the threshold, the loop is blocked: the thread grabs
+# the loop thread's stack right then (while the culprit is still on it), waits
+# for the loop to come back, and records how long the stall lasted.
+STALL_WATCHDOG_ENABLED = os.getenv("STALL_WATCHDOG", "1") != "0"
+STALL_THRESHOLD_MS = 250
+STALL_PROBE_INTERVAL_SECONDS = 0.1
+STALL_STACK_FRAMES = 15  # innermost frames kept per stall
+STALL_RECENT_KEPT = 20
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+stall_histogram = LatencyHistogram()
+stall_location_counts: dict[str, int] = {}  # "path:line in func" -> stalls
+recent_stalls: deque[dict] = deque(maxlen=STALL_RECENT_KEPT)
+_stats_lock = threading.Lock()  # written by the watchdog thread, read on the loop
+
+_watchdog: "LoopStallWatchdog | None" = None
+
+
+def _stall_location(stack: traceback.StackSummary) -> str:
+    """The innermost frame in our own code, else the innermost frame at all."""
+    own_frames = [
+        frame
+        for frame in stack
+        if frame.filename.startswith(PROJECT_ROOT) and frame.filename != __file__
+    ]
+    frame = (own_frames or list(stack) or [None])[-1]
+    if frame is None:
+        return "unknown"
+    path = os.path.relpath(frame.filename, PROJECT_ROOT)
+    if path.startswith(".."):
+        path = frame.filename
+    return f"{path}:{frame.lineno} in {frame.name}"
+
+
+def record_stall(duration_ms: float, stack: traceback.StackSummary):
+    location = _stall_location(stack)
+    with _stats_lock:
+        stall_histogram.add(duration_ms)
+        stall_location_counts[location] = stall_location_counts.get(location, 0) + 1
+        recent_stalls.append(
+            {
+                "at": datetime.utcnow().isoformat(),
+                "ms": round(duration_ms, 1),
+                "location": location,
+            }
+        )
+    stack_text = "".join(stack.format()).rstrip()
+    p95 = stall_histogram.percentile(95)
+    pretty_log(
+        "warn",
+        f"Event loop stalled for {duration_ms:,.0f} ms at {location} "
+        f"(p95 {p95:,.0f} ms over {stall_histogram.total:,} stalls)\n{stack_text}",
+        label="STALL",
+        include_trace=False,
+    )
+
+
+class LoopStallWatchdog:
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        threshold_ms: float = STALL_THRESHOLD_MS,
+        interval_seconds: float = STALL_PROBE_INTERVAL_SECONDS,
+    ):
+        self.loop = loop
+        self.threshold_ms = threshold_ms
+        self.interval_seconds = interval_seconds
+        self._loop_thread_id: int | None = None
+        self._acked = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """Must be called from the loop's own thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._thread = threading.Thread(
+            target=self._run, name="loop-stall-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _probe(self) -> bool:
+        self._acked.clear()
+        try:
+            self.loop.call_soon_threadsafe(self._acked.set)
+        except RuntimeError:
+            return False  # loop closed
+        return True
+
+    def _wait_for_loop(self) -> bool:
+        while not self._acked.wait(1.0):
+            if self._stop.is_set() or self.loop.is_closed():
+                return False
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            posted = time.perf_counter()
+            if not self._probe():
+                return
+            if self._acked.wait(self.threshold_ms / 1000):
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = (
+                traceback.extract_stack(frame)[-STALL_STACK_FRAMES:]
+                if frame is not None
+                else traceback.StackSummary()
+            )
+            del frame
+            if not self._wait_for_loop():
+                return
+            # Stopped (or restarted with a new threshold) while the loop was blocked
+            if self._stop.is_set():
+                return
+            duration_ms = (time.perf_counter() - posted) * 1000
+            try:
+                record_stall(duration_ms, traceback.StackSummary.from_list(stack))
+            except Exception as e:
+                pretty_log(
+                    "error",
+                    f"Failed to record loop stall: {e}",
+                    label="STALL",
+                    include_trace=False,
+                )
+
+
+# -------------------- 🎛️ Runtime Control --------------------
+def start_stall_watchdog(threshold_ms: float | None = None) -> LoopStallWatchdog:
+    """Starts (or restarts with a new threshold) the watchdog for the running loop."""
+    global _watchdog
+    stop_stall_watchdog()
+    _watchdog = LoopStallWatchdog(
+        asyncio.get_running_loop(),
+        threshold_ms=threshold_ms or STALL_THRESHOLD_MS,
+    )
+    _watchdog.start()
+    return _watchdog
+
+
+def stop_stall_watchdog():
+    global _watchdog
+    if _watchdog is not None:
+        _watchdog.stop()
+        _watchdog = None
+
+
+def stall_watchdog_status() -> dict:
+    # to_dict() sorts the samples the watchdog thread appends to
+    with _stats_lock:
+        stalls = stall_histogram.to_dict()
+    return {
+        "running": _watchdog is not None and _watchdog.running,
+        "threshold_ms": _watchdog.threshold_ms if _watchdog else None,
+        "stalls": stalls,
+    }
+
+
+def top_stall_locations(limit: int = 10) -> list[tuple[str, int]]:
+    with _stats_lock:
+        ranked = sorted(
+            stall_location_counts.items(), key=lambda item: item[1], reverse=True
+        )
+    return ranked[:limit]
+
+
+def reset_stall_stats():
+    global stall_histogram
+    with _stats_lock:
+        stall_histogram = LatencyHistogram()
+        stall_location_counts.clear()
+        recent_stalls.clear()
@@ -0,0 +1,136 @@
+import re
+
+import discord
+
+from .rarity_classifier import classify_rarity
+
+# 🟣────────────────────────────────────────────
+#   🧾 Market Listing Parser
+# 🟣────────────────────────────────────────────
+# Compiled once at import; parse_market_listing runs for every market feed embed.
+_AUTHOR_RE = re.compile(r"(.+?)\s+#(\d+)")
+# Custom emojis are matched (and skipped) before digits so emoji IDs never
+# get mistaken for a price.
+_NUMBER_RE = re.compile(r"<a?:\w+:\d+>|(\d[\d,]*)")
+
+EXCLUSIVE_EMBED_COLOR = 0xEA260B
+
+
+def _first_number(value: str | None, default: int) -> int:
+    if not value:
+        return default
+    for match in _NUMBER_RE.finditer(value):
+        number = match.group(1)
+        if number:
+            return int(number.replace(",", ""))
+    return default
+
+
+class MarketListing:
+    """One parsed PokeMeow market feed embed."""
+
+    __slots__ = (
+        "poke_name",
+        "dex",
+        "listed_price",
+        "lowest_market",
+        "amount",
+        "listing_id",
+        "listing_seen",
+        "color",
+        "is_exclusive",
+        "author_name",
+        "author_icon_url",
+        "thumbnail_url",
+        "_rarity",
+    )
+
+    def __init__(
+        self,
+        poke_name: str,
+        dex: int,
+        listed_price: int,
+        lowest_market: int,
+        amount: int,
+        listing_id: str,
+        listing_seen: str | None,
+        color: int,
+        author_name: str,
+        author_icon_url: str | None,
+        thumbnail_url: str | None,
+    ):
+        self.poke_name = poke_name
+        self.dex = dex
+        self.listed_price = listed_price
+        self.lowest_market = lowest_market
+        self.amount = amount
+        self.listing_id = listing_id
+        self.listing_seen = listing_seen  # None when the embed has no "Listing Seen"
+        self.color = color  # 0 when the embed has no color
+        self.is_exclusive = color == EXCLUSIVE_EMBED_COLOR
+        self.author_name = author_name
+        self.author_icon_url = author_icon_url
+        self.thumbnail_url = thumbnail_url
+        self._rarity = None
+
+    @property
+    def rarity(self) -> str:
+        """Classified once per listing; shared by snipe roles and market value."""
+        if self._rarity is None:
+            self._rarity = classify_rarity(
+                self.poke_name, self.author_icon_url, self.color
+            )
+        return self._rarity
+
+    @property
+    def display_name(self) -> str:
+        return self.poke_name.title()
+
+    def __repr__(self) -> str:
+        return (
+            f"MarketListing({self.poke_name!r} #{self.dex}, id={self.listing_id!r}, "
+            f"listed={self.listed_price}, lowest={self.lowest_market}, amount={self.amount})"
+        )
+
+
+def parse_market_listing(embed: discord.Embed) -> MarketListing | None:
+    """
+    Parses a market feed embed in a single pass over its fields.
+    Returns None when the author line isn't a "<name> #<dex>" listing.
+    """
+    author = embed.author
+    author_name = (author.name if author else None) or ""
+    match = _AUTHOR_RE.match(author_name)
+    if not match:
+        return None
+
+    listed_price = lowest_market = None
+    amount = listing_id = listing_seen = None
+    for field in embed.fields:
+        name = field.name
+        if name == "Listed Price":
+            listed_price = field.value
+        elif name == "Lowest Market":
+            lowest_market = field.value
+        elif name == "Amount":
+            amount = field.value
+        elif name == "ID":
+            listing_id = field.value
+        elif name == "Listing Seen":
+            listing_seen = field.value
+
+    color = embed.color
+    thumbnail = embed.thumbnail
+    return MarketListing(
+        poke_name=match.group(1),
+        dex=int(match.group(2)),
+        listed_price=_first_number(listed_price, 0),
+        lowest_market=_first_number(lowest_market, 0),
+        amount=_first_number(amount, 1),
+        listing_id=listing_id if listing_id is not None else "0",
+        listing_seen=listing_seen,
+        color=color.value if color else 0,
+        author_name=author_name,
+        author_icon_url=author.icon_url if author else None,
+        thumbnail_url=thumbnail.url if thumbnail else None,
+    )
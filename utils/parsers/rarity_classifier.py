@@ -0,0 +1,124 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from Constants.paldea_galar_dict import (
+    Legendary_icon_url,
+    icon_url_map,
+    paldean_mons,
+    rarity_by_color,
+)
+
+# 🟣────────────────────────────────────────────
+#   💎 Rarity Classifier
+# 🟣────────────────────────────────────────────
+# One place that turns a Pokémon name (plus embed color / author icon when
+# there is one) into a rarity. Everything here is dict/set lookups or memoized,
+# and nothing logs, since it runs for every market feed embed.
+NAME_FORM_MEMO_SIZE = 4096
+
+_NAME_TOKEN_SPLIT_RE = re.compile(r"[\s\-]+")
+_REGIONAL_PREFIXES = ("alolan", "galarian", "hisuian", "paldean")
+
+PALDEAN_NAMES = frozenset(paldean_mons)
+
+# Snipe roles are keyed by a coarser rarity than market value rarities
+SNIPE_RARITY_ALIASES = {
+    "golden mega": "golden",
+    "shiny mega": "shiny",
+    "shiny gigantamax": "shiny",
+    "gigantamax": "gmax",
+}
+
+
+class NameForms(NamedTuple):
+    shiny: bool
+    golden: bool
+    mega: bool
+    gmax: bool  # gigantamax or eternamax
+    eternamax: bool
+    regional: bool
+
+
+@lru_cache(maxsize=NAME_FORM_MEMO_SIZE)
+def name_forms(name: str) -> NameForms:
+    """
+    Form flags for a Pokémon name. Matches whole words only, so "Yanmega"
+    and "Meganium" are not Megas.
+    """
+    tokens = _NAME_TOKEN_SPLIT_RE.split(name.strip().lower())
+    eternamax = "eternamax" in tokens
+    return NameForms(
+        shiny="shiny" in tokens,
+        golden="golden" in tokens,
+        mega="mega" in tokens,
+        gmax=eternamax or "gigantamax" in tokens,
+        eternamax=eternamax,
+        regional=any(token in _REGIONAL_PREFIXES for token in tokens),
+    )
+
+
+def form_rarity(name: str, golden: bool = True) -> str | None:
+    """
+    Rarity implied by the name alone (golden/shiny/mega/gigantamax forms).
+    Pass golden=False to ignore the "golden" token.
+    """
+    forms = name_forms(name)
+    if golden and forms.golden:
+        return "golden"
+    if forms.shiny:
+        if forms.gmax:
+            return "shiny gigantamax"
+        if forms.mega:
+            return "shiny mega"
+        return "shiny"
+    if forms.gmax:
+        return "gigantamax"
+    if forms.mega:
+        return "mega"
+    return None
+
+
+@lru_cache(maxsize=NAME_FORM_MEMO_SIZE)
+def classify_rarity(name: str, author_icon_url: str | None, color: int) -> str:
+    """
+    Rarity of a market listing: the embed color first, then name forms,
+    then the legendary author icon. Returns "unknown" if nothing matches.
+    Golden listings are only recognised by color, never by the name.
+    """
+    rarity = rarity_by_color.get(color, "unknown")
+    if rarity == "golden":
+        return "golden mega" if name_forms(name).mega else rarity
+    if rarity != "unknown":
+        return rarity
+    rarity = form_rarity(name, golden=False)
+    if rarity:
+        return rarity
+    if author_icon_url == Legendary_icon_url:
+        return "legendary"
+    return "unknown"
+
+
+def snipe_rarity(rarity: str, color: int) -> str:
+    """
+    Maps a market value rarity onto the SNIPE_MAP key for its role. A plain
+    shiny is only pinged when the embed color says so; "Shiny X" recognised
+    by name alone gets no role.
+    """
+    if rarity == "shiny" and rarity_by_color.get(color) != "shiny":
+        return "unknown"
+    return SNIPE_RARITY_ALIASES.get(rarity, rarity)
+
+
+def secondary_snipe_rarity(
+    name: str, display_name: str, author_icon_url: str | None
+) -> str | None:
+    """
+    Extra role to ping for event exclusives: shiny, Paldean, or the base
+    rarity shown by the author icon.
+    """
+    if name_forms(name).shiny:
+        return "shiny"
+    if display_name in PALDEAN_NAMES:
+        return "paldean"
+    return icon_url_map.get(author_icon_url)
@@ -14,6 +14,10 @@ scheduler_manager = SchedulerManager(timezone_str="Asia/Manila")
 # Scheduled Tasks Imports
 # 🍥──────────────────────────────────────────────
 from .monthly_donation_reset import reset_monthly_donation_sched
+from apscheduler.triggers.interval import IntervalTrigger
+
+from utils.cache.snipe_threshold_cache import recompute_snipe_thresholds
+from utils.db.market_price_history_db import compact_market_price_history
 
 
 def format_next_run_manila(next_run_time):
@@ -61,6 +65,44 @@ async def setup_scheduler(bot):
             message=f"Failed to schedule monthly donation reset job: {e}",
             bot=bot,
         )
+    # ✨─────────────────────────────────────────────────────────
+    # 🤍 Daily Market Price History Compaction at 4:00 AM
+    # ✨─────────────────────────────────────────────────────────
+    try:
+        price_history_compaction_job = scheduler_manager.add_cron_job(
+            compact_market_price_history,
+            "market_price_history_compaction",
+            hour=4,
+            minute=0,
+            args=[bot],
+        )
+        readable_next_run = format_next_run_manila(
+            price_history_compaction_job.next_run_time
+        )
+        schedules.append(f"Market price history compaction {readable_next_run}")
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            message=f"Failed to schedule market price history compaction job: {e}",
+            bot=bot,
+        )
+    # ✨─────────────────────────────────────────────────────────
+    # 🤍 Snipe Threshold Recompute Every 5 Minutes
+    # ✨─────────────────────────────────────────────────────────
+    try:
+        snipe_threshold_job = scheduler_manager.add_job(
+            recompute_snipe_thresholds,
+            IntervalTrigger(minutes=5, timezone=scheduler_manager.timezone),
+            id="snipe_threshold_recompute",
+        )
+        readable_next_run = format_next_run_manila(snipe_threshold_job.next_run_time)
+        schedules.append(f"Snipe threshold recompute {readable_next_run}")
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            message=f"Failed to schedule snipe threshold recompute job: {e}",
+            bot=bot,
+        )
     schedule_checklist(schedules)
 
 
@@ -54,10 +54,10 @@ def old_get_pokemon_gif(input_name: str):
     golden = False
     form: Literal["regular", "mega", "gmax"] = "regular"
     region_suffix = ""
-    debug_log(f"Input Pokémon name: {input_name}")
+    debug_log("Input Pokémon name: %s", input_name)
     # Normalize input
     name_parts = input_name.lower().replace("_", "-").split()
-    debug_log(f"Normalized name_parts: {name_parts}")
+    debug_log("Normalized name_parts: %s", name_parts)
     dex_number = None
     if "golden" in name_parts:
         golden = True
@@ -70,7 +70,7 @@ def old_get_pokemon_gif(input_name: str):
         debug_log("Detected 'shiny' in name_parts, setting shiny=True")
 
     remaining_name = "-".join(name_parts)
-    debug_log(f"Remaining name after removing shiny/golden: {remaining_name}")
+    debug_log("Remaining name after removing shiny/golden: %s", remaining_name)
 
     regions = {
         "alolan": "-alola",
@@ -82,7 +82,9 @@ def old_get_pokemon_gif(input_name: str):
         if remaining_name.startswith(region_prefix + "-"):
             region_suffix = suffix
             debug_log(
-                f"Detected region prefix '{region_prefix}', applying suffix '{suffix}' and stripping prefix from remaining_name."
+                "Detected region prefix '%s', applying suffix '%s' and stripping prefix from remaining_name.",
+                region_prefix,
+                suffix,
             )
             remaining_name = remaining_name[len(region_prefix) + 1 :]
             break
@@ -104,12 +106,14 @@ def old_get_pokemon_gif(input_name: str):
     }
     if form == "gmax" and remaining_name in gmax_aliases:
         debug_log(
-            f"Gmax alias detected for '{remaining_name}', replacing with '{gmax_aliases[remaining_name]}'"
+            "Gmax alias detected for '%s', replacing with '%s'",
+            remaining_name,
+            gmax_aliases[remaining_name],
         )
         remaining_name = gmax_aliases[remaining_name]
 
     base_name = f"{remaining_name}{region_suffix}".lower()
-    debug_log(f"Base name for sprites: {base_name}")
+    debug_log("Base name for sprites: %s", base_name)
     # Remove "shiny" and "golden" from the input for comparison
     compare_name = (
         input_name.lower()
@@ -123,7 +127,7 @@ def old_get_pokemon_gif(input_name: str):
         base_name = base_name.replace("-", "")
 
     attr_name = remaining_name.replace("-", "_")
-    debug_log(f"Attribute name for URL lookup: {attr_name}")
+    debug_log("Attribute name for URL lookup: %s", attr_name)
 
     gif_url = None
 
@@ -137,9 +141,9 @@ def old_get_pokemon_gif(input_name: str):
             golden_base_name.split()
         )  # Replace spaces with hyphens
         golden_base_name_attr = golden_base_name.replace("-", "_")
-        debug_log(f"Golden base name for dex lookup: {golden_base_name}")
+        debug_log("Golden base name for dex lookup: %s", golden_base_name)
         dex_number = get_dex_number_by_name(golden_base_name)
-        debug_log(f"Dex number for golden form: {dex_number}")
+        debug_log("Dex number for golden form: %s", dex_number)
         pretty_log(
             tag="debug",
             message=(
@@ -150,23 +154,28 @@ def old_get_pokemon_gif(input_name: str):
             golden_attr_name = f"mega_{attr_name}"
             gif_url = getattr(GOLDEN_MEGA_POKEMON_URL, golden_attr_name, None)
             debug_log(
-                f"Golden mega form: attr_name={golden_attr_name}, gif_url={gif_url}"
+                "Golden mega form: attr_name=%s, gif_url=%s",
+                golden_attr_name,
+                gif_url,
             )
         elif form == "gmax":
             gif_url = getattr(GOLDEN_POKEMON_URL, f"gmax_{attr_name}", None)
             debug_log(
-                f"Golden gmax form: attr_name=gmax_{attr_name}, gif_url={gif_url}"
+                "Golden gmax form: attr_name=gmax_%s, gif_url=%s",
+                attr_name,
+                gif_url,
             )
         else:
             if dex_number:
                 # Try the direct URL first
                 gif_url = f"https://graphics.tppcrpg.net/xy/golden/{dex_number}M.gif"
-                debug_log(f"Golden regular form: direct gif_url={gif_url}")
+                debug_log("Golden regular form: direct gif_url=%s", gif_url)
 
             else:
                 gif_url = getattr(GOLDEN_POKEMON_URL, golden_base_name_attr, None)
                 debug_log(
-                    f"Golden regular form: no dex number, fallback gif_url={gif_url}"
+                    "Golden regular form: no dex number, fallback gif_url=%s",
+                    gif_url,
                 )
 
     # 🔹 Shiny check (priority, same idea as golden)